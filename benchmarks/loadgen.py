@@ -0,0 +1,328 @@
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from argparse import ArgumentParser
+from collections import Counter, defaultdict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.macro import percentile  # noqa: E402
+from sim import SimulatedWorld  # noqa: E402
+from sim.world import DEFAULT_ROOM_IDS, SLED_ROOM_ID, SLED_WADDLES  # noqa: E402
+from houdini.plugins.bot.bot_plugin import BotPlugin  # noqa: E402
+from houdini.plugins.bot.constants import SAFE_MESSAGES  # noqa: E402
+from houdini.plugins.bot.penguin_bot import PenguinBot  # noqa: E402
+
+DEFAULT_RATES = {
+    'join_room': 2.0,
+    'snowball': 2.0,
+    'follow_me': 0.5,
+    'go_away': 0.5,
+    'where': 1.0,
+    'silly': 0.5,
+    'join_waddle': 0.1,
+}
+
+
+class Expectation:
+    __slots__ = ('event', 'commands', 'senders', 'match', 'started')
+
+    def __init__(self, event: str, commands: set[str], senders: set[str] | None, match, started: float) -> None:
+        self.event = event
+        self.commands = commands
+        self.senders = senders
+        self.match = match
+        self.started = started
+
+    def matches(self, command: str, args: list[str]) -> bool:
+        if command not in self.commands or not args:
+            return False
+        if self.senders is not None and args[0] not in self.senders:
+            return False
+        return self.match is None or self.match(args)
+
+
+class ReactionWatcher:
+    def __init__(self, timeout: float) -> None:
+        self.timeout = timeout
+        self.pending: dict[int, list[Expectation]] = defaultdict(list)
+        self.delays: dict[str, list[float]] = defaultdict(list)
+        self.expected = Counter()
+        self.missed = Counter()
+
+    def listen(self, human):
+        human.writer.listeners.append(lambda data: self.on_packet(human.id, data))
+
+    def expect(self, human, event: str, commands: set[str], senders=None, match=None):
+        if senders is not None:
+            if not senders:
+                return
+            senders = {str(x) for x in senders}
+        self.expected[event] += 1
+        self.pending[human.id].append(Expectation(event, commands, senders, match, time.perf_counter()))
+
+    def waiting(self, human) -> bool:
+        return bool(self.pending.get(human.id))
+
+    def on_packet(self, human_id: int, data: bytes):
+        pending = self.pending.get(human_id)
+        if not pending:
+            return
+        fields = data.decode().split('%')
+        command, args = fields[2], fields[4:-1]
+        for expectation in pending:
+            if expectation.matches(command, args):
+                self.delays[expectation.event].append(time.perf_counter() - expectation.started)
+                pending.remove(expectation)
+                return
+
+    def expire(self):
+        deadline = time.perf_counter() - self.timeout
+        for pending in self.pending.values():
+            for expectation in [x for x in pending if x.started < deadline]:
+                self.missed[expectation.event] += 1
+                pending.remove(expectation)
+
+    async def run(self):
+        while True:
+            await asyncio.sleep(1)
+            self.expire()
+
+
+def bots_in_room(plugin: BotPlugin, room) -> list[PenguinBot]:
+    return [x for x in room.penguins_by_id.values() if isinstance(x, PenguinBot)]
+
+
+def busy_rooms(world: SimulatedWorld) -> list[int]:
+    return [x for x in DEFAULT_ROOM_IDS if bots_in_room(world.plugin, world.server.rooms[x])]
+
+
+async def ensure_near_bot(world: SimulatedWorld, human) -> PenguinBot | None:
+    bots = bots_in_room(world.plugin, human.room)
+    if not bots:
+        rooms = busy_rooms(world)
+        if not rooms:
+            return None
+        await world.human_join_room(human, random.choice(rooms))
+        bots = bots_in_room(world.plugin, human.room)
+    bot = random.choice(bots)
+    await world.human_move(human, bot.x, bot.y)
+    return bot
+
+
+def close_bots(world: SimulatedWorld, human) -> list[PenguinBot]:
+    return [x for x in bots_in_room(world.plugin, human.room) if x.is_player_close(human)]
+
+
+async def event_join_room(world, human, watcher) -> float:
+    rooms = [x for x in busy_rooms(world) if x != human.room.id] or DEFAULT_ROOM_IDS
+    room = world.server.rooms[random.choice(rooms)]
+    greetings = {str(x) for x in world.plugin.config.greeting_messages}
+    # Bots only greet into rooms with fewer than four penguins
+    greeters = bots_in_room(world.plugin, room) if len(room.penguins_by_id) < 3 else []
+    watcher.expect(human, 'join_room', {'ss'}, [x.id for x in greeters], lambda args: args[1] in greetings)
+    started = time.perf_counter()
+    await world.human_join_room(human, room.id)
+    return time.perf_counter() - started
+
+
+async def event_snowball(world, human, watcher) -> float:
+    bot = await ensure_near_bot(world, human)
+    if bot is None:
+        return None
+    watcher.expect(human, 'snowball', {'sb', 'se'}, [bot.id])
+    started = time.perf_counter()
+    await world.human_snowball(human, bot.x, bot.y)
+    return time.perf_counter() - started
+
+
+def safe_message_event(event: str, message_id: int, commands: set[str], reply: int | None = None, eligible=None):
+    async def run(world, human, watcher) -> float:
+        if await ensure_near_bot(world, human) is None:
+            return None
+        bots = [x for x in close_bots(world, human) if eligible is None or eligible(x, human)]
+        match = None if reply is None else (lambda args: args[1] == str(reply))
+        watcher.expect(human, event, commands, [x.id for x in bots], match)
+        started = time.perf_counter()
+        await world.human_safe_message(human, message_id)
+        return time.perf_counter() - started
+    return run
+
+
+async def event_join_waddle(world, human, watcher) -> float:
+    waddle_id = random.choice(list(SLED_WADDLES))
+    if human.room.id != SLED_ROOM_ID:
+        await world.human_join_room(human, SLED_ROOM_ID)
+    name = human.safe_name
+    watcher.expect(human, 'join_waddle', {'uw'}, None,
+                   lambda args: args[0] == str(waddle_id) and len(args) > 2 and args[2] != name)
+    started = time.perf_counter()
+    await world.human_join_waddle(human, waddle_id)
+    return time.perf_counter() - started
+
+
+EVENTS = {
+    'join_room': event_join_room,
+    'snowball': event_snowball,
+    'follow_me': safe_message_event(
+        'follow_me', SAFE_MESSAGES.FOLLOW_ME, {'ss'}, SAFE_MESSAGES.OK,
+        lambda bot, human: bot.following_penguin is None),
+    'go_away': safe_message_event(
+        'go_away', SAFE_MESSAGES.GO_AWAY, {'ss'}, SAFE_MESSAGES.SEE_U_LATER,
+        lambda bot, human: bot.following_penguin is not None),
+    'where': safe_message_event('where', SAFE_MESSAGES.WHERE, {'sp'}),
+    'silly': safe_message_event('silly', SAFE_MESSAGES.U_ARE_SILLY, {'upc'}),
+    'join_waddle': event_join_waddle,
+}
+
+
+class LoadGenerator:
+    def __init__(self, world: SimulatedWorld, rates: dict[str, float], timeout: float) -> None:
+        self.world = world
+        self.rates = rates
+        self.watcher = ReactionWatcher(timeout)
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors = Counter()
+        self.dropped = Counter()
+        self.busy = set()
+        self.recording = False
+
+    def idle_humans(self) -> list:
+        return [x for x in self.world.humans if x.id not in self.busy and not self.watcher.waiting(x)]
+
+    async def release_from_waddle(self, human):
+        await human.waddle.remove_penguin(human)
+        human.waddle = None
+        await self.world.human_join_room(human, random.choice(DEFAULT_ROOM_IDS))
+
+    async def dispatch(self, event: str, human):
+        self.busy.add(human.id)
+        try:
+            if human.waddle is not None:
+                await self.release_from_waddle(human)
+            elapsed = await EVENTS[event](self.world, human, self.watcher)
+            if elapsed is not None and self.recording:
+                self.latencies[event].append(elapsed)
+        except Exception:
+            self.errors[event] += 1
+            self.world.server.logger.exception(f'Load generator event {event} failed')
+        finally:
+            self.busy.discard(human.id)
+
+    async def generate(self, event: str, rate: float):
+        while True:
+            await asyncio.sleep(random.expovariate(rate))
+            humans = self.idle_humans()
+            if not humans:
+                self.dropped[event] += 1
+                continue
+            asyncio.create_task(self.dispatch(event, random.choice(humans)))
+
+    def reset(self):
+        self.latencies.clear()
+        self.errors.clear()
+        self.dropped.clear()
+        self.watcher.pending.clear()
+        self.watcher.delays.clear()
+        self.watcher.expected.clear()
+        self.watcher.missed.clear()
+        self.recording = True
+
+    def report(self) -> dict:
+        self.watcher.expire()
+        report = {}
+        for event in self.rates:
+            latencies, delays = self.latencies.get(event, []), self.watcher.delays.get(event, [])
+            report[event] = {
+                'events': len(latencies),
+                'errors': self.errors[event],
+                'dropped': self.dropped[event],
+                'handler_p50_ms': percentile(latencies, 0.5) * 1000,
+                'handler_p95_ms': percentile(latencies, 0.95) * 1000,
+                'handler_p99_ms': percentile(latencies, 0.99) * 1000,
+                'handler_max_ms': max(latencies, default=0) * 1000,
+                'expected_reactions': self.watcher.expected[event],
+                'reactions': len(delays),
+                'missed_reactions': self.watcher.missed[event],
+                'reaction_p50_s': percentile(delays, 0.5),
+                'reaction_p95_s': percentile(delays, 0.95),
+                'reaction_p99_s': percentile(delays, 0.99),
+                'reaction_max_s': max(delays, default=0),
+            }
+        return report
+
+
+async def run(bots: int, humans: int, rates: dict[str, float], duration: float, warmup: float,
+              timeout: float, config: dict) -> dict:
+    BotPlugin.max_bot_population = max(BotPlugin.max_bot_population, bots)
+    world = SimulatedWorld({'bot_population': bots, **config}, bot_accounts=int(bots * 1.2) + 10)
+    await world.start()
+    generator = LoadGenerator(world, rates, timeout)
+    for _ in range(humans):
+        human = await world.add_human(random.choice(DEFAULT_ROOM_IDS))
+        generator.watcher.listen(human)
+
+    tasks = [asyncio.create_task(generator.generate(event, rate)) for event, rate in rates.items() if rate > 0]
+    tasks.append(asyncio.create_task(generator.watcher.run()))
+    await asyncio.sleep(warmup)
+    generator.reset()
+    await asyncio.sleep(duration)
+    for task in tasks:
+        task.cancel()
+    # Reactions to events fired near the end still get their full window
+    await asyncio.sleep(timeout)
+    report = generator.report()
+    await world.stop()
+    return report
+
+
+def parse_rates(values: list[str], parser: ArgumentParser) -> dict[str, float]:
+    rates = dict(DEFAULT_RATES)
+    for value in values:
+        event, _, rate = value.partition('=')
+        if event not in EVENTS or not rate:
+            parser.error(f'invalid rate {value!r}, expected one of {", ".join(EVENTS)} as EVENT=PER_SECOND')
+        rates[event] = float(rate)
+    return rates
+
+
+def main():
+    parser = ArgumentParser(description='Drive scripted humans into the bot plugin and measure reaction latency')
+    parser.add_argument('--bots', type=int, default=100)
+    parser.add_argument('--humans', type=int, default=20)
+    parser.add_argument('--rate', action='append', default=[], metavar='EVENT=PER_SECOND',
+                        help=f'Event rate override, events: {", ".join(EVENTS)}')
+    parser.add_argument('--duration', type=float, default=60, help='Measured seconds')
+    parser.add_argument('--warmup', type=float, default=5, help='Seconds to run before measuring')
+    parser.add_argument('--timeout', type=float, default=20, help='Seconds to wait for a bot reaction')
+    parser.add_argument('--config', help='JSON file with plugin config overrides')
+    parser.add_argument('--output', help='Write the report to this JSON file')
+    args = parser.parse_args()
+
+    rates = parse_rates(args.rate, parser)
+    config = {}
+    if args.config:
+        with open(args.config) as f:
+            config = json.load(f)
+
+    report = asyncio.run(run(args.bots, args.humans, rates, args.duration, args.warmup, args.timeout, config))
+    print(f'{"event":<12} {"events":>6} {"handler p50/p99/max ms":>24} {"reacted":>9} '
+          f'{"reaction p50/p95/p99/max s":>28}')
+    for event, stats in report.items():
+        handler = f"{stats['handler_p50_ms']:.2f}/{stats['handler_p99_ms']:.2f}/{stats['handler_max_ms']:.2f}"
+        reacted = f"{stats['reactions']}/{stats['expected_reactions']}"
+        reaction = (f"{stats['reaction_p50_s']:.3f}/{stats['reaction_p95_s']:.3f}/"
+                    f"{stats['reaction_p99_s']:.3f}/{stats['reaction_max_s']:.3f}")
+        print(f'{event:<12} {stats["events"]:>6} {handler:>24} {reacted:>9} {reaction:>28}')
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'bots': args.bots, 'humans': args.humans, 'rates': rates, 'config': config,
+                       'events': report}, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
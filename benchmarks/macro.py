@@ -0,0 +1,152 @@
+import asyncio
+import json
+import multiprocessing
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sim import SimulatedWorld  # noqa: E402
+from sim.world import DEFAULT_ROOM_IDS  # noqa: E402
+from houdini.plugins.bot.bot_plugin import BotPlugin  # noqa: E402
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    values = sorted(values)
+    return values[min(int(len(values) * fraction), len(values) - 1)] if values else 0.0
+
+
+def rss_bytes() -> int:
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+async def probe_loop_lag(samples: list[float], interval: float = 0.01):
+    loop = asyncio.get_running_loop()
+    while True:
+        started = loop.time()
+        await asyncio.sleep(interval)
+        samples.append(max(loop.time() - started - interval, 0) * 1000)
+
+
+async def run_point(bots: int, humans: int, duration: float, warmup: float, config: dict) -> dict:
+    BotPlugin.max_bot_population = max(BotPlugin.max_bot_population, bots)
+    world = SimulatedWorld({'bot_population': bots, **config}, bot_accounts=int(bots * 1.2) + 10)
+    rss_before = rss_bytes()
+    plugin = await world.start()
+    for i in range(humans):
+        await world.add_human(random.choice(DEFAULT_ROOM_IDS))
+    await asyncio.sleep(warmup)
+
+    lag_samples = []
+    lag_probe = asyncio.create_task(probe_loop_lag(lag_samples))
+    actions_before = sum(plugin.metrics.actions.values.values())
+    traffic_before = world.human_traffic()
+    cpu_before, started = time.process_time(), time.perf_counter()
+    await asyncio.sleep(duration)
+    elapsed = time.perf_counter() - started
+    cpu = time.process_time() - cpu_before
+    lag_probe.cancel()
+
+    traffic = world.human_traffic()
+    actions = sum(plugin.metrics.actions.values.values()) - actions_before
+    result = {
+        'bots': len(plugin.bots),
+        'humans': humans,
+        'duration': elapsed,
+        'bot_actions_per_second': actions / elapsed,
+        'packets_per_human_per_second': (traffic.packets - traffic_before.packets) / max(humans, 1) / elapsed,
+        'bytes_per_human_per_second': (traffic.bytes - traffic_before.bytes) / max(humans, 1) / elapsed,
+        'loop_lag_p50_ms': percentile(lag_samples, 0.5),
+        'loop_lag_p99_ms': percentile(lag_samples, 0.99),
+        'cpu_utilization': cpu / elapsed,
+        'rss_per_bot_bytes': (rss_bytes() - rss_before) / max(len(plugin.bots), 1),
+    }
+    result['bots_per_core'] = len(plugin.bots) / result['cpu_utilization'] if result['cpu_utilization'] else None
+    await world.stop()
+    return result
+
+
+def run_point_process(bots: int, humans: int, duration: float, warmup: float, config: dict) -> dict:
+    return asyncio.run(run_point(bots, humans, duration, warmup, config))
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(['git', 'describe', '--always', '--dirty'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def compare(current: dict, baseline: dict):
+    previous = {(x['bots'], x['humans']): x for x in baseline['points']}
+    for point in current['points']:
+        old = previous.get((point['bots'], point['humans']))
+        if old is None:
+            continue
+        changes = []
+        for key in ('bot_actions_per_second', 'bytes_per_human_per_second', 'loop_lag_p99_ms', 'rss_per_bot_bytes'):
+            if old[key]:
+                changes.append(f'{key} {(point[key] - old[key]) / old[key]:+.1%}')
+        print(f"bots={point['bots']} humans={point['humans']}: " + ', '.join(changes))
+
+
+def main():
+    parser = ArgumentParser(description='Macro benchmark of the bot plugin against a simulated world')
+    parser.add_argument('--bots', type=int, nargs='+', default=[50, 100, 200, 400])
+    parser.add_argument('--humans', type=int, nargs='+', default=[0, 20])
+    parser.add_argument('--duration', type=float, default=60, help='Measured seconds per point')
+    parser.add_argument('--warmup', type=float, default=10, help='Seconds to run before measuring')
+    parser.add_argument('--config', help='JSON file with plugin config overrides')
+    parser.add_argument('--output', default='bench_macro.json')
+    parser.add_argument('--compare', help='Previous result file to compare against')
+    args = parser.parse_args()
+
+    config = {}
+    if args.config:
+        with open(args.config) as f:
+            config = json.load(f)
+
+    points = []
+    context = multiprocessing.get_context('spawn')
+    for bots in args.bots:
+        for humans in args.humans:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                point = executor.submit(run_point_process, bots, humans, args.duration, args.warmup, config).result()
+            points.append(point)
+            print(f"bots={point['bots']:<5} humans={humans:<4} actions/s={point['bot_actions_per_second']:<8.1f} "
+                  f"bytes/human/s={point['bytes_per_human_per_second']:<8.0f} "
+                  f"lag p50={point['loop_lag_p50_ms']:.2f}ms p99={point['loop_lag_p99_ms']:.2f}ms "
+                  f"cpu={point['cpu_utilization']:.1%} rss/bot={point['rss_per_bot_bytes'] / 1024:.1f}KiB")
+
+    result = {
+        'benchmark': 'macro',
+        'plugin_version': BotPlugin.version,
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'timestamp': time.time(),
+        'config': config,
+        'points': points,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(result, f, indent=2)
+    print(f'Results written to {args.output}')
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(result, json.load(f))
+
+
+if __name__ == '__main__':
+    main()
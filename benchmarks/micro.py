@@ -0,0 +1,178 @@
+import asyncio
+import json
+import os
+import sys
+import time
+from argparse import ArgumentParser
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sim import SimulatedWorld  # noqa: E402
+from houdini.plugins.bot.bot_plugin import BotPlugin  # noqa: E402
+from houdini.plugins.bot.constants import ROOM_AREAS, ROOM_SPOTS, SAFE_MESSAGES  # noqa: E402
+from houdini.plugins.bot.penguin_bot import PenguinBotRoomSpots  # noqa: E402
+
+EMPTY_ROOM_ID = 999
+
+
+def measure(func, number: int, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - started) / number)
+    return best
+
+
+async def measure_async(func, number: int, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            await func()
+        best = min(best, (time.perf_counter() - started) / number)
+    return best
+
+
+async def start_world(bots: int, humans_room: int | None = None) -> tuple[SimulatedWorld, object]:
+    BotPlugin.max_bot_population = max(BotPlugin.max_bot_population, bots)
+    world = SimulatedWorld({'bot_population': bots, 'bot_rotation': False, 'bot_igloo_rotation': False},
+                           bot_accounts=bots + 10)
+    await world.start()
+    await world.stop()
+    human = await world.add_human(humans_room or EMPTY_ROOM_ID)
+    return world, human
+
+
+async def bench_random_position(number: int, repeat: int) -> dict[str, float]:
+    world, _ = await start_world(1)
+    bot = world.plugin.bots[0]
+    return {f'random_position_in_room[{room_id}]': measure(lambda: bot.random_position_in_room(points), number, repeat)
+            for room_id, points in sorted(ROOM_AREAS.items())}
+
+
+async def bench_move_to_random_room(number: int, repeat: int) -> dict[str, float]:
+    world, _ = await start_world(110)
+    plugin = world.plugin
+    results = {}
+    for open_igloos in (0, 20, 100):
+        world.server.open_igloos_by_penguin_id.clear()
+        for bot in plugin.bots[1:open_igloos + 1]:
+            bot.open_igloo()
+        bot = plugin.bots[0]
+        results[f'move_to_random_room[{open_igloos} igloos]'] = await measure_async(
+            bot.move_to_random_room, number, repeat)
+    return results
+
+
+async def bench_room_spots(number: int, repeat: int) -> dict[str, float]:
+    world, _ = await start_world(1)
+    bot = world.plugin.bots[0]
+
+    def allocate():
+        with PenguinBotRoomSpots(ROOM_SPOTS[410], bot):
+            pass
+    return {'RoomSpotsController allocation': measure(allocate, number, repeat)}
+
+
+async def bench_safe_message(number: int, repeat: int) -> dict[str, float]:
+    world, human = await start_world(1)
+    bot = world.plugin.bots[0]
+    await bot.join_room(human.room)
+
+    async def dispatch(message_id: int):
+        bot.x, bot.y = human.x, human.y
+        await bot.handle_safe_message(human, message_id)
+
+    return {
+        'handle_safe_message[no reaction]': await measure_async(
+            lambda: dispatch(SAFE_MESSAGES.HI_THERE), number, repeat),
+        'handle_safe_message[WHERE]': await measure_async(
+            lambda: dispatch(SAFE_MESSAGES.WHERE), number, repeat),
+    }
+
+
+async def bench_sync_clothes(number: int, repeat: int) -> dict[str, float]:
+    world, human = await start_world(1)
+    for _ in range(9):
+        await world.add_human(EMPTY_ROOM_ID)
+    bot = world.plugin.bots[0]
+    await bot.join_room(human.room)
+    return {'sync_clothes[10 humans]': await measure_async(bot.sync_clothes, number, repeat)}
+
+
+async def bench_fan_out(number: int, repeat: int) -> dict[str, float]:
+    results = {}
+    for bots in (200, 2000):
+        world, human = await start_world(bots)
+        plugin = world.plugin
+        room = human.room
+        results[f'handle_join_room fan-out[{bots} bots]'] = await measure_async(
+            lambda: plugin.handle_join_room(human, room), max(number // bots, 5), repeat)
+        results[f'handle_snowball fan-out[{bots} bots]'] = await measure_async(
+            lambda: plugin.handle_snowball(human, 0, 0), max(number // bots, 5), repeat)
+        results[f'handle_safe_message fan-out[{bots} bots]'] = await measure_async(
+            lambda: plugin.handle_safe_message(human, SAFE_MESSAGES.WHERE), max(number // bots, 5), repeat)
+    return results
+
+
+BENCHMARKS = {
+    'random_position': bench_random_position,
+    'move_to_random_room': bench_move_to_random_room,
+    'room_spots': bench_room_spots,
+    'safe_message': bench_safe_message,
+    'sync_clothes': bench_sync_clothes,
+    'fan_out': bench_fan_out,
+}
+
+
+async def run(selected: list[str], number: int, repeat: int) -> dict[str, float]:
+    results = {}
+    for name in selected:
+        results.update(await BENCHMARKS[name](number, repeat))
+    return results
+
+
+def check(results: dict[str, float], baseline: dict[str, float], threshold: float) -> list[str]:
+    regressions = []
+    for name, value in results.items():
+        previous = baseline.get(name)
+        if previous and value > previous * (1 + threshold):
+            regressions.append(f'{name}: {previous * 1e6:.2f}us -> {value * 1e6:.2f}us ({value / previous - 1:+.1%})')
+    return regressions
+
+
+def main():
+    parser = ArgumentParser(description='Microbenchmarks of the bot plugin hot paths')
+    parser.add_argument('benchmarks', nargs='*', help=f'Benchmarks to run: {", ".join(BENCHMARKS)}')
+    parser.add_argument('--number', type=int, default=2000, help='Calls per repetition')
+    parser.add_argument('--repeat', type=int, default=5, help='Repetitions, the fastest one is kept')
+    parser.add_argument('--save', help='Write results to this JSON file')
+    parser.add_argument('--check', help='Baseline JSON file to check for regressions')
+    parser.add_argument('--threshold', type=float, default=0.2, help='Allowed slowdown over the baseline')
+    args = parser.parse_args()
+    unknown = set(args.benchmarks) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f'unknown benchmarks: {", ".join(sorted(unknown))}')
+
+    results = asyncio.run(run(args.benchmarks or list(BENCHMARKS), args.number, args.repeat))
+    for name, value in results.items():
+        print(f'{name:<55} {value * 1e6:>10.2f}us')
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.check:
+        with open(args.check) as f:
+            regressions = check(results, json.load(f), args.threshold)
+        if regressions:
+            print(f'Regressions over {args.threshold:.0%}:')
+            print('\n'.join(f'  {x}' for x in regressions))
+            sys.exit(1)
+        print('No regressions')
+
+
+if __name__ == '__main__':
+    main()
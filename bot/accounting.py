@@ -0,0 +1,99 @@
+import functools
+import random
+import time
+from types import coroutine
+
+
+@coroutine
+def _timed_steps(accounting: 'BehaviorAccounting', coro, stats: list[float] | None):
+    value, error = None, None
+    while True:
+        # Time spent in behaviors measured inside this step is charged to them, not to this one
+        outer, accounting.nested = accounting.nested, [0.0, 0.0]
+        accounting.depth += 1
+        wall_started, cpu_started = time.perf_counter(), time.thread_time()
+        try:
+            if error is None:
+                yielded = coro.send(value)
+            else:
+                yielded = coro.throw(error)
+        except StopIteration as stop:
+            return stop.value
+        finally:
+            wall, cpu = time.perf_counter() - wall_started, time.thread_time() - cpu_started
+            accounting.depth -= 1
+            if stats is not None:
+                stats[2] += wall - accounting.nested[0]
+                stats[3] += cpu - accounting.nested[1]
+            outer[0] += wall
+            outer[1] += cpu
+            accounting.nested = outer
+        try:
+            value, error = (yield yielded), None
+        except BaseException as e:
+            value, error = None, e
+
+
+class BehaviorAccounting:
+    def __init__(self, sample_rate: float = 1.0, rng=random) -> None:
+        self.sample_rate = sample_rate
+        self.random = rng
+        self.started = time.time()
+        # (behavior, room) -> [calls, sampled calls, active wall seconds, cpu seconds]
+        self.stats: dict[tuple[str, int | None], list[float]] = {}
+        self.nested = [0.0, 0.0]
+        # Number of measured steps running, nested calls start while it is above zero
+        self.depth = 0
+
+    def _entry(self, behavior: str, room_id: int | None) -> list[float]:
+        stats = self.stats.get((behavior, room_id))
+        if stats is None:
+            stats = self.stats[(behavior, room_id)] = [0, 0, 0.0, 0.0]
+        return stats
+
+    async def measure(self, behavior: str, room_id: int | None, coro):
+        stats = self._entry(behavior, room_id)
+        stats[0] += 1
+        if self.sample_rate < 1 and self.random.random() >= self.sample_rate:
+            if not self.depth:
+                return await coro
+            # Unsampled calls inside a measured behavior are still timed, only to take them out of its time
+            return await _timed_steps(self, coro, None)
+        stats[1] += 1
+        return await _timed_steps(self, coro, stats)
+
+    def totals(self, by_room: bool = False) -> dict:
+        totals = {}
+        for (behavior, room_id), (calls, sampled, wall, cpu) in self.stats.items():
+            key = (behavior, room_id) if by_room else behavior
+            entry = totals.setdefault(key, [0, 0, 0.0, 0.0])
+            scale = calls / sampled if sampled else 0
+            entry[0] += calls
+            entry[1] += sampled
+            entry[2] += wall * scale
+            entry[3] += cpu * scale
+        return totals
+
+    def top(self, size: int = 20, by_room: bool = False) -> list[tuple]:
+        return sorted(self.totals(by_room).items(), key=lambda x: x[1][3], reverse=True)[:size]
+
+    def report(self, size: int = 20, by_room: bool = False) -> str:
+        elapsed = time.time() - self.started
+        lines = [f'Bot behavior CPU accounting over {elapsed:.0f}s (sample rate {self.sample_rate}):']
+        for key, (calls, _, wall, cpu) in self.top(size, by_room):
+            name = f'{key[0]}@{key[1]}' if by_room else key
+            lines.append(f'  {name:<40} calls={calls:<8} cpu={cpu:.3f}s wall={wall:.3f}s '
+                         f'cpu/call={cpu / calls * 1e6 if calls else 0:.1f}us')
+        return '\n'.join(lines)
+
+
+def accounted(behavior: str):
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            accounting = self.bot_plugin.accounting
+            if accounting is None:
+                return func(self, *args, **kwargs)
+            return accounting.measure(behavior, self.room.id if self.room else None, func(self, *args, **kwargs))
+        return wrapper
+    return decorator
@@ -0,0 +1,56 @@
+class BotAvailability:
+    def __init__(self) -> None:
+        # Idle bots in a list with their positions, so picking and removing one are both O(1)
+        self.idle: list = []
+        self.positions: dict[int, int] = {}
+        self.busy: dict[int, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.idle)
+
+    def __contains__(self, bot) -> bool:
+        return bot.id in self.positions
+
+    def add(self, bot):
+        self.busy[bot.id] = set()
+        self._push(bot)
+
+    def remove(self, bot):
+        self.busy.pop(bot.id, None)
+        self._pop(bot.id)
+
+    def set_busy(self, bot, reason: str, busy: bool = True):
+        reasons = self.busy.get(bot.id)
+        if reasons is None:
+            return
+        if busy:
+            reasons.add(reason)
+            self._pop(bot.id)
+        else:
+            reasons.discard(reason)
+            if not reasons:
+                self._push(bot)
+
+    def reserve(self, count: int, rng, reason: str) -> list | None:
+        if count > len(self.idle):
+            return None
+        reserved = []
+        for _ in range(count):
+            bot = self.idle[rng.randrange(len(self.idle))]
+            self.set_busy(bot, reason)
+            reserved.append(bot)
+        return reserved
+
+    def _push(self, bot):
+        if bot.id not in self.positions:
+            self.positions[bot.id] = len(self.idle)
+            self.idle.append(bot)
+
+    def _pop(self, bot_id: int):
+        index = self.positions.pop(bot_id, None)
+        if index is None:
+            return
+        last = self.idle.pop()
+        if index < len(self.idle):
+            self.idle[index] = last
+            self.positions[last.id] = index
@@ -0,0 +1,55 @@
+from collections import Counter
+
+
+class CosmeticBackpressure:
+    def __init__(self, max_buffer_bytes: int) -> None:
+        self.max_buffer_bytes = max_buffer_bytes
+        # recipient id -> (bot id, command) -> latest packet held back
+        self.pending: dict[int, dict[tuple[int, str], tuple]] = {}
+        self.outcomes = Counter()
+
+    def congested(self, transport) -> bool:
+        return transport.is_closing() or transport.get_write_buffer_size() > self.max_buffer_bytes
+
+    async def send(self, bot, data: tuple):
+        key = (bot.id, data[0])
+        drained = []
+
+        def accept(p) -> bool:
+            # Bots have no transport and ignore room packets anyway
+            transport = getattr(p.writer, 'transport', None)
+            if transport is None:
+                return False
+            if self.congested(transport):
+                self.pending.setdefault(p.id, {})[key] = data
+                self.outcomes['deferred'] += 1
+                return False
+            pending = self.pending.get(p.id)
+            if pending:
+                pending.pop(key, None)
+                drained.append(p)
+            return True
+
+        await bot.room.send_xt(*data, f=accept)
+        for p in drained:
+            await self.flush(p)
+
+    async def flush(self, p):
+        pending = self.pending.pop(p.id, None)
+        if not pending:
+            return
+        for (bot_id, _), data in pending.items():
+            bot = p.server.penguins_by_id.get(bot_id)
+            if bot is not None and p.room is not None and bot.room is p.room:
+                await p.send_xt(*data)
+                self.outcomes['flushed'] += 1
+            else:
+                self.outcomes['stale'] += 1
+
+    async def flush_drained(self, server):
+        for penguin_id in list(self.pending):
+            p = server.penguins_by_id.get(penguin_id)
+            if p is None:
+                self.outcomes['stale'] += len(self.pending.pop(penguin_id))
+            elif not self.congested(p.writer.transport):
+                await self.flush(p)
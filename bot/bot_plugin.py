@@ -1,14 +1,15 @@
 import asyncio
-import json
 import os
 import random
 import secrets
+import signal
+import time
 import urllib.parse
-from collections import defaultdict
+from collections import Counter, defaultdict
 
 import bcrypt
 
-from houdini import handlers
+from houdini import commands, handlers
 from houdini.data.item import PenguinItem
 from houdini.data.penguin import Penguin
 from houdini.data.plugin import PenguinAttribute
@@ -17,8 +18,24 @@ from houdini.crypto import Crypto
 from houdini.handlers import XTPacket
 from houdini.houdini import Houdini
 from houdini.plugins import IPlugin
+from houdini.plugins.bot.accounting import BehaviorAccounting
+from houdini.plugins.bot.availability import BotAvailability
 from houdini.plugins.bot.penguin_bot import PenguinBot
+from houdini.plugins.bot.backpressure import CosmeticBackpressure
+from houdini.plugins.bot.chat import ChatScheduler
+from houdini.plugins.bot.config import BotConfig, config_mtime
 from houdini.plugins.bot.constants import ITEM_TYPE
+from houdini.plugins.bot.control import ControlChannel, ControlError, parse_command
+from houdini.plugins.bot.db_gate import BotDatabaseGate
+from houdini.plugins.bot.games import RaceTicker
+from houdini.plugins.bot.leases import BotLeaseRegistry
+from houdini.plugins.bot.cluster import ClusterCoordinator
+from houdini.plugins.bot.lag_monitor import LagMonitor
+from houdini.plugins.bot.metrics import BotMetrics
+from houdini.plugins.bot.sampler import SamplingProfiler
+from houdini.plugins.bot.snapshot import WorldSnapshot, capture, read_snapshot, write_snapshot
+from houdini.plugins.bot.tasks import TaskRegistry
+from houdini.plugins.bot.tracer import ACTION_CODES, ActionTracer
 
 
 class BotPlugin(IPlugin):
@@ -27,14 +44,37 @@ class BotPlugin(IPlugin):
     version = "1.0.0"
     
     config_file = os.path.join(os.path.dirname(__file__), 'config.json')
-    default_room_ids = [
-        100, 110, 111, 120, 121, 130, 300, 310, 320, 330, 340, 200, 220,
-        230, 801, 802, 800, 400, 410, 411, 809, 805, 810, 806, 808, 807
+    default_db_pool_size = 10
+    default_db_pool_fraction = 0.25
+    default_bot_lease_ttl = 30
+    default_cluster_max_step = 10
+    default_config_reload_interval = 5
+    default_snapshot_interval = 30
+    default_snapshot_max_age = 300
+    default_control_channel = 'houdini.bot.control'
+    default_bot_scaling_step = 1
+    backpressure_flush_interval = 1
+    igloo_stagger_seconds = 120
+    cluster_balance_interval = 30
+    adaptive_population_interval = 10
+    bot_scaling_interval = 2
+    profiler_poll_interval = 5
+    default_degradation_levels = [
+        'enable_random_frame', 'enable_random_movement', 'enable_room_spots', 'bot_rotation'
     ]
-    default_waddle_ids = [100, 101, 102, 103]
-    default_waddle_join_delay = 10
-    default_bot_open_igloos = 15
-    default_bot_throwing_igloo_party = 5
+    default_lag_thresholds_ms = [50, 100, 200, 400]
+    # Behaviors checked on every use, so pausing them takes effect right away
+    pausable_behaviors = frozenset((
+        'enable_random_frame', 'enable_random_movement', 'enable_room_spots', 'enable_random_room_movement',
+        'bot_rotation', 'bot_igloo_rotation'
+    ))
+    # Read once when the plugin starts; reloads keep the values the plugin started with
+    startup_keys = frozenset((
+        'random_seed', 'bot_db_pool_fraction', 'profiler', 'action_trace', 'behavior_accounting',
+        'cosmetic_backpressure', 'bot_leases', 'bot_lease_ttl', 'bot_penguin_ids', 'startup_ramp_seconds',
+        'cluster_bot_budget', 'bot_world_capacity', 'cluster_max_step', 'adaptive_population', 'lag_monitor',
+        'config_reload_interval', 'bot_snapshot', 'bot_control', 'metrics_host', 'metrics_port'
+    ))
     max_bot_population = 200
     bot_rotation_range = range(60, 180)
     bot_igloo_rotation_range = range(1200, 2400)
@@ -42,28 +82,118 @@ class BotPlugin(IPlugin):
     def __init__(self, server: Houdini):
         self.server = server
         self.bots = []
+        self.availability = BotAvailability()
+        # waddle id -> (bot, penguin it was reserved for) until the bot takes its seat or gives up
+        self.waddle_reservations: dict[int, list[tuple]] = {}
         
         self.items_by_type = defaultdict(list)
         for x in self.server.items:
             item = self.server.items[x]
             self.items_by_type[item.type].append(item)
 
-        with open(self.config_file) as f:
-            self.plugin_config: dict = json.load(f)
+        self.config_mtime = config_mtime(self.config_file)
+        self.config = BotConfig.load(self.config_file)
+        self.plugin_config: dict = self.config.raw
+
+        self.random_seed = self.plugin_config.get('random_seed')
+        self.random = random if self.random_seed is None else random.Random(f'{self.random_seed}:plugin')
+
+        self.db_gate = BotDatabaseGate(
+            self.database_pool_size(), self.plugin_config.get('bot_db_pool_fraction', self.default_db_pool_fraction))
+        self.metrics = BotMetrics()
+        self.metrics.register(self.db_gate.wait_histogram)
+        self.metrics.bots_online.collect = self.count_bots_by_room
+        self.metrics.gauge('houdini_bot_idle', 'Bots free to be reserved for a waddle game',
+                           collect=lambda: {(): len(self.availability)})
+        self.metrics_server = None
+
+        self.tasks = TaskRegistry(self.server.logger, on_restart=self.metrics.task_restarts.inc)
+        self.metrics.gauge('houdini_bot_tasks', 'Live plugin tasks', ('kind',),
+                           collect=lambda: {(k,): v for k, v in self.tasks.counts().items()})
+        self.metrics.gauge('houdini_bot_task_oldest_age_seconds', 'Age of the oldest live task', ('kind',),
+                           collect=lambda: {(k,): v for k, v in self.tasks.oldest_ages().items()})
+
+        profiler_config = self.plugin_config.get('profiler') or {}
+        self.profiler = SamplingProfiler(profiler_config.get('interval_ms', 5), profiler_config.get('output_dir'))
+        self.profiler_owner = None
+
+        self.tracer = None
+        if self.plugin_config.get('action_trace'):
+            trace_config = self.plugin_config['action_trace']
+            self.tracer = ActionTracer(
+                trace_config.get('file', os.path.join(os.path.dirname(__file__), 'bot_actions.trace')),
+                trace_config.get('capacity', 1_000_000), trace_config.get('keep', 3))
+
+        self.accounting = None
+        if self.plugin_config.get('behavior_accounting'):
+            self.accounting = BehaviorAccounting(self.plugin_config['behavior_accounting'].get('sample_rate', 0.1),
+                                                 self.bot_random('accounting'))
+            self.metrics.counter('houdini_bot_behavior_calls_total', 'Bot behavior calls', ('behavior',),
+                                 collect=lambda: self.collect_accounting(0))
+            self.metrics.counter('houdini_bot_behavior_wall_seconds_total', 'Estimated active wall time per behavior',
+                                 ('behavior',), collect=lambda: self.collect_accounting(2))
+            self.metrics.counter('houdini_bot_behavior_cpu_seconds_total', 'Estimated CPU time per behavior',
+                                 ('behavior',), collect=lambda: self.collect_accounting(3))
+        self.leases = None
+        self.cluster = None
+        self.population_targets: dict[str, int] = {}
+        self.disabled_behaviors: set[str] = set()
+        self.paused_behaviors: set[str] = set()
+        self.drained_rooms: set[int] = set()
+        self.enabled_behaviors = self.config.enabled_flags
+        self.lag_monitor = None
+        self.degradation_transitions = None
+        self.ramp_task = None
+        self.rotation_deadlines: dict[str, float] = {}
+        self.restored_rotation: dict[str, float] = {}
+        self.resumed_igloos = None
+        self.igloo_rotation_task = None
+        self.backpressure = None
+        if self.plugin_config.get('cosmetic_backpressure'):
+            self.backpressure = CosmeticBackpressure(
+                self.plugin_config['cosmetic_backpressure'].get('max_buffer_bytes', 65536))
+            self.metrics.counter('houdini_bot_cosmetic_packets_total', 'Cosmetic bot packets held back per recipient',
+                                 ('outcome',), collect=lambda: {(k,): v for k, v in self.backpressure.outcomes.items()})
+        self.race_ticker = RaceTicker(self.tasks)
+        self.metrics.counter('houdini_bot_sled_moves_total', 'Sled race moves sent on time or merged into a later one',
+                             ('outcome',), collect=lambda: {(k,): v for k, v in self.race_ticker.outcomes.items()})
+        self.chat = None
+        self.chat_dropped = Counter()
+        self.configure_chat()
+        self.metrics.counter('houdini_bot_chat_dropped_total', 'Bot chat messages dropped by the room budget',
+                             ('reason',), collect=lambda: {(k,): v for k, v in self.chat_dropped.items()})
             
+    def database_pool_size(self) -> int:
+        # The server's gino engine wraps an asyncpg pool
+        pool = getattr(getattr(self.server.db, 'bind', None), 'raw_pool', None)
+        return pool.get_max_size() if pool is not None else self.default_db_pool_size
+
     async def ready(self):
         # quick debugging
         # import logging; self.server.logger.setLevel(logging.DEBUG)
         if self.server.config.type != 'world':
             return
         self.server.logger.info("Bot plugin loaded")
-        bot_population = self.plugin_config.get('bot_population')
-        existing_bot_ids = await PenguinAttribute.select('penguin_id').where(PenguinAttribute.name == "bot").gino.all()
-        existing_bot_ids = [x[0] for x in existing_bot_ids]
-        self.existing_penguin_bots = await Penguin.query.where(Penguin.id.in_(existing_bot_ids)).gino.all()
-        set_bot_ids = self.plugin_config.get('bot_penguin_ids', [])
-        penguin_bots = await Penguin.query.where(Penguin.id.in_(set_bot_ids)).gino.all()
-        penguin_bots += random.sample(self.existing_penguin_bots, min(bot_population, len(self.existing_penguin_bots)))
+        if self.plugin_config.get('bot_leases', True):
+            self.leases = BotLeaseRegistry(self.server.redis, self.server.config.id,
+                                           self.plugin_config.get('bot_lease_ttl', self.default_bot_lease_ttl))
+            self.create_supervised_task(self.bot_lease_heartbeat)
+        bot_population = self.config.bot_population
+        async with self.db_gate.acquire():
+            existing_bot_ids = await PenguinAttribute.select('penguin_id').where(PenguinAttribute.name == "bot").gino.all()
+            existing_bot_ids = [x[0] for x in existing_bot_ids]
+            self.existing_penguin_bots = await Penguin.query.where(Penguin.id.in_(existing_bot_ids)).gino.all()
+            set_bot_ids = self.plugin_config.get('bot_penguin_ids', [])
+            penguin_bots = await Penguin.query.where(Penguin.id.in_(set_bot_ids)).gino.all()
+        penguin_bots = await self.claim_penguin_bots(penguin_bots, len(penguin_bots))
+        snapshot = self.load_snapshot()
+        restored_states = {x.penguin_id: x for x in snapshot.bots} if snapshot else {}
+        restored = await self.claim_penguin_bots(
+            [x for x in self.existing_penguin_bots if x.id in restored_states], bot_population)
+        restored_ids = {x.id for x in restored}
+        candidates = [x for x in self.existing_penguin_bots if x.id not in restored_ids]
+        penguin_bots += restored + await self.claim_penguin_bots(
+            self.random.sample(candidates, len(candidates)), bot_population - len(restored))
         
         if bot_population and bot_population > self.max_bot_population:
             self.server.logger.warn(f'Bot population was set too large, defaulting to max value of {self.max_bot_population}')
@@ -74,45 +204,96 @@ class BotPlugin(IPlugin):
             penguins = await self.create_penguin_bots(2 * bot_population - len(set_bot_ids))
             penguins = [x for x in penguins if x]
             self.server.logger.info(f'{len(penguins)} bot accounts created')
-            penguin_bots += random.sample(penguins, min(bot_population - len(penguin_bots), len(penguins)))
+            penguin_bots += await self.claim_penguin_bots(penguins, bot_population - len(penguin_bots))
             self.existing_penguin_bots += penguins
         
-        self.bots = [PenguinBot(x.id, self).load_data(x) for x in penguin_bots]
-        for bot in self.bots:
-            await bot.init()
-            bot.begin_activity()
-        await self.server.redis.hset('houdini.population', self.server.config.id, len(self.server.penguins_by_id))
+        penguin_bots = [PenguinBot(x.id, self).load_data(x) for x in penguin_bots]
+        if restored_ids:
+            await self.restore_bots([x for x in penguin_bots if x.id in restored_ids], snapshot)
+            penguin_bots = [x for x in penguin_bots if x.id not in restored_ids]
+        ramp_seconds = self.plugin_config.get('startup_ramp_seconds', 0)
+        if ramp_seconds and penguin_bots:
+            self.ramp_task = self.tasks.spawn(self.ramp_up_bots, penguin_bots, ramp_seconds)
+        else:
+            for bot in penguin_bots:
+                await self.bring_online(bot)
+            self.db_gate.begin_steady_state()
+        self.population_targets['config'] = bot_population or 0
+        await self.update_population()
         self.server.logger.info(f'Server {self.server.config.id} population: {len(self.server.penguins_by_id)}')
         
-        if self.plugin_config.get('bot_rotation', True):
-            self.create_supervised_task(self.bot_rotation)
-            
-        if self.plugin_config.get('bot_igloo_rotation', True):
-            self.create_supervised_task(self.bot_igloo_rotation)
+        self.create_supervised_task(self.bot_rotation)
+        self.igloo_rotation_task = self.create_supervised_task(self.bot_igloo_rotation)
+
+        if self.plugin_config.get('cluster_bot_budget') is not None:
+            self.cluster = ClusterCoordinator(
+                self.server.redis, self.server.config.id, self.plugin_config['cluster_bot_budget'],
+                min(self.plugin_config.get('bot_world_capacity', self.max_bot_population), self.max_bot_population),
+                self.plugin_config.get('cluster_max_step', self.default_cluster_max_step),
+                3 * self.cluster_balance_interval)
+            self.create_supervised_task(self.bot_cluster_balance)
+
+        if self.plugin_config.get('adaptive_population'):
+            self.create_supervised_task(self.bot_adaptive_population)
+
+        if self.plugin_config.get('lag_monitor'):
+            lag_config = self.plugin_config['lag_monitor']
+            self.lag_monitor = LagMonitor(
+                lag_config.get('interval_ms', 100),
+                lag_config.get('thresholds_ms', self.default_lag_thresholds_ms),
+                lag_config.get('recovery_ratio', 0.5),
+                on_change=self.on_degradation_level_change)
+            self.metrics.gauge('houdini_bot_degradation_level', 'Current bot degradation level',
+                               collect=lambda: {(): self.lag_monitor.level})
+            self.metrics.gauge('houdini_bot_event_loop_lag_ms', 'Smoothed event loop lag in milliseconds',
+                               collect=lambda: {(): self.lag_monitor.lag_ms})
+            self.degradation_transitions = self.metrics.counter(
+                'houdini_bot_degradation_transitions_total', 'Bot degradation level changes', ('direction',))
+            self.create_supervised_task(self.lag_monitor.run, kind='lag_monitor')
+
+        self.create_supervised_task(self.bot_scaling)
+        self.create_supervised_task(self.bot_action_rate_sampler)
+
+        if self.backpressure is not None:
+            self.create_supervised_task(self.bot_backpressure_flush)
+
+        if self.plugin_config.get('config_reload_interval', self.default_config_reload_interval):
+            self.create_supervised_task(self.bot_config_reload)
+
+        if self.plugin_config.get('bot_snapshot'):
+            self.create_supervised_task(self.bot_snapshot_writer)
+
+        if self.plugin_config.get('bot_control'):
+            self.create_supervised_task(self.bot_control)
+
+        if self.accounting is not None and hasattr(signal, 'SIGUSR1'):
+            asyncio.get_running_loop().add_signal_handler(signal.SIGUSR1, self.log_accounting_report)
+
+        if self.plugin_config.get('profiler') and hasattr(signal, 'SIGUSR2'):
+            asyncio.get_running_loop().add_signal_handler(signal.SIGUSR2, self.toggle_profiler)
+
+        if (self.plugin_config.get('profiler') or {}).get('redis_trigger', False):
+            self.create_supervised_task(self.bot_profiler_trigger)
+
+        if self.plugin_config.get('metrics_port'):
+            self.metrics_server = await self.metrics.serve(
+                self.plugin_config.get('metrics_host', '127.0.0.1'), self.plugin_config['metrics_port'])
             
     def create_supervised_task(self, func, *args, **kwargs) -> asyncio.Task:
-        async def supervised():
-            while True:
-                try:
-                    return await func(*args, **kwargs)
-                except Exception as error:
-                    self.server.logger.error(f"Task done by exception: {error}")
-                    self.server.logger.exception(error)
-                    await asyncio.sleep(5)
-        return asyncio.create_task(supervised())
+        return self.tasks.spawn(func, *args, restart=True, **kwargs)
             
     async def create_penguin_bots(self, population: int):
         random_names = await self._get_random_names()
         password = self.plugin_config.get('bot_penguin_default_password') or secrets.token_urlsafe(32)
         hashed_password = self._hash_password(password)
         return await asyncio.gather(*(self.create_penguin_bot(
-            random.choice(random_names), hashed_password) for _ in range(population)))
+            self.random.choice(random_names), hashed_password) for _ in range(population)))
     
     async def create_penguin_bot(self, username: str, hashed_password: str) -> Penguin:
         email = f'{username.lower()}@{self.plugin_config.get("bot_penguin_email_domain", "email.com")}'
         
-        async with self.server.db.transaction():
-            color = random.randrange(2, 14)
+        async with self.db_gate.acquire(), self.metrics.db_query('create_penguin_bot'), self.server.db.transaction():
+            color = self.random.randrange(2, 14)
             try:
                 penguin = await Penguin.create(username=username.lower()[:12], nickname=username,
                                         password=hashed_password, email=email,
@@ -136,14 +317,14 @@ class BotPlugin(IPlugin):
             
             if self.plugin_config.get('bot_penguin_default_inventory', True):
                 update_kwargs = {**update_kwargs, **{
-                    'head': int(random.choice(self.items_by_type[ITEM_TYPE.HEAD]).id),
-                    'face': int(random.choice(self.items_by_type[ITEM_TYPE.FACE]).id),
-                    'neck': int(random.choice(self.items_by_type[ITEM_TYPE.NECK]).id),
-                    'body': int(random.choice(self.items_by_type[ITEM_TYPE.BODY]).id),
-                    'hand': int(random.choice(self.items_by_type[ITEM_TYPE.HAND]).id),
-                    'feet': int(random.choice(self.items_by_type[ITEM_TYPE.FEET]).id),
-                    'flag': int(random.choice(self.items_by_type[ITEM_TYPE.FLAG]).id),
-                    'photo': int(random.choice(self.items_by_type[ITEM_TYPE.PHOTO]).id)
+                    'head': int(self.random.choice(self.items_by_type[ITEM_TYPE.HEAD]).id),
+                    'face': int(self.random.choice(self.items_by_type[ITEM_TYPE.FACE]).id),
+                    'neck': int(self.random.choice(self.items_by_type[ITEM_TYPE.NECK]).id),
+                    'body': int(self.random.choice(self.items_by_type[ITEM_TYPE.BODY]).id),
+                    'hand': int(self.random.choice(self.items_by_type[ITEM_TYPE.HAND]).id),
+                    'feet': int(self.random.choice(self.items_by_type[ITEM_TYPE.FEET]).id),
+                    'flag': int(self.random.choice(self.items_by_type[ITEM_TYPE.FLAG]).id),
+                    'photo': int(self.random.choice(self.items_by_type[ITEM_TYPE.PHOTO]).id)
                 }}
             await penguin.update(**update_kwargs).apply()
         
@@ -177,58 +358,485 @@ class BotPlugin(IPlugin):
         
         return response
         
+    def bot_random(self, penguin_id) -> random.Random:
+        if self.random_seed is None:
+            return random
+        return random.Random(f'{self.random_seed}:{penguin_id}')
+
+    async def claim_penguin_bots(self, candidates: list[Penguin], limit: int) -> list[Penguin]:
+        if self.leases is None:
+            return candidates[:max(limit, 0)]
+        claimed_ids = set(await self.leases.claim_many((x.id for x in candidates), limit))
+        return [x for x in candidates if x.id in claimed_ids]
+
+    async def bring_online(self, bot: PenguinBot):
+        await bot.init()
+        bot.begin_activity()
+        self.bots.append(bot)
+        self.availability.add(bot)
+
+    async def ramp_up_bots(self, bots: list[PenguinBot], seconds: float):
+        loop = asyncio.get_running_loop()
+        started, slot = loop.time(), seconds / len(bots)
+        for i, bot in enumerate(bots):
+            await asyncio.sleep(max(started + (i + self.random.random()) * slot - loop.time(), 0))
+            if self.leases is not None and bot.id not in self.leases.held:
+                self.server.logger.warn(f'{bot.username} lease was lost before it came online')
+                continue
+            await self.bring_online(bot)
+        self.db_gate.begin_steady_state()
+        await self.update_population()
+        self.server.logger.info(f'{len(bots)} bots brought online over {loop.time() - started:.0f}s')
+
+    @property
+    def snapshot_file(self) -> str:
+        return (self.plugin_config['bot_snapshot'].get('file') or
+                os.path.join(os.path.dirname(__file__), f'bot_world_{self.server.config.id}.snapshot'))
+
+    def load_snapshot(self) -> WorldSnapshot | None:
+        snapshot_config = self.plugin_config.get('bot_snapshot')
+        if not snapshot_config or not os.path.exists(self.snapshot_file):
+            return None
+        try:
+            snapshot = read_snapshot(self.snapshot_file)
+        except (OSError, ValueError) as e:
+            self.server.logger.error(f'Ignoring bot snapshot: {e}')
+            return None
+        if snapshot.age > snapshot_config.get('max_age', self.default_snapshot_max_age):
+            self.server.logger.info(f'Ignoring bot snapshot {self.snapshot_file}, it is {snapshot.age:.0f}s old')
+            return None
+        return snapshot
+
+    def save_snapshot(self):
+        now = asyncio.get_running_loop().time()
+        snapshot = capture(self.bots, self.server.open_igloos_by_penguin_id,
+                           self.rotation_deadlines.get('bot', now) - now, self.rotation_deadlines.get('igloo', now) - now)
+        try:
+            write_snapshot(self.snapshot_file, snapshot)
+        except OSError as e:
+            self.server.logger.error(f'Could not write bot snapshot {self.snapshot_file}: {e}')
+
+    async def restore_bots(self, bots: list[PenguinBot], snapshot: WorldSnapshot):
+        states = {x.penguin_id: x for x in snapshot.bots}
+        # Every bot is registered before any igloo opens, so visitors can be put back inside them
+        for bot in bots:
+            await bot.load()
+        open_bots, party_bots = [], []
+        if self.is_behavior_enabled('bot_igloo_rotation'):
+            open_bots = [x for x in bots if states[x.id].igloo_open]
+            party_bots = [x for x in open_bots if states[x.id].igloo_party]
+        for bot in open_bots:
+            bot.open_igloo()
+        for bot in party_bots:
+            bot.throwing_igloo_party = True
+        for bot in bots:
+            await bot.restore(states[bot.id])
+            bot.begin_activity()
+            self.bots.append(bot)
+            self.availability.add(bot)
+
+        if snapshot.bot_rotation_in:
+            self.restored_rotation['bot'] = snapshot.bot_rotation_in
+        if open_bots:
+            self.resumed_igloos = (open_bots, party_bots, snapshot.igloo_rotation_in or
+                                   self.random.choice(self.bot_igloo_rotation_range))
+        self.server.logger.info(f'{len(bots)} bots restored from {self.snapshot_file} '
+                                f'saved {snapshot.age:.0f}s ago')
+
+    async def add_bot(self, penguin: Penguin) -> PenguinBot:
+        bot = PenguinBot(penguin.id, self).load_data(penguin)
+        await self.bring_online(bot)
+        bot.trace('rotate_in')
+        return bot
+
+    def removable_bot(self) -> PenguinBot | None:
+        # Idle bots first, so rotation and scaling never take a bot out of a waddle game
+        if self.availability:
+            return self.random.choice(self.availability.idle)
+        candidates = [x for x in self.bots if 'game' not in self.availability.busy.get(x.id, ())]
+        return self.random.choice(candidates) if candidates else None
+
+    async def remove_bot(self, bot: PenguinBot):
+        self.bots = [x for x in self.bots if x.id != bot.id]
+        self.availability.remove(bot)
+        bot.trace('rotate_out')
+        await bot.disconnect()
+
+    async def claim_incoming_bot(self) -> Penguin | None:
+        candidates = [x for x in self.existing_penguin_bots if x.id not in self.server.penguins_by_id]
+        incoming_bots = await self.claim_penguin_bots(self.random.sample(candidates, len(candidates)), 1)
+        return incoming_bots[0] if incoming_bots else None
+
+    def count_bots_by_room(self) -> dict[tuple, int]:
+        return {(room_id,): count for room_id, count in Counter(x.room.id for x in self.bots if x.room).items()}
+
+    def collect_accounting(self, index: int) -> dict[tuple, float]:
+        return {(behavior,): stats[index] for behavior, stats in self.accounting.totals().items()}
+
+    def log_accounting_report(self):
+        accounting_config = self.plugin_config['behavior_accounting']
+        self.server.logger.info(self.accounting.report(
+            accounting_config.get('report_size', 20), accounting_config.get('report_by_room', False)))
+
+    def start_profiler(self, owner: str):
+        if not self.profiler.running:
+            self.profiler.start()
+            self.profiler_owner = owner
+            self.server.logger.info(f'Sampling profiler started by {owner}')
+
+    def stop_profiler(self):
+        self.profiler_owner = None
+        filename = self.profiler.stop()
+        if filename:
+            self.server.logger.info(f'Sampling profiler stopped ({self.profiler.summary()}), stacks written to {filename}')
+
+    def toggle_profiler(self):
+        if self.profiler.running:
+            self.stop_profiler()
+        else:
+            self.start_profiler('signal')
+
+    async def bot_profiler_trigger(self):
+        key = f'houdini.bot.profiler.{self.server.config.id}'
+        requested = False
+        while True:
+            if bool(await self.server.redis.exists(key)) != requested:
+                requested = not requested
+                if requested:
+                    self.start_profiler('redis')
+                elif self.profiler_owner == 'redis':
+                    self.stop_profiler()
+            await asyncio.sleep(self.profiler_poll_interval)
+
+    def trace_human(self, p, action: str, *args: int):
+        if self.tracer is not None:
+            self.tracer.record(p.id, p.room.id if p.room else 0, ACTION_CODES[action], *args)
+
+    async def fan_out(self, handler: str, room_id: int | None, coros):
+        self.metrics.fanout.observe(len(self.bots), handler)
+        gathered = self.gather(coros)
+        if self.accounting is not None:
+            gathered = self.accounting.measure(f'fan_out.{handler}', room_id, gathered)
+        await gathered
+
+    @staticmethod
+    async def gather(coros):
+        await asyncio.gather(*coros)
+
+    def is_behavior_enabled(self, behavior: str) -> bool:
+        return behavior in self.enabled_behaviors
+
+    def update_enabled_behaviors(self):
+        self.enabled_behaviors = self.config.enabled_flags - self.disabled_behaviors - self.paused_behaviors
+
+    def on_degradation_level_change(self, previous: int, level: int, lag_ms: float):
+        levels = self.plugin_config['lag_monitor'].get('degradation_levels', self.default_degradation_levels)
+        self.disabled_behaviors = set(levels[:level])
+        self.update_enabled_behaviors()
+        self.degradation_transitions.inc('up' if level > previous else 'down')
+        log = self.server.logger.warn if level > previous else self.server.logger.info
+        log(f'Event loop lag at {lag_ms:.1f}ms, bot degradation level {previous} -> {level} '
+            f'(disabled: {", ".join(sorted(self.disabled_behaviors)) or "none"})')
+
+    @property
+    def target_population(self) -> int:
+        targets = self.population_targets
+        if 'control' in targets:
+            # An operator's scale command replaces the configured and adaptive targets, the cluster budget still applies
+            targets = {k: v for k, v in targets.items() if k not in ('config', 'adaptive')}
+        return min(targets.values(), default=len(self.bots))
+
+    async def update_population(self):
+        await self.server.redis.hset('houdini.population', self.server.config.id, len(self.server.penguins_by_id))
+
+    @property
+    def ramping(self) -> bool:
+        # Bots still queued by the startup ramp are offline but already claimed
+        return self.ramp_task is not None and not self.ramp_task.done()
+
+    async def scale_once(self) -> bool:
+        if len(self.bots) < self.target_population:
+            incoming_bot = await self.claim_incoming_bot()
+            if incoming_bot is None:
+                return False
+            await self.add_bot(incoming_bot)
+        elif len(self.bots) > self.target_population:
+            victim = self.removable_bot()
+            if victim is None:
+                return False
+            await self.remove_bot(victim)
+        else:
+            return False
+        return True
+
+    async def bot_scaling(self):
+        while True:
+            await asyncio.sleep(self.bot_scaling_interval)
+            if self.ramping:
+                continue
+            step, scaled = self.plugin_config.get('bot_scaling_step', self.default_bot_scaling_step), 0
+            while scaled < step and await self.scale_once():
+                scaled += 1
+            if scaled:
+                await self.update_population()
+
+    async def bot_cluster_balance(self):
+        while True:
+            target = await self.cluster.compute_target(len(self.bots))
+            if target != self.population_targets.get('cluster'):
+                self.server.logger.info(f'Cluster bot target for server {self.server.config.id}: {target}')
+            self.population_targets['cluster'] = target
+            await asyncio.sleep(self.cluster_balance_interval)
+
+    @property
+    def human_population(self) -> int:
+        return len(self.server.penguins_by_id) - len(self.bots)
+
+    def adaptive_limits(self) -> tuple[int, int]:
+        adaptive_config = self.plugin_config['adaptive_population']
+        return (adaptive_config.get('min_bots', 0),
+                adaptive_config.get('max_bots', self.population_targets.get('config', self.max_bot_population)))
+
+    def adaptive_target(self, humans: int) -> int:
+        adaptive_config = self.plugin_config['adaptive_population']
+        min_bots, max_bots = self.adaptive_limits()
+        if adaptive_config.get('mode', 'fill') == 'fill':
+            target = adaptive_config.get('fill_to', max_bots) - humans
+        else:
+            target = max_bots - int(humans * adaptive_config.get('bots_per_human', 1))
+        return max(min_bots, min(max_bots, target))
+
+    async def bot_adaptive_population(self):
+        hysteresis = self.plugin_config['adaptive_population'].get('hysteresis', 5)
+        while True:
+            target = self.adaptive_target(self.human_population)
+            current = self.population_targets.get('adaptive')
+            # A target clamped to a limit is applied right away, or hysteresis could keep it from ever getting there
+            if current is None or abs(target - current) >= hysteresis or (
+                    target != current and target in self.adaptive_limits()):
+                self.server.logger.info(f'Adaptive bot target: {target} ({self.human_population} humans online)')
+                self.population_targets['adaptive'] = target
+            await asyncio.sleep(self.adaptive_population_interval)
+
+    def configure_chat(self):
+        chat_config = self.plugin_config.get('chat_budget')
+        if not chat_config:
+            self.chat = None
+            return
+        self.chat = ChatScheduler(chat_config.get('rate', 1), chat_config.get('burst', 3),
+                                  chat_config.get('dedupe_seconds', 5), lambda: asyncio.get_running_loop().time(),
+                                  self.chat_dropped)
+
+    def reload_config(self):
+        try:
+            config = BotConfig.load(self.config_file)
+        except (OSError, ValueError) as e:
+            self.server.logger.error(f'Keeping the current bot config, could not load {self.config_file}: {e}')
+            return
+        changed = sorted(x for x in self.startup_keys if config.raw.get(x, ...) != self.plugin_config.get(x, ...))
+        if changed:
+            self.server.logger.warn(f'Ignoring changes to {", ".join(changed)} until the plugin restarts')
+            raw = {k: v for k, v in config.raw.items() if k not in self.startup_keys}
+            raw.update((x, self.plugin_config[x]) for x in self.startup_keys if x in self.plugin_config)
+            config = BotConfig.from_dict(raw)
+        self.config, self.plugin_config = config, config.raw
+        self.update_enabled_behaviors()
+        self.configure_chat()
+        if config.bot_population is not None:
+            self.population_targets['config'] = min(config.bot_population, self.max_bot_population)
+        self.server.logger.info(f'Bot config reloaded from {self.config_file}')
+
+    async def bot_backpressure_flush(self):
+        while True:
+            await asyncio.sleep(self.backpressure_flush_interval)
+            await self.backpressure.flush_drained(self.server)
+
+    async def bot_action_rate_sampler(self):
+        rates = self.metrics.action_rate
+        while True:
+            rates.sample(sum(self.metrics.actions.values.values()))
+            await asyncio.sleep(rates.interval)
+
+    async def bot_snapshot_writer(self):
+        while True:
+            await asyncio.sleep(self.plugin_config['bot_snapshot'].get('interval', self.default_snapshot_interval))
+            self.save_snapshot()
+
+    async def bot_config_reload(self):
+        while True:
+            await asyncio.sleep(self.plugin_config.get('config_reload_interval', self.default_config_reload_interval))
+            mtime = config_mtime(self.config_file)
+            if mtime is not None and mtime != self.config_mtime:
+                self.config_mtime = mtime
+                self.reload_config()
+
     async def bot_rotation(self):
         while True:
-            await asyncio.sleep(random.choice(self.bot_rotation_range))
-            incoming_bot = random.choice([x for x in self.existing_penguin_bots if x.id not in self.server.penguins_by_id])
-            incoming_bot = PenguinBot(incoming_bot.id, self).load_data(incoming_bot)
-            rotated_bot = random.choice(self.bots)
-            self.bots = [x for x in self.bots if x.id != rotated_bot.id]
-            await rotated_bot.disconnect()
-            await incoming_bot.init()
-            incoming_bot.begin_activity()
-            self.bots.append(incoming_bot)
+            delay = self.restored_rotation.pop('bot', None) or self.random.choice(self.bot_rotation_range)
+            self.rotation_deadlines['bot'] = asyncio.get_running_loop().time() + delay
+            await asyncio.sleep(delay)
+            if self.is_behavior_enabled('bot_rotation'):
+                await self.rotate_bot()
+
+    async def rotate_bot(self):
+        if self.ramping:
+            return
+        with self.metrics.rotation_duration.time('bot'):
+            victim = self.removable_bot()
+            if victim is None:
+                return
+            incoming_bot = await self.claim_incoming_bot()
+            if incoming_bot is None:
+                self.server.logger.warn('No bot account available for rotation')
+                return
+            await self.remove_bot(victim)
+            await self.add_bot(incoming_bot)
+
+    async def bot_control(self):
+        channel = ControlChannel(self.server.redis, self.plugin_config['bot_control'].get(
+            'channel', self.default_control_channel), self.server.config.id)
+        async for text in channel.listen():
+            try:
+                command, args = parse_command(text, self.pausable_behaviors)
+            except ControlError as e:
+                self.server.logger.warn(f'Ignoring bot control command {text!r}: {e}')
+                continue
+            self.server.logger.info(f'Bot control command: {text}')
+            await getattr(self, f'control_{command}')(*args)
+
+    async def control_scale(self, population: int | None):
+        if population is None:
+            self.population_targets.pop('control', None)
+        else:
+            self.population_targets['control'] = min(population, self.max_bot_population)
+
+    def is_drained(self, room) -> bool:
+        # Igloo ids are penguin ids and can match a drained room's id
+        return room.id in self.drained_rooms and not hasattr(room, 'penguin_id')
+
+    async def control_drain(self, room_id: int):
+        self.drained_rooms.add(room_id)
+        room = self.server.rooms.get(room_id)
+        await asyncio.gather(*(bot.move_to_random_room() for bot in self.bots if bot.room is room is not None))
+
+    async def control_undrain(self, room_id: int):
+        self.drained_rooms.discard(room_id)
+
+    async def control_pause(self, behaviors: frozenset[str]):
+        self.paused_behaviors |= behaviors
+        self.update_enabled_behaviors()
+
+    async def control_resume(self, behaviors: frozenset[str]):
+        self.paused_behaviors -= behaviors
+        self.update_enabled_behaviors()
+
+    async def control_rotate(self, count: int):
+        if self.ramping:
+            self.server.logger.warn('Ignoring rotate until the startup ramp has finished')
+            return
+        for _ in range(count):
+            await self.rotate_bot()
+
+    async def control_rotate_igloos(self):
+        if self.igloo_rotation_task is not None:
+            self.igloo_rotation_task.cancel()
+        for bot in self.bots:
+            bot.close_igloo()
+        self.igloo_rotation_task = self.create_supervised_task(self.bot_igloo_rotation)
+
+    async def bot_lease_heartbeat(self):
+        while True:
+            await asyncio.sleep(self.leases.ttl / 3)
+            await self.leases.renew()
+            # Also catches bots that came online after their lease was lost during startup
+            for bot in [x for x in self.bots if x.id not in self.leases.held]:
+                self.server.logger.warn(f'{bot.username} lease was lost, disconnecting')
+                await self.remove_bot(bot)
             
     async def bot_igloo_rotation(self):
+        resumed, self.resumed_igloos = self.resumed_igloos, None
         while True:
-            open_bots = random.sample(self.bots, min(
-                self.plugin_config.get('bot_open_igloos', self.default_bot_open_igloos), len(self.bots)))
-            party_bots = random.sample(open_bots, min(
-                self.plugin_config.get('bot_throwing_igloo_party', self.default_bot_throwing_igloo_party), len(open_bots)))
-            for bot in open_bots:
-                self.server.logger.info(f'{bot.username} is opening its igloo')
-                await bot.randomize_igloo()
-                bot.open_igloo()
-            for bot in party_bots:
-                self.server.logger.info(f'{bot.username} is throwing an igloo party')
-                bot.throwing_igloo_party = True
-            
-            await asyncio.sleep(random.choice(self.bot_igloo_rotation_range))
+            if resumed is not None:
+                open_bots, party_bots, duration = resumed
+                resumed = None
+                stagger = self.igloo_stagger_seconds / len(open_bots) if self.config.phase_spread else 0
+            elif not self.is_behavior_enabled('bot_igloo_rotation'):
+                await asyncio.sleep(self.random.choice(self.bot_igloo_rotation_range))
+                continue
+            else:
+                open_bots = self.random.sample(self.bots, min(self.config.bot_open_igloos, len(self.bots)))
+                party_bots = self.random.sample(open_bots, min(self.config.bot_throwing_igloo_party, len(open_bots)))
+                stagger = self.igloo_stagger_seconds / len(open_bots) if self.config.phase_spread and open_bots else 0
+                # The stagger sleeps are left out of the rotation duration
+                busy = 0.0
+                for bot in open_bots:
+                    if stagger:
+                        await asyncio.sleep(self.random.uniform(0, 2 * stagger))
+                    started = time.perf_counter()
+                    self.server.logger.info(f'{bot.username} is opening its igloo')
+                    await bot.randomize_igloo()
+                    bot.open_igloo()
+                    busy += time.perf_counter() - started
+                for bot in party_bots:
+                    self.server.logger.info(f'{bot.username} is throwing an igloo party')
+                    bot.throwing_igloo_party = True
+                    bot.trace('igloo_party')
+                self.metrics.rotation_duration.observe(busy, 'igloo')
+                duration = self.random.choice(self.bot_igloo_rotation_range)
+
+            self.rotation_deadlines['igloo'] = asyncio.get_running_loop().time() + duration
+            await asyncio.sleep(duration)
             
             for bot in open_bots:
+                if stagger:
+                    await asyncio.sleep(self.random.uniform(0, 2 * stagger))
                 bot.close_igloo()
             for bot in party_bots:
                 bot.throwing_igloo_party = False
     
+    @commands.command('botprofile')
+    async def handle_profile_command(self, p, action: str):
+        if not p.moderator:
+            return
+        if action == 'start':
+            self.start_profiler('command')
+        elif action == 'stop':
+            self.stop_profiler()
+
     @handlers.handler(XTPacket('j', 'jr'))
     async def handle_join_room(self, p, room: Room, *_):
-        await asyncio.gather(*(bot.handle_join_room(p, room) for bot in self.bots))
+        self.trace_human(p, 'human_join_room', room.id)
+        await self.fan_out('join_room', room.id, (bot.handle_join_room(p, room) for bot in self.bots))
 
     @handlers.handler(XTPacket('u', 'sb'))
     async def handle_snowball(self, p, x: int, y: int):
-        await asyncio.gather(*(bot.handle_snowball(p, x, y) for bot in self.bots))
+        self.trace_human(p, 'human_snowball', x, y)
+        await self.fan_out('snowball', p.room.id, (bot.handle_snowball(p, x, y) for bot in self.bots))
         
     @handlers.handler(XTPacket('u', 'ss'))
     async def handle_safe_message(self, p, message_id: int):
-        await asyncio.gather(*(bot.handle_safe_message(p, message_id) for bot in self.bots))
+        self.trace_human(p, 'human_safe_message', message_id)
+        await self.fan_out('safe_message', p.room.id, (bot.handle_safe_message(p, message_id) for bot in self.bots))
         
     @handlers.handler(XTPacket('jw', ext='z'))
     async def handle_join_waddle(self, p, waddle_id: int):
         if waddle_id not in p.room.waddles:
             return
         waddle: RoomWaddle = p.room.waddles[waddle_id]
-        try:
-            chosen_players = random.sample(self.bots, waddle.seats - 1)
-            await asyncio.gather(*(bot.join_game(p, waddle) for bot in chosen_players))
-        except ValueError:
-            self.server.logger.error("Insufficient amount of bots for joining game")
+        self.trace_human(p, 'human_join_waddle', waddle_id)
+        if waddle.id not in self.config.bot_waddles:
+            return
+        # Bots reserved for a penguin that has left the waddle since give up on their own and hold no seat
+        seats = waddle.penguins.count(None) - sum(1 for _, target in self.waddle_reservations.get(waddle.id, ())
+                                                  if target.waddle is waddle)
+        if seats <= 0:
+            return
+        chosen_players = self.availability.reserve(seats, self.random, 'game')
+        if chosen_players is None:
+            self.server.logger.error(f'Insufficient amount of idle bots for joining waddle {waddle.id}: '
+                                     f'{seats} seats, {len(self.availability)} idle bots')
+            return
+        self.waddle_reservations.setdefault(waddle.id, []).extend((bot, p) for bot in chosen_players)
+        for bot in chosen_players:
+            bot.reserved_waddle = waddle.id
+        await asyncio.gather(*(bot.join_game(p, waddle) for bot in chosen_players))
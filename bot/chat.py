@@ -0,0 +1,51 @@
+import time
+from collections import Counter
+
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+# Share of the bucket a message of each priority must leave untouched, so
+# low priority chatter never starves direct replies to players
+PRIORITY_RESERVE = (0.0, 0.25, 0.5)
+
+
+class ChatScheduler:
+    def __init__(self, rate: float, burst: float, dedupe_seconds: float = 5, clock=time.monotonic,
+                 dropped: Counter | None = None) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.dedupe_seconds = dedupe_seconds
+        self.clock = clock
+        self.buckets: dict[object, list[float]] = {}
+        self.recent: dict[tuple, float] = {}
+        self.dropped = Counter() if dropped is None else dropped
+
+    @staticmethod
+    def room_key(room):
+        return ('igloo', room.id) if hasattr(room, 'penguin_id') else room.id
+
+    def allow(self, room, command: str, value: int, priority: int = PRIORITY_NORMAL) -> bool:
+        now = self.clock()
+        key = self.room_key(room)
+
+        message = (key, command, value)
+        last_sent = self.recent.get(message)
+        if last_sent is not None and now - last_sent < self.dedupe_seconds:
+            self.dropped['duplicate'] += 1
+            return False
+
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = self.buckets[key] = [self.burst, now]
+        tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+        bucket[1] = now
+        if tokens - 1 < (self.burst - 1) * PRIORITY_RESERVE[priority]:
+            bucket[0] = tokens
+            self.dropped['budget'] += 1
+            return False
+        bucket[0] = tokens - 1
+
+        if len(self.recent) > 4096:
+            self.recent = {k: v for k, v in self.recent.items() if now - v < self.dedupe_seconds}
+        self.recent[message] = now
+        return True
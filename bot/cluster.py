@@ -0,0 +1,68 @@
+import time
+
+
+def _decode(value) -> str:
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
+def allocate_bot_budget(budget: int, humans: dict[str, int], capacities: dict[str, int]) -> dict[str, int]:
+    headroom = {w: max(capacities[w] - humans.get(w, 0), 0) for w in capacities}
+    allocation = {w: 0 for w in capacities}
+    remaining = budget
+    open_worlds = {w for w, h in headroom.items() if h > 0}
+    while remaining > 0 and open_worlds:
+        total_headroom = sum(headroom[w] - allocation[w] for w in open_worlds)
+        granted = 0
+        for world in sorted(open_worlds):
+            free = headroom[world] - allocation[world]
+            share = min(free, max(1, remaining * free // total_headroom), remaining - granted)
+            allocation[world] += share
+            granted += share
+        remaining -= granted
+        open_worlds = {w for w in open_worlds if allocation[w] < headroom[w]}
+        if not granted:
+            break
+    return allocation
+
+
+class ClusterCoordinator:
+    population_key = 'houdini.population'
+    bot_population_key = 'houdini.bot_population'
+    capacity_key = 'houdini.bot_capacity'
+    heartbeat_key = 'houdini.bot_heartbeat'
+
+    def __init__(self, redis, world_id, budget: int, capacity: int, max_step: int, stale_after: float = 90) -> None:
+        self.redis = redis
+        self.world_id = str(world_id)
+        self.budget = budget
+        self.capacity = capacity
+        self.max_step = max_step
+        self.stale_after = stale_after
+        self.target = None
+
+    async def publish(self, bot_count: int):
+        await self.redis.hset(self.bot_population_key, self.world_id, bot_count)
+        await self.redis.hset(self.capacity_key, self.world_id, self.capacity)
+        await self.redis.hset(self.heartbeat_key, self.world_id, time.time())
+
+    async def read_cluster(self) -> tuple[dict[str, int], dict[str, int]]:
+        population = await self.redis.hgetall(self.population_key)
+        bots = await self.redis.hgetall(self.bot_population_key)
+        capacities = await self.redis.hgetall(self.capacity_key)
+        heartbeats = await self.redis.hgetall(self.heartbeat_key)
+        # Worlds that stopped publishing are left out, so their share goes back to the live ones
+        live = {_decode(k) for k, v in heartbeats.items() if float(v) > time.time() - self.stale_after}
+        population = {_decode(k): int(v) for k, v in population.items()}
+        bots = {_decode(k): int(v) for k, v in bots.items()}
+        capacities = {_decode(k): int(v) for k, v in capacities.items() if _decode(k) in live}
+        humans = {w: max(population.get(w, 0) - bots.get(w, 0), 0) for w in capacities}
+        return humans, capacities
+
+    async def compute_target(self, bot_count: int) -> int:
+        await self.publish(bot_count)
+        humans, capacities = await self.read_cluster()
+        desired = allocate_bot_budget(self.budget, humans, capacities).get(self.world_id, 0)
+        current = bot_count if self.target is None else self.target
+        step = max(-self.max_step, min(self.max_step, desired - current))
+        self.target = current + step
+        return self.target
@@ -0,0 +1,141 @@
+import json
+import os
+from dataclasses import dataclass, field, fields
+
+from houdini.plugins.bot.constants import SAFE_MESSAGES
+from houdini.plugins.bot.reactions import Reaction, compile_reactions, validate_reaction
+
+DEFAULT_ROOM_IDS = (
+    100, 110, 111, 120, 121, 130, 300, 310, 320, 330, 340, 200, 220,
+    230, 801, 802, 800, 400, 410, 411, 809, 805, 810, 806, 808, 807
+)
+ADAPTIVE_MODES = ('fill', 'ratio')
+DERIVED_FIELDS = {'raw', 'room_choices', 'enabled_flags', 'snowball_reactions', 'safe_message_reactions'}
+
+
+class ConfigError(ValueError):
+    pass
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class BotConfig:
+    bot_population: int | None = None
+    bot_rooms: tuple[int, ...] = DEFAULT_ROOM_IDS
+    room_weights: dict[int, float] = field(default_factory=dict)
+    bot_waddles: frozenset[int] = frozenset((100, 101, 102, 103))
+    waddle_join_delay: float = 10
+    bot_open_igloos: int = 15
+    bot_throwing_igloo_party: int = 5
+    igloo_room_weight: float = 0.5
+    partying_igloo_room_weight: float = 2
+    greeting_messages: tuple[int, ...] = (SAFE_MESSAGES.HI_THERE, SAFE_MESSAGES.HOW_U_DOING)
+    interaction_distance: float = 100
+    spot_distance: float = 10
+    spot_max_probability: float = 0.75
+    random_clothing_on_startup: bool = True
+    no_clothing: bool = False
+    bot_rotation: bool = True
+    bot_igloo_rotation: bool = True
+    enable_random_movement: bool = True
+    enable_random_frame: bool = True
+    enable_room_spots: bool = True
+    enable_random_room_movement: bool = True
+    enable_random_clothing: bool = True
+    enable_greeting: bool = True
+    enable_snowball_lament: bool = True
+    enable_snowball_throwback: bool = True
+    enable_follow_mode: bool = True
+    enable_random_movement_on_demand: bool = True
+    phase_spread: bool = False
+
+    raw: dict = field(default_factory=dict)
+    # Current room id (None when outside bot_rooms) -> (candidate room ids, weights)
+    room_choices: dict[int | None, tuple[tuple[int, ...], tuple[float, ...]]] = field(default_factory=dict)
+    enabled_flags: frozenset[str] = frozenset()
+    snowball_reactions: tuple[str, ...] = ()
+    safe_message_reactions: dict[int, tuple[Reaction, ...]] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, raw: dict) -> 'BotConfig':
+        values = {}
+        for f in fields(cls):
+            if f.name in DERIVED_FIELDS or f.name not in raw:
+                continue
+            values[f.name] = _coerce(f.name, raw[f.name], f.type)
+        config = cls(**values)
+
+        weights = tuple(config.room_weights.get(x, 1) for x in config.bot_rooms)
+        room_choices = {None: (config.bot_rooms, weights)}
+        for room_id in config.bot_rooms:
+            others = [(x, w) for x, w in zip(config.bot_rooms, weights) if x != room_id]
+            room_choices[room_id] = (tuple(x for x, _ in others), tuple(w for _, w in others))
+        enabled_flags = frozenset(f.name for f in fields(cls) if f.type is bool and getattr(config, f.name))
+        snowball_reactions = tuple(name for name, flag in (('lament_snowball', 'enable_snowball_lament'),
+                                                           ('throw_snowball_back', 'enable_snowball_throwback'))
+                                   if flag in enabled_flags)
+        adaptive_population = raw.get('adaptive_population')
+        if adaptive_population is not None:
+            if not isinstance(adaptive_population, dict):
+                raise ConfigError('adaptive_population must be an object')
+            if adaptive_population.get('mode', 'fill') not in ADAPTIVE_MODES:
+                raise ConfigError(f'adaptive_population mode must be one of {", ".join(ADAPTIVE_MODES)}, '
+                                  f'got {adaptive_population["mode"]!r}')
+        custom_reactions = raw.get('safe_message_reactions') or []
+        if not isinstance(custom_reactions, list):
+            raise ConfigError('safe_message_reactions must be a list')
+        for index, entry in enumerate(custom_reactions):
+            error = validate_reaction(index, entry)
+            if error:
+                raise ConfigError(f'safe_message_reactions {error}')
+        return cls(**values, raw=raw, room_choices=room_choices, enabled_flags=enabled_flags,
+                   snowball_reactions=snowball_reactions,
+                   safe_message_reactions=compile_reactions(enabled_flags, custom_reactions))
+
+    @classmethod
+    def load(cls, filename: str) -> 'BotConfig':
+        with open(filename) as f:
+            raw = json.load(f)
+        if not isinstance(raw, dict):
+            raise ConfigError(f'{filename} must hold a JSON object')
+        return cls.from_dict(raw)
+
+
+def _number(name: str, value) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ConfigError(f'{name} must be a number, got {value!r}')
+    return value
+
+
+def _coerce(name: str, value, annotation):
+    if annotation is bool:
+        if not isinstance(value, bool):
+            raise ConfigError(f'{name} must be true or false, got {value!r}')
+        return value
+    if annotation is int or annotation == int | None:
+        if value is None and annotation != int:
+            return None
+        if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+            raise ConfigError(f'{name} must be a non-negative integer, got {value!r}')
+        return value
+    if annotation is float:
+        if _number(name, value) < 0:
+            raise ConfigError(f'{name} must not be negative, got {value!r}')
+        return value
+    if annotation in (tuple[int, ...], frozenset[int]):
+        if not isinstance(value, list) or any(isinstance(x, bool) or not isinstance(x, int) for x in value):
+            raise ConfigError(f'{name} must be a list of integers, got {value!r}')
+        return tuple(value) if annotation == tuple[int, ...] else frozenset(value)
+    if annotation == dict[int, float]:
+        if not isinstance(value, dict):
+            raise ConfigError(f'{name} must be an object, got {value!r}')
+        if not all(str(k).isdigit() for k in value):
+            raise ConfigError(f'{name} keys must be room ids, got {list(value)!r}')
+        return {int(k): _number(f'{name}.{k}', v) for k, v in value.items()}
+    raise ConfigError(f'{name} has an unsupported type')
+
+
+def config_mtime(filename: str) -> int | None:
+    try:
+        return os.stat(filename).st_mtime_ns
+    except OSError:
+        return None
@@ -0,0 +1,59 @@
+class ControlError(ValueError):
+    pass
+
+
+def _integer(command: str, value: str, minimum: int = 0) -> int:
+    if not value.isdigit() or int(value) < minimum:
+        raise ControlError(f'{command} needs an integer of at least {minimum}, got {value!r}')
+    return int(value)
+
+
+def parse_command(text: str, behaviors: frozenset[str]) -> tuple[str, list]:
+    parts = text.split()
+    if not parts:
+        raise ControlError('empty command')
+    command, args = parts[0].lower(), parts[1:]
+    if command == 'scale':
+        if len(args) != 1:
+            raise ControlError('usage: scale <bots>|reset')
+        return command, [None if args[0] == 'reset' else _integer(command, args[0])]
+    if command in ('drain', 'undrain'):
+        if len(args) != 1:
+            raise ControlError(f'usage: {command} <room id>')
+        return command, [_integer(command, args[0])]
+    if command in ('pause', 'resume'):
+        if not args:
+            raise ControlError(f'usage: {command} <behavior>...|all')
+        if args == ['all']:
+            return command, [behaviors]
+        unknown = [x for x in args if x not in behaviors]
+        if unknown:
+            raise ControlError(f'unknown behaviors {", ".join(unknown)}')
+        return command, [frozenset(args)]
+    if command == 'rotate':
+        if len(args) > 1:
+            raise ControlError('usage: rotate [bots]')
+        return command, [_integer(command, args[0], 1) if args else 1]
+    if command == 'rotate_igloos':
+        if args:
+            raise ControlError('usage: rotate_igloos')
+        return command, []
+    raise ControlError(f'unknown command {command}')
+
+
+class ControlChannel:
+    def __init__(self, redis, channel: str, world_id) -> None:
+        self.redis = redis
+        # Commands published on the bare channel reach every world
+        self.channels = (channel, f'{channel}.{world_id}')
+
+    async def listen(self):
+        pubsub = self.redis.pubsub()
+        await pubsub.subscribe(*self.channels)
+        try:
+            async for message in pubsub.listen():
+                if message['type'] == 'message':
+                    data = message['data']
+                    yield data.decode() if isinstance(data, bytes) else str(data)
+        finally:
+            await pubsub.reset()
@@ -0,0 +1,38 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
+from houdini.plugins.bot.metrics import Histogram
+
+
+class BotDatabaseGate:
+    # Caps concurrent bot database work at a share of the pool: the whole share while the bots come online,
+    # a smaller one afterwards. It is a limit per phase, requests are served in arrival order
+    STARTUP = 'startup'
+    STEADY = 'steady'
+
+    def __init__(self, pool_size: int, fraction: float, steady_fraction: float = 0.5) -> None:
+        self.size = max(1, int(pool_size * fraction))
+        self.phase = self.STARTUP
+        self._limits = {
+            self.STARTUP: asyncio.Semaphore(self.size),
+            self.STEADY: asyncio.Semaphore(max(1, int(self.size * steady_fraction))),
+        }
+        self.wait_histogram = Histogram('houdini_bot_db_wait_seconds', 'Time spent waiting for the bot database gate',
+                                        ('phase',))
+        self.in_use = 0
+
+    def begin_steady_state(self):
+        self.phase = self.STEADY
+
+    @asynccontextmanager
+    async def acquire(self):
+        phase = self.phase
+        started = time.perf_counter()
+        async with self._limits[phase]:
+            self.wait_histogram.observe(time.perf_counter() - started, phase)
+            self.in_use += 1
+            try:
+                yield
+            finally:
+                self.in_use -= 1
@@ -1,1359 +1,105 @@
 import asyncio
-import random
-from typing import TYPE_CHECKING
+import heapq
+import itertools
+import os
+from collections import Counter
+from typing import TYPE_CHECKING, Awaitable, Callable
 
 from houdini import IWaddle
+from houdini.plugins.bot.sled_traces import SledTraceStore
 
 if TYPE_CHECKING:
     from houdini.plugins.bot.penguin_bot import PenguinBot
 
 
+class SledRace:
+    __slots__ = ("moves", "started", "send", "index", "done")
+
+    def __init__(self, moves: list, started: float, send: Callable[..., Awaitable], done: asyncio.Future) -> None:
+        self.moves = moves
+        self.started = started
+        self.send = send
+        self.index = 0
+        self.done = done
+
+    def deadline(self, index: int) -> float:
+        return self.started + self.moves[index][2] / 1000
+
+
+class RaceTicker:
+    # A race running further behind than this jumps straight to its latest due move
+    merge_lateness = 0.1
+
+    def __init__(self, tasks) -> None:
+        self.tasks = tasks
+        self.queue: list[tuple[float, int, SledRace]] = []
+        self.order = itertools.count()
+        self.outcomes = Counter()
+        self.task = None
+        self.wakeup = asyncio.Event()
+
+    async def play(self, moves: list, send: Callable[..., Awaitable]):
+        if not moves:
+            return
+        loop = asyncio.get_running_loop()
+        race = SledRace(moves, loop.time(), send, loop.create_future())
+        self.schedule(race)
+        await race.done
+
+    def schedule(self, race: SledRace):
+        deadline = race.deadline(race.index)
+        if self.queue and deadline < self.queue[0][0]:
+            self.wakeup.set()
+        heapq.heappush(self.queue, (deadline, next(self.order), race))
+        if self.task is None or self.task.done():
+            self.task = self.tasks.spawn(self.run, kind="race_ticker")
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        while self.queue:
+            delay = self.queue[0][0] - loop.time()
+            if delay > 0:
+                self.wakeup.clear()
+                try:
+                    await asyncio.wait_for(self.wakeup.wait(), delay)
+                    continue
+                except asyncio.TimeoutError:
+                    pass
+            # Timers may fire a hair before their deadline
+            now = max(loop.time(), self.queue[0][0])
+            due = []
+            while self.queue and self.queue[0][0] <= now:
+                due.append(heapq.heappop(self.queue)[2])
+            for race in due:
+                # The bot left or was removed mid race
+                if race.done.done():
+                    continue
+                try:
+                    await self.advance(race, now)
+                except Exception as e:
+                    race.done.set_exception(e)
+                    continue
+                if race.index < len(race.moves):
+                    self.schedule(race)
+                else:
+                    race.done.set_result(None)
+
+    async def advance(self, race: SledRace, now: float):
+        first, last = race.index, race.index
+        while last + 1 < len(race.moves) and race.deadline(last + 1) <= now:
+            last += 1
+        if now - race.deadline(first) > self.merge_lateness:
+            self.outcomes["merged"] += last - first
+            first = last
+        for x, y, time in race.moves[first:last + 1]:
+            await race.send(x, y, time)
+            self.outcomes["sent"] += 1
+        race.index = last + 1
+
+
 class SledRacing:
     room_id = 230
-    waddles = {
-        100: {
-            "easy": [
-                [
-                    {"x": 240.0, "y": 366.0, "time": 873.0},
-                    {"x": 220.0, "y": 450.0, "time": 1038.0},
-                    {"x": 2.0, "y": 601.0, "time": 1337.0},
-                    {"x": 2.0, "y": 1169.0, "time": 2460.0},
-                    {"x": 2.0, "y": 1253.0, "time": 2626.0},
-                    {"x": 1.0, "y": 1718.0, "time": 3546.0},
-                    {"x": 2.0, "y": 2137.0, "time": 5419.0},
-                    {"x": 1.0, "y": 2475.0, "time": 6089.0},
-                    {"x": 2.0, "y": 2933.0, "time": 8044.0},
-                    {"x": 2.0, "y": 3754.0, "time": 9668.0},
-                    {"x": 2.0, "y": 3964.0, "time": 10085.0},
-                    {"x": 200.0, "y": 4445.0, "time": 11039.0},
-                    {"x": 180.0, "y": 4529.0, "time": 11206.0},
-                    {"x": 160.0, "y": 4613.0, "time": 11373.0},
-                    {"x": 180.0, "y": 4756.0, "time": 11657.0},
-                    {"x": 200.0, "y": 4841.0, "time": 11825.0},
-                    {"x": 220.0, "y": 4883.0, "time": 11908.0},
-                    {"x": 1.0, "y": 5121.0, "time": 12377.0},
-                    {"x": 200.0, "y": 5475.0, "time": 14116.0},
-                    {"x": 2.0, "y": 5560.0, "time": 14284.0},
-                    {"x": 2.0, "y": 5839.0, "time": 14835.0},
-                    {"x": 180.0, "y": 6093.0, "time": 15337.0},
-                    {"x": 160.0, "y": 6152.0, "time": 15454.0},
-                    {"x": 180.0, "y": 6406.0, "time": 15957.0},
-                    {"x": 2.0, "y": 6550.0, "time": 16240.0},
-                    {"x": 200.0, "y": 6872.0, "time": 16876.0},
-                    {"x": 180.0, "y": 7058.0, "time": 17244.0},
-                    {"x": 160.0, "y": 7210.0, "time": 17545.0},
-                    {"x": 140.0, "y": 7397.0, "time": 17913.0},
-                    {"x": 2.0, "y": 7566.0, "time": 18247.0},
-                    {"x": 160.0, "y": 7711.0, "time": 18532.0},
-                    {"x": 180.0, "y": 7779.0, "time": 18666.0},
-                    {"x": 2.0, "y": 7965.0, "time": 19033.0},
-                    {"x": 2.0, "y": 8346.0, "time": 19786.0},
-                    {"x": 160.0, "y": 8727.0, "time": 20539.0},
-                    {"x": 140.0, "y": 8871.0, "time": 20823.0},
-                    {"x": 2.0, "y": 8956.0, "time": 20991.0},
-                    {"x": 160.0, "y": 9084.0, "time": 21241.0},
-                    {"x": 180.0, "y": 9168.0, "time": 21408.0},
-                    {"x": 200.0, "y": 9319.0, "time": 21709.0},
-                    {"x": 220.0, "y": 9403.0, "time": 21877.0},
-                    {"x": 240.0, "y": 9462.0, "time": 21994.0},
-                    {"x": 260.0, "y": 9546.0, "time": 22161.0},
-                    {"x": 2.0, "y": 9571.0, "time": 22211.0},
-                    {"x": 240.0, "y": 9698.0, "time": 22462.0},
-                    {"x": 220.0, "y": 9799.0, "time": 22663.0},
-                    {"x": 200.0, "y": 9883.0, "time": 22830.0},
-                    {"x": 2.0, "y": 9993.0, "time": 23047.0},
-                    {"x": 2.0, "y": 10647.0, "time": 24336.0},
-                    {"x": 2.0, "y": 11044.0, "time": 25121.0},
-                    {"x": 2.0, "y": 11551.0, "time": 26125.0},
-                    {"x": 180.0, "y": 11763.0, "time": 26543.0},
-                    {"x": 2.0, "y": 11974.0, "time": 26962.0},
-                    {"x": 160.0, "y": 12159.0, "time": 27329.0},
-                    {"x": 460.0, "y": 12243.0, "time": 27496.0},
-                    {"x": 460.0, "y": 12314.0, "time": 27546.0},
-                    {"x": 2.0, "y": 12573.0, "time": 27748.0},
-                    {"x": 1.0, "y": 13133.0, "time": 28500.0},
-                    {"x": 2.0, "y": 13451.0, "time": 30173.0},
-                    {"x": 2.0, "y": 13765.0, "time": 30792.0},
-                    {"x": 2.0, "y": 14740.0, "time": 32715.0},
-                    {"x": 180.0, "y": 14985.0, "time": 33200.0},
-                    {"x": 160.0, "y": 15263.0, "time": 33752.0},
-                    {"x": 2.0, "y": 15364.0, "time": 33951.0},
-                    {"x": 180.0, "y": 15771.0, "time": 34754.0},
-                    {"x": 200.0, "y": 15872.0, "time": 34955.0},
-                    {"x": 2.0, "y": 15957.0, "time": 35123.0},
-                    {"x": 2.0, "y": 16354.0, "time": 35908.0},
-                    {"x": 180.0, "y": 16568.0, "time": 36327.0},
-                    {"x": 2.0, "y": 16764.0, "time": 36713.0},
-                    {"x": 160.0, "y": 16907.0, "time": 36996.0},
-                    {"x": 460.0, "y": 17033.0, "time": 37247.0},
-                    {"x": 460.0, "y": 17104.0, "time": 37297.0},
-                    {"x": 2.0, "y": 17400.0, "time": 37532.0},
-                    {"x": 0.0, "y": 17834.0, "time": 38083.0},
-                ],
-                [
-                    {"x": 240.0, "y": 128.0, "time": 401.0},
-                    {"x": 220.0, "y": 214.0, "time": 569.0},
-                    {"x": 200.0, "y": 324.0, "time": 787.0},
-                    {"x": 180.0, "y": 425.0, "time": 987.0},
-                    {"x": 160.0, "y": 535.0, "time": 1204.0},
-                    {"x": 2.0, "y": 594.0, "time": 1321.0},
-                    {"x": 140.0, "y": 830.0, "time": 1789.0},
-                    {"x": 120.0, "y": 914.0, "time": 1956.0},
-                    {"x": 140.0, "y": 1015.0, "time": 2157.0},
-                    {"x": 160.0, "y": 1101.0, "time": 2325.0},
-                    {"x": 180.0, "y": 1185.0, "time": 2492.0},
-                    {"x": 2.0, "y": 1253.0, "time": 2626.0},
-                    {"x": 200.0, "y": 1499.0, "time": 3111.0},
-                    {"x": 1.0, "y": 1710.0, "time": 3529.0},
-                    {"x": 180.0, "y": 2085.0, "time": 5319.0},
-                    {"x": 2.0, "y": 2152.0, "time": 5453.0},
-                    {"x": 160.0, "y": 2295.0, "time": 5736.0},
-                    {"x": 140.0, "y": 2405.0, "time": 5954.0},
-                    {"x": 160.0, "y": 2573.0, "time": 6288.0},
-                    {"x": 180.0, "y": 2658.0, "time": 6456.0},
-                    {"x": 200.0, "y": 2869.0, "time": 6874.0},
-                    {"x": 2.0, "y": 2953.0, "time": 7041.0},
-                    {"x": 2.0, "y": 3772.0, "time": 8663.0},
-                    {"x": 2.0, "y": 3958.0, "time": 9031.0},
-                    {"x": 2.0, "y": 4761.0, "time": 10620.0},
-                    {"x": 220.0, "y": 4889.0, "time": 10872.0},
-                    {"x": 240.0, "y": 4974.0, "time": 11039.0},
-                    {"x": 1.0, "y": 5117.0, "time": 11322.0},
-                    {"x": 220.0, "y": 5298.0, "time": 12527.0},
-                    {"x": 200.0, "y": 5318.0, "time": 12694.0},
-                    {"x": 2.0, "y": 5565.0, "time": 13246.0},
-                    {"x": 2.0, "y": 5837.0, "time": 13782.0},
-                    {"x": 180.0, "y": 6117.0, "time": 14333.0},
-                    {"x": 200.0, "y": 6448.0, "time": 14986.0},
-                    {"x": 180.0, "y": 7042.0, "time": 16156.0},
-                    {"x": 160.0, "y": 7170.0, "time": 16408.0},
-                    {"x": 2.0, "y": 7550.0, "time": 17161.0},
-                    {"x": 140.0, "y": 7778.0, "time": 17611.0},
-                    {"x": 1.0, "y": 7930.0, "time": 17913.0},
-                    {"x": 160.0, "y": 8181.0, "time": 19452.0},
-                    {"x": 2.0, "y": 8348.0, "time": 19786.0},
-                    {"x": 140.0, "y": 8812.0, "time": 20705.0},
-                    {"x": 2.0, "y": 8956.0, "time": 20990.0},
-                    {"x": 160.0, "y": 9083.0, "time": 21241.0},
-                    {"x": 180.0, "y": 9251.0, "time": 21575.0},
-                    {"x": 200.0, "y": 9377.0, "time": 21827.0},
-                    {"x": 220.0, "y": 9436.0, "time": 21943.0},
-                    {"x": 240.0, "y": 9520.0, "time": 22110.0},
-                    {"x": 2.0, "y": 9563.0, "time": 22195.0},
-                    {"x": 220.0, "y": 9799.0, "time": 22662.0},
-                    {"x": 200.0, "y": 9900.0, "time": 22863.0},
-                    {"x": 2.0, "y": 10010.0, "time": 23080.0},
-                    {"x": 2.0, "y": 10636.0, "time": 24318.0},
-                    {"x": 2.0, "y": 11040.0, "time": 25121.0},
-                    {"x": 2.0, "y": 11564.0, "time": 26158.0},
-                    {"x": 2.0, "y": 11962.0, "time": 26944.0},
-                    {"x": 220.0, "y": 12132.0, "time": 27281.0},
-                    {"x": 2.0, "y": 12958.0, "time": 28917.0},
-                    {"x": 240.0, "y": 13077.0, "time": 29151.0},
-                    {"x": 2.0, "y": 13161.0, "time": 29318.0},
-                    {"x": 220.0, "y": 13331.0, "time": 29654.0},
-                    {"x": 2.0, "y": 13440.0, "time": 29871.0},
-                    {"x": 2.0, "y": 13752.0, "time": 30490.0},
-                    {"x": 1.0, "y": 13878.0, "time": 30740.0},
-                    {"x": 2.0, "y": 14748.0, "time": 33500.0},
-                    {"x": 2.0, "y": 15965.0, "time": 35909.0},
-                    {"x": 2.0, "y": 16361.0, "time": 36694.0},
-                    {"x": 2.0, "y": 16766.0, "time": 37498.0},
-                    {"x": 2.0, "y": 17391.0, "time": 38736.0},
-                    {"x": 0.0, "y": 17839.0, "time": 39621.0},
-                ],
-            ],
-            "medium": [
-                [
-                    {"x": 2.0, "y": 593.0, "time": 1321.0},
-                    {"x": 240.0, "y": 1040.0, "time": 2208.0},
-                    {"x": 220.0, "y": 1141.0, "time": 2407.0},
-                    {"x": 2.0, "y": 1167.0, "time": 2458.0},
-                    {"x": 2.0, "y": 1252.0, "time": 2626.0},
-                    {"x": 200.0, "y": 1481.0, "time": 3077.0},
-                    {"x": 180.0, "y": 1566.0, "time": 3244.0},
-                    {"x": 160.0, "y": 1650.0, "time": 3412.0},
-                    {"x": 2.0, "y": 1751.0, "time": 3613.0},
-                    {"x": 180.0, "y": 1919.0, "time": 3946.0},
-                    {"x": 2.0, "y": 2131.0, "time": 4365.0},
-                    {"x": 160.0, "y": 2283.0, "time": 4666.0},
-                    {"x": 180.0, "y": 2597.0, "time": 5285.0},
-                    {"x": 200.0, "y": 2706.0, "time": 5502.0},
-                    {"x": 2.0, "y": 2936.0, "time": 5955.0},
-                    {"x": 2.0, "y": 3757.0, "time": 7577.0},
-                    {"x": 2.0, "y": 3951.0, "time": 7961.0},
-                    {"x": 2.0, "y": 4768.0, "time": 9583.0},
-                    {"x": 180.0, "y": 4955.0, "time": 9951.0},
-                    {"x": 160.0, "y": 5022.0, "time": 10084.0},
-                    {"x": 2.0, "y": 5150.0, "time": 10336.0},
-                    {"x": 180.0, "y": 5293.0, "time": 10620.0},
-                    {"x": 200.0, "y": 5353.0, "time": 10737.0},
-                    {"x": 2.0, "y": 5565.0, "time": 11155.0},
-                    {"x": 2.0, "y": 5844.0, "time": 11707.0},
-                    {"x": 180.0, "y": 6055.0, "time": 12126.0},
-                    {"x": 160.0, "y": 6139.0, "time": 12293.0},
-                    {"x": 180.0, "y": 6408.0, "time": 12828.0},
-                    {"x": 200.0, "y": 6475.0, "time": 12961.0},
-                    {"x": 220.0, "y": 6534.0, "time": 13079.0},
-                    {"x": 240.0, "y": 6593.0, "time": 13196.0},
-                    {"x": 460.0, "y": 6635.0, "time": 13280.0},
-                    {"x": 460.0, "y": 6706.0, "time": 13330.0},
-                    {"x": 2.0, "y": 6966.0, "time": 13531.0},
-                    {"x": 220.0, "y": 7391.0, "time": 14032.0},
-                    {"x": 200.0, "y": 7484.0, "time": 14199.0},
-                    {"x": 1.0, "y": 7510.0, "time": 14250.0},
-                    {"x": 2.0, "y": 7972.0, "time": 16205.0},
-                    {"x": 2.0, "y": 8354.0, "time": 16959.0},
-                    {"x": 180.0, "y": 8712.0, "time": 17661.0},
-                    {"x": 160.0, "y": 8780.0, "time": 17796.0},
-                    {"x": 140.0, "y": 8839.0, "time": 17912.0},
-                    {"x": 2.0, "y": 8964.0, "time": 18162.0},
-                    {"x": 160.0, "y": 9108.0, "time": 18448.0},
-                    {"x": 180.0, "y": 9192.0, "time": 18614.0},
-                    {"x": 200.0, "y": 9234.0, "time": 18697.0},
-                    {"x": 220.0, "y": 9277.0, "time": 18781.0},
-                    {"x": 240.0, "y": 9319.0, "time": 18865.0},
-                    {"x": 460.0, "y": 9345.0, "time": 18916.0},
-                    {"x": 260.0, "y": 9460.0, "time": 18999.0},
-                    {"x": 2.0, "y": 9565.0, "time": 19083.0},
-                    {"x": 240.0, "y": 9953.0, "time": 19501.0},
-                    {"x": 2.0, "y": 10010.0, "time": 19585.0},
-                    {"x": 220.0, "y": 10234.0, "time": 20002.0},
-                    {"x": 200.0, "y": 10319.0, "time": 20169.0},
-                    {"x": 2.0, "y": 10633.0, "time": 20788.0},
-                    {"x": 2.0, "y": 11032.0, "time": 21575.0},
-                    {"x": 2.0, "y": 11565.0, "time": 22628.0},
-                    {"x": 180.0, "y": 11726.0, "time": 22947.0},
-                    {"x": 2.0, "y": 11963.0, "time": 23415.0},
-                    {"x": 160.0, "y": 12107.0, "time": 23698.0},
-                    {"x": 460.0, "y": 12234.0, "time": 23950.0},
-                    {"x": 460.0, "y": 12305.0, "time": 24000.0},
-                    {"x": 2.0, "y": 12564.0, "time": 24200.0},
-                    {"x": 180.0, "y": 12851.0, "time": 24502.0},
-                    {"x": 200.0, "y": 12936.0, "time": 24618.0},
-                    {"x": 220.0, "y": 12991.0, "time": 24703.0},
-                    {"x": 240.0, "y": 13040.0, "time": 24786.0},
-                    {"x": 260.0, "y": 13084.0, "time": 24869.0},
-                    {"x": 2.0, "y": 13152.0, "time": 25003.0},
-                    {"x": 240.0, "y": 13313.0, "time": 25321.0},
-                    {"x": 220.0, "y": 13381.0, "time": 25455.0},
-                    {"x": 2.0, "y": 13441.0, "time": 25573.0},
-                    {"x": 200.0, "y": 13550.0, "time": 25790.0},
-                    {"x": 180.0, "y": 13609.0, "time": 25907.0},
-                    {"x": 160.0, "y": 13677.0, "time": 26041.0},
-                    {"x": 2.0, "y": 13761.0, "time": 26207.0},
-                    {"x": 180.0, "y": 14159.0, "time": 26994.0},
-                    {"x": 200.0, "y": 14268.0, "time": 27211.0},
-                    {"x": 2.0, "y": 14754.0, "time": 28165.0},
-                    {"x": 220.0, "y": 15930.0, "time": 30490.0},
-                    {"x": 2.0, "y": 15955.0, "time": 30540.0},
-                    {"x": 200.0, "y": 16184.0, "time": 30991.0},
-                    {"x": 2.0, "y": 16353.0, "time": 31326.0},
-                    {"x": 180.0, "y": 16522.0, "time": 31660.0},
-                    {"x": 2.0, "y": 16757.0, "time": 32128.0},
-                    {"x": 160.0, "y": 16900.0, "time": 32412.0},
-                    {"x": 460.0, "y": 17044.0, "time": 32697.0},
-                    {"x": 460.0, "y": 17115.0, "time": 32747.0},
-                    {"x": 2.0, "y": 17430.0, "time": 32999.0},
-                    {"x": 0.0, "y": 17848.0, "time": 33533.0},
-                    {"x": 180.0, "y": 17848.0, "time": 33533.0},
-                ],
-                [
-                    {"x": 240.0, "y": 387.0, "time": 919.0},
-                    {"x": 220.0, "y": 472.0, "time": 1086.0},
-                    {"x": 200.0, "y": 557.0, "time": 1254.0},
-                    {"x": 2.0, "y": 599.0, "time": 1338.0},
-                    {"x": 180.0, "y": 826.0, "time": 1789.0},
-                    {"x": 160.0, "y": 910.0, "time": 1956.0},
-                    {"x": 2.0, "y": 1231.0, "time": 2593.0},
-                    {"x": 140.0, "y": 1519.0, "time": 3162.0},
-                    {"x": 2.0, "y": 1755.0, "time": 3628.0},
-                    {"x": 160.0, "y": 1882.0, "time": 3880.0},
-                    {"x": 2.0, "y": 2136.0, "time": 4382.0},
-                    {"x": 180.0, "y": 2600.0, "time": 5301.0},
-                    {"x": 200.0, "y": 2702.0, "time": 5502.0},
-                    {"x": 2.0, "y": 2955.0, "time": 6004.0},
-                    {"x": 2.0, "y": 3758.0, "time": 7593.0},
-                    {"x": 2.0, "y": 3960.0, "time": 7994.0},
-                    {"x": 2.0, "y": 4766.0, "time": 9583.0},
-                    {"x": 180.0, "y": 4919.0, "time": 9884.0},
-                    {"x": 160.0, "y": 5063.0, "time": 10168.0},
-                    {"x": 2.0, "y": 5165.0, "time": 10370.0},
-                    {"x": 180.0, "y": 5442.0, "time": 10921.0},
-                    {"x": 2.0, "y": 5569.0, "time": 11172.0},
-                    {"x": 2.0, "y": 5840.0, "time": 11707.0},
-                    {"x": 160.0, "y": 6162.0, "time": 12343.0},
-                    {"x": 180.0, "y": 6348.0, "time": 12711.0},
-                    {"x": 200.0, "y": 6517.0, "time": 13045.0},
-                    {"x": 2.0, "y": 6534.0, "time": 13079.0},
-                    {"x": 220.0, "y": 6601.0, "time": 13212.0},
-                    {"x": 240.0, "y": 6660.0, "time": 13329.0},
-                    {"x": 460.0, "y": 6686.0, "time": 13380.0},
-                    {"x": 460.0, "y": 6734.0, "time": 13414.0},
-                    {"x": 2.0, "y": 6956.0, "time": 13581.0},
-                    {"x": 220.0, "y": 7213.0, "time": 13831.0},
-                    {"x": 1.0, "y": 7284.0, "time": 13915.0},
-                    {"x": 200.0, "y": 7468.0, "time": 15203.0},
-                    {"x": 180.0, "y": 7496.0, "time": 15337.0},
-                    {"x": 160.0, "y": 7523.0, "time": 15420.0},
-                    {"x": 2.0, "y": 7560.0, "time": 15504.0},
-                    {"x": 180.0, "y": 7745.0, "time": 15873.0},
-                    {"x": 200.0, "y": 7871.0, "time": 16122.0},
-                    {"x": 2.0, "y": 7957.0, "time": 16291.0},
-                    {"x": 180.0, "y": 8211.0, "time": 16791.0},
-                    {"x": 2.0, "y": 8339.0, "time": 17043.0},
-                    {"x": 160.0, "y": 8736.0, "time": 17829.0},
-                    {"x": 2.0, "y": 8972.0, "time": 18296.0},
-                    {"x": 180.0, "y": 9099.0, "time": 18548.0},
-                    {"x": 200.0, "y": 9184.0, "time": 18715.0},
-                    {"x": 220.0, "y": 9243.0, "time": 18832.0},
-                    {"x": 240.0, "y": 9311.0, "time": 18965.0},
-                    {"x": 460.0, "y": 9329.0, "time": 19000.0},
-                    {"x": 260.0, "y": 9446.0, "time": 19084.0},
-                    {"x": 2.0, "y": 9608.0, "time": 19217.0},
-                    {"x": 240.0, "y": 9850.0, "time": 19467.0},
-                    {"x": 2.0, "y": 9998.0, "time": 19668.0},
-                    {"x": 220.0, "y": 10283.0, "time": 20203.0},
-                    {"x": 200.0, "y": 10411.0, "time": 20455.0},
-                    {"x": 2.0, "y": 10648.0, "time": 20923.0},
-                    {"x": 2.0, "y": 11046.0, "time": 21710.0},
-                    {"x": 2.0, "y": 11553.0, "time": 22712.0},
-                    {"x": 2.0, "y": 11952.0, "time": 23499.0},
-                    {"x": 180.0, "y": 12103.0, "time": 23799.0},
-                    {"x": 160.0, "y": 12188.0, "time": 23967.0},
-                    {"x": 460.0, "y": 12230.0, "time": 24050.0},
-                    {"x": 460.0, "y": 12278.0, "time": 24084.0},
-                    {"x": 460.0, "y": 12349.0, "time": 24134.0},
-                    {"x": 2.0, "y": 12570.0, "time": 24302.0},
-                    {"x": 180.0, "y": 12944.0, "time": 24703.0},
-                    {"x": 1.0, "y": 13124.0, "time": 25003.0},
-                    {"x": 160.0, "y": 13376.0, "time": 26543.0},
-                    {"x": 2.0, "y": 13441.0, "time": 26677.0},
-                    {"x": 2.0, "y": 13754.0, "time": 27295.0},
-                    {"x": 2.0, "y": 14731.0, "time": 29219.0},
-                    {"x": 180.0, "y": 14976.0, "time": 29703.0},
-                    {"x": 2.0, "y": 15358.0, "time": 30456.0},
-                    {"x": 200.0, "y": 15908.0, "time": 31544.0},
-                    {"x": 2.0, "y": 15950.0, "time": 31627.0},
-                    {"x": 220.0, "y": 16118.0, "time": 31961.0},
-                    {"x": 2.0, "y": 16372.0, "time": 32463.0},
-                    {"x": 200.0, "y": 16558.0, "time": 32831.0},
-                    {"x": 2.0, "y": 16752.0, "time": 33216.0},
-                    {"x": 180.0, "y": 16853.0, "time": 33416.0},
-                    {"x": 160.0, "y": 16981.0, "time": 33667.0},
-                    {"x": 460.0, "y": 17048.0, "time": 33801.0},
-                    {"x": 460.0, "y": 17096.0, "time": 33835.0},
-                    {"x": 2.0, "y": 17412.0, "time": 34085.0},
-                    {"x": 0.0, "y": 17833.0, "time": 34620.0},
-                ],
-                [
-                    {"x": 240.0, "y": 281.0, "time": 703.0},
-                    {"x": 220.0, "y": 365.0, "time": 870.0},
-                    {"x": 200.0, "y": 450.0, "time": 1037.0},
-                    {"x": 180.0, "y": 552.0, "time": 1238.0},
-                    {"x": 2.0, "y": 595.0, "time": 1322.0},
-                    {"x": 160.0, "y": 831.0, "time": 1791.0},
-                    {"x": 140.0, "y": 889.0, "time": 1907.0},
-                    {"x": 120.0, "y": 1001.0, "time": 2127.0},
-                    {"x": 140.0, "y": 1712.0, "time": 3529.0},
-                    {"x": 2.0, "y": 1755.0, "time": 3614.0},
-                    {"x": 160.0, "y": 1967.0, "time": 4031.0},
-                    {"x": 180.0, "y": 2052.0, "time": 4198.0},
-                    {"x": 2.0, "y": 2137.0, "time": 4365.0},
-                    {"x": 160.0, "y": 2334.0, "time": 4751.0},
-                    {"x": 180.0, "y": 2519.0, "time": 5119.0},
-                    {"x": 200.0, "y": 2586.0, "time": 5252.0},
-                    {"x": 2.0, "y": 2939.0, "time": 5955.0},
-                    {"x": 2.0, "y": 3760.0, "time": 7577.0},
-                    {"x": 2.0, "y": 3955.0, "time": 7962.0},
-                    {"x": 2.0, "y": 4750.0, "time": 9534.0},
-                    {"x": 180.0, "y": 4919.0, "time": 9868.0},
-                    {"x": 160.0, "y": 5003.0, "time": 10036.0},
-                    {"x": 2.0, "y": 5154.0, "time": 10336.0},
-                    {"x": 180.0, "y": 5323.0, "time": 10671.0},
-                    {"x": 2.0, "y": 5552.0, "time": 11123.0},
-                    {"x": 2.0, "y": 5847.0, "time": 11708.0},
-                    {"x": 200.0, "y": 6456.0, "time": 12913.0},
-                    {"x": 220.0, "y": 6540.0, "time": 13080.0},
-                    {"x": 240.0, "y": 6599.0, "time": 13196.0},
-                    {"x": 460.0, "y": 6641.0, "time": 13280.0},
-                    {"x": 460.0, "y": 6714.0, "time": 13331.0},
-                    {"x": 220.0, "y": 6934.0, "time": 13499.0},
-                    {"x": 2.0, "y": 6972.0, "time": 13532.0},
-                    {"x": 200.0, "y": 7217.0, "time": 13782.0},
-                    {"x": 1.0, "y": 7284.0, "time": 13866.0},
-                    {"x": 180.0, "y": 7474.0, "time": 15204.0},
-                    {"x": 2.0, "y": 7555.0, "time": 15454.0},
-                    {"x": 200.0, "y": 7741.0, "time": 15822.0},
-                    {"x": 2.0, "y": 7954.0, "time": 16241.0},
-                    {"x": 2.0, "y": 8336.0, "time": 16994.0},
-                    {"x": 180.0, "y": 8716.0, "time": 17746.0},
-                    {"x": 160.0, "y": 8800.0, "time": 17913.0},
-                    {"x": 2.0, "y": 8969.0, "time": 18248.0},
-                    {"x": 180.0, "y": 9095.0, "time": 18498.0},
-                    {"x": 200.0, "y": 9180.0, "time": 18666.0},
-                    {"x": 220.0, "y": 9223.0, "time": 18750.0},
-                    {"x": 240.0, "y": 9282.0, "time": 18867.0},
-                    {"x": 460.0, "y": 9308.0, "time": 18918.0},
-                    {"x": 2.0, "y": 9566.0, "time": 19118.0},
-                    {"x": 220.0, "y": 9878.0, "time": 19452.0},
-                    {"x": 2.0, "y": 9993.0, "time": 19619.0},
-                    {"x": 200.0, "y": 10442.0, "time": 20488.0},
-                    {"x": 2.0, "y": 10638.0, "time": 20874.0},
-                    {"x": 2.0, "y": 11036.0, "time": 21659.0},
-                    {"x": 180.0, "y": 11333.0, "time": 22245.0},
-                    {"x": 200.0, "y": 11858.0, "time": 23282.0},
-                    {"x": 2.0, "y": 11967.0, "time": 23499.0},
-                    {"x": 180.0, "y": 12111.0, "time": 23783.0},
-                    {"x": 160.0, "y": 12196.0, "time": 23952.0},
-                    {"x": 460.0, "y": 12238.0, "time": 24034.0},
-                    {"x": 460.0, "y": 12309.0, "time": 24084.0},
-                    {"x": 2.0, "y": 12568.0, "time": 24285.0},
-                    {"x": 180.0, "y": 12856.0, "time": 24587.0},
-                    {"x": 200.0, "y": 12918.0, "time": 24670.0},
-                    {"x": 2.0, "y": 12974.0, "time": 24753.0},
-                    {"x": 1.0, "y": 13114.0, "time": 25005.0},
-                    {"x": 180.0, "y": 13362.0, "time": 26544.0},
-                    {"x": 2.0, "y": 13444.0, "time": 26710.0},
-                    {"x": 160.0, "y": 13529.0, "time": 26878.0},
-                    {"x": 2.0, "y": 13758.0, "time": 27329.0},
-                    {"x": 180.0, "y": 14140.0, "time": 28082.0},
-                    {"x": 200.0, "y": 14495.0, "time": 28784.0},
-                    {"x": 2.0, "y": 14731.0, "time": 29252.0},
-                    {"x": 220.0, "y": 15910.0, "time": 31578.0},
-                    {"x": 2.0, "y": 15952.0, "time": 31661.0},
-                    {"x": 240.0, "y": 16105.0, "time": 31962.0},
-                    {"x": 460.0, "y": 16122.0, "time": 31996.0},
-                    {"x": 2.0, "y": 16403.0, "time": 32213.0},
-                    {"x": 220.0, "y": 16733.0, "time": 32580.0},
-                    {"x": 2.0, "y": 16757.0, "time": 32614.0},
-                    {"x": 200.0, "y": 17015.0, "time": 33083.0},
-                    {"x": 180.0, "y": 17116.0, "time": 33283.0},
-                    {"x": 160.0, "y": 17225.0, "time": 33501.0},
-                    {"x": 2.0, "y": 17395.0, "time": 33835.0},
-                    {"x": 180.0, "y": 17607.0, "time": 34253.0},
-                    {"x": 200.0, "y": 17692.0, "time": 34421.0},
-                    {"x": 0.0, "y": 17835.0, "time": 34704.0},
-                ],
-            ],
-            "hard": [
-                [
-                    {"x": 240.0, "y": 75.0, "time": 301.0},
-                    {"x": 220.0, "y": 157.0, "time": 468.0},
-                    {"x": 200.0, "y": 241.0, "time": 636.0},
-                    {"x": 180.0, "y": 300.0, "time": 752.0},
-                    {"x": 160.0, "y": 386.0, "time": 920.0},
-                    {"x": 140.0, "y": 454.0, "time": 1054.0},
-                    {"x": 120.0, "y": 514.0, "time": 1171.0},
-                    {"x": 2.0, "y": 598.0, "time": 1338.0},
-                    {"x": 2.0, "y": 1758.0, "time": 3629.0},
-                    {"x": 140.0, "y": 1886.0, "time": 3881.0},
-                    {"x": 160.0, "y": 1953.0, "time": 4014.0},
-                    {"x": 180.0, "y": 2055.0, "time": 4215.0},
-                    {"x": 2.0, "y": 2140.0, "time": 4383.0},
-                    {"x": 160.0, "y": 2326.0, "time": 4750.0},
-                    {"x": 180.0, "y": 2606.0, "time": 5302.0},
-                    {"x": 200.0, "y": 2665.0, "time": 5419.0},
-                    {"x": 2.0, "y": 2945.0, "time": 5971.0},
-                    {"x": 2.0, "y": 3766.0, "time": 7594.0},
-                    {"x": 2.0, "y": 3951.0, "time": 7962.0},
-                    {"x": 2.0, "y": 4757.0, "time": 9551.0},
-                    {"x": 180.0, "y": 4903.0, "time": 9839.0},
-                    {"x": 160.0, "y": 4985.0, "time": 10001.0},
-                    {"x": 2.0, "y": 5155.0, "time": 10336.0},
-                    {"x": 180.0, "y": 5323.0, "time": 10671.0},
-                    {"x": 200.0, "y": 5449.0, "time": 10922.0},
-                    {"x": 2.0, "y": 5558.0, "time": 11139.0},
-                    {"x": 2.0, "y": 5846.0, "time": 11708.0},
-                    {"x": 180.0, "y": 6101.0, "time": 12210.0},
-                    {"x": 160.0, "y": 6168.0, "time": 12343.0},
-                    {"x": 180.0, "y": 6312.0, "time": 12627.0},
-                    {"x": 200.0, "y": 6397.0, "time": 12795.0},
-                    {"x": 220.0, "y": 6465.0, "time": 12929.0},
-                    {"x": 240.0, "y": 6524.0, "time": 13046.0},
-                    {"x": 260.0, "y": 6566.0, "time": 13129.0},
-                    {"x": 460.0, "y": 6634.0, "time": 13263.0},
-                    {"x": 460.0, "y": 6681.0, "time": 13296.0},
-                    {"x": 240.0, "y": 6863.0, "time": 13430.0},
-                    {"x": 220.0, "y": 6999.0, "time": 13548.0},
-                    {"x": 200.0, "y": 7161.0, "time": 13715.0},
-                    {"x": 180.0, "y": 7255.0, "time": 13831.0},
-                    {"x": 160.0, "y": 7316.0, "time": 13916.0},
-                    {"x": 140.0, "y": 7418.0, "time": 14082.0},
-                    {"x": 120.0, "y": 7505.0, "time": 14250.0},
-                    {"x": 2.0, "y": 7573.0, "time": 14383.0},
-                    {"x": 140.0, "y": 7716.0, "time": 14667.0},
-                    {"x": 160.0, "y": 7784.0, "time": 14802.0},
-                    {"x": 180.0, "y": 7844.0, "time": 14920.0},
-                    {"x": 200.0, "y": 7911.0, "time": 15053.0},
-                    {"x": 2.0, "y": 7954.0, "time": 15137.0},
-                    {"x": 180.0, "y": 8142.0, "time": 15507.0},
-                    {"x": 2.0, "y": 8334.0, "time": 15888.0},
-                    {"x": 160.0, "y": 8776.0, "time": 16759.0},
-                    {"x": 2.0, "y": 8962.0, "time": 17127.0},
-                    {"x": 180.0, "y": 9131.0, "time": 17460.0},
-                    {"x": 200.0, "y": 9200.0, "time": 17596.0},
-                    {"x": 220.0, "y": 9258.0, "time": 17712.0},
-                    {"x": 240.0, "y": 9300.0, "time": 17796.0},
-                    {"x": 460.0, "y": 9325.0, "time": 17845.0},
-                    {"x": 260.0, "y": 9484.0, "time": 17963.0},
-                    {"x": 2.0, "y": 9583.0, "time": 18046.0},
-                    {"x": 240.0, "y": 9896.0, "time": 18381.0},
-                    {"x": 220.0, "y": 9978.0, "time": 18498.0},
-                    {"x": 2.0, "y": 10009.0, "time": 18548.0},
-                    {"x": 200.0, "y": 10270.0, "time": 19050.0},
-                    {"x": 2.0, "y": 10650.0, "time": 19803.0},
-                    {"x": 2.0, "y": 11033.0, "time": 20556.0},
-                    {"x": 2.0, "y": 11558.0, "time": 21593.0},
-                    {"x": 2.0, "y": 11954.0, "time": 22378.0},
-                    {"x": 180.0, "y": 12080.0, "time": 22629.0},
-                    {"x": 160.0, "y": 12147.0, "time": 22763.0},
-                    {"x": 460.0, "y": 12232.0, "time": 22931.0},
-                    {"x": 460.0, "y": 12279.0, "time": 22964.0},
-                    {"x": 180.0, "y": 12461.0, "time": 23098.0},
-                    {"x": 2.0, "y": 12559.0, "time": 23181.0},
-                    {"x": 200.0, "y": 12728.0, "time": 23348.0},
-                    {"x": 220.0, "y": 12787.0, "time": 23415.0},
-                    {"x": 240.0, "y": 12853.0, "time": 23499.0},
-                    {"x": 2.0, "y": 12968.0, "time": 23667.0},
-                    {"x": 2.0, "y": 13169.0, "time": 24051.0},
-                    {"x": 220.0, "y": 13381.0, "time": 24469.0},
-                    {"x": 2.0, "y": 13440.0, "time": 24586.0},
-                    {"x": 200.0, "y": 13525.0, "time": 24754.0},
-                    {"x": 180.0, "y": 13610.0, "time": 24920.0},
-                    {"x": 160.0, "y": 13678.0, "time": 25054.0},
-                    {"x": 2.0, "y": 13762.0, "time": 25221.0},
-                    {"x": 180.0, "y": 14091.0, "time": 25873.0},
-                    {"x": 200.0, "y": 14177.0, "time": 26041.0},
-                    {"x": 2.0, "y": 14752.0, "time": 27179.0},
-                    {"x": 2.0, "y": 15955.0, "time": 29554.0},
-                    {"x": 2.0, "y": 16351.0, "time": 30339.0},
-                    {"x": 180.0, "y": 16536.0, "time": 30707.0},
-                    {"x": 2.0, "y": 16771.0, "time": 31175.0},
-                    {"x": 160.0, "y": 16915.0, "time": 31459.0},
-                    {"x": 140.0, "y": 17000.0, "time": 31627.0},
-                    {"x": 460.0, "y": 17043.0, "time": 31711.0},
-                    {"x": 460.0, "y": 17114.0, "time": 31761.0},
-                    {"x": 2.0, "y": 17427.0, "time": 32012.0},
-                    {"x": 0.0, "y": 17847.0, "time": 32548.0},
-                ]
-            ],
-        },
-        101: {
-            "easy": [
-                [
-                    {"x": 240.0, "y": 326.0, "time": 804.0},
-                    {"x": 220.0, "y": 426.0, "time": 1003.0},
-                    {"x": 200.0, "y": 637.0, "time": 1421.0},
-                    {"x": 1.0, "y": 1315.0, "time": 2760.0},
-                    {"x": 2.0, "y": 1732.0, "time": 4633.0},
-                    {"x": 2.0, "y": 1961.0, "time": 5084.0},
-                    {"x": 2.0, "y": 3165.0, "time": 7459.0},
-                    {"x": 220.0, "y": 3334.0, "time": 7794.0},
-                    {"x": 240.0, "y": 3419.0, "time": 7962.0},
-                    {"x": 460.0, "y": 3444.0, "time": 8012.0},
-                    {"x": 460.0, "y": 3491.0, "time": 8045.0},
-                    {"x": 2.0, "y": 4141.0, "time": 8681.0},
-                    {"x": 220.0, "y": 4386.0, "time": 9132.0},
-                    {"x": 200.0, "y": 4470.0, "time": 9300.0},
-                    {"x": 2.0, "y": 4495.0, "time": 9349.0},
-                    {"x": 1.0, "y": 4514.0, "time": 9386.0},
-                    {"x": 220.0, "y": 4891.0, "time": 11172.0},
-                    {"x": 240.0, "y": 5018.0, "time": 11423.0},
-                    {"x": 1.0, "y": 5129.0, "time": 11645.0},
-                    {"x": 2.0, "y": 5562.0, "time": 13547.0},
-                    {"x": 220.0, "y": 5714.0, "time": 13848.0},
-                    {"x": 2.0, "y": 5756.0, "time": 13932.0},
-                    {"x": 2.0, "y": 6791.0, "time": 15972.0},
-                    {"x": 2.0, "y": 7330.0, "time": 17043.0},
-                    {"x": 2.0, "y": 8158.0, "time": 18682.0},
-                    {"x": 2.0, "y": 9359.0, "time": 21057.0},
-                    {"x": 1.0, "y": 9672.0, "time": 21676.0},
-                    {"x": 2.0, "y": 10032.0, "time": 23432.0},
-                    {"x": 200.0, "y": 10133.0, "time": 23632.0},
-                    {"x": 180.0, "y": 10235.0, "time": 23833.0},
-                    {"x": 2.0, "y": 10362.0, "time": 24085.0},
-                    {"x": 2.0, "y": 11148.0, "time": 25639.0},
-                    {"x": 160.0, "y": 11318.0, "time": 25976.0},
-                    {"x": 2.0, "y": 11562.0, "time": 26459.0},
-                    {"x": 180.0, "y": 11817.0, "time": 26962.0},
-                    {"x": 2.0, "y": 11969.0, "time": 27262.0},
-                    {"x": 2.0, "y": 12350.0, "time": 28014.0},
-                    {"x": 2.0, "y": 12645.0, "time": 28599.0},
-                    {"x": 160.0, "y": 12934.0, "time": 29168.0},
-                    {"x": 460.0, "y": 13043.0, "time": 29386.0},
-                    {"x": 460.0, "y": 13091.0, "time": 29420.0},
-                    {"x": 2.0, "y": 13539.0, "time": 29804.0},
-                    {"x": 2.0, "y": 13760.0, "time": 30088.0},
-                    {"x": 2.0, "y": 14365.0, "time": 31259.0},
-                    {"x": 2.0, "y": 14831.0, "time": 32178.0},
-                    {"x": 2.0, "y": 15171.0, "time": 32848.0},
-                    {"x": 2.0, "y": 16134.0, "time": 34755.0},
-                    {"x": 180.0, "y": 16979.0, "time": 36428.0},
-                    {"x": 200.0, "y": 17063.0, "time": 36594.0},
-                    {"x": 0.0, "y": 17841.0, "time": 38133.0},
-                ]
-            ],
-            "medium": [
-                [
-                    {"x": 240.0, "y": 224.0, "time": 586.0},
-                    {"x": 260.0, "y": 326.0, "time": 786.0},
-                    {"x": 2.0, "y": 961.0, "time": 2040.0},
-                    {"x": 2.0, "y": 1360.0, "time": 2827.0},
-                    {"x": 2.0, "y": 1740.0, "time": 3579.0},
-                    {"x": 1.0, "y": 2473.0, "time": 5034.0},
-                    {"x": 240.0, "y": 2931.0, "time": 6990.0},
-                    {"x": 220.0, "y": 2999.0, "time": 7125.0},
-                    {"x": 2.0, "y": 3167.0, "time": 7460.0},
-                    {"x": 240.0, "y": 3351.0, "time": 7827.0},
-                    {"x": 460.0, "y": 3436.0, "time": 7996.0},
-                    {"x": 460.0, "y": 3504.0, "time": 8044.0},
-                    {"x": 260.0, "y": 3504.0, "time": 8044.0},
-                    {"x": 2.0, "y": 4136.0, "time": 8664.0},
-                    {"x": 2.0, "y": 4553.0, "time": 9450.0},
-                    {"x": 240.0, "y": 4890.0, "time": 10118.0},
-                    {"x": 220.0, "y": 4976.0, "time": 10286.0},
-                    {"x": 200.0, "y": 5087.0, "time": 10503.0},
-                    {"x": 1.0, "y": 5130.0, "time": 10587.0},
-                    {"x": 2.0, "y": 5550.0, "time": 12459.0},
-                    {"x": 2.0, "y": 5762.0, "time": 12877.0},
-                    {"x": 2.0, "y": 6794.0, "time": 14918.0},
-                    {"x": 2.0, "y": 7342.0, "time": 16006.0},
-                    {"x": 180.0, "y": 7571.0, "time": 16457.0},
-                    {"x": 2.0, "y": 7757.0, "time": 16825.0},
-                    {"x": 200.0, "y": 8095.0, "time": 17494.0},
-                    {"x": 2.0, "y": 8162.0, "time": 17628.0},
-                    {"x": 220.0, "y": 9150.0, "time": 19585.0},
-                    {"x": 2.0, "y": 9361.0, "time": 20002.0},
-                    {"x": 240.0, "y": 9547.0, "time": 20370.0},
-                    {"x": 220.0, "y": 9784.0, "time": 20839.0},
-                    {"x": 2.0, "y": 10055.0, "time": 21375.0},
-                    {"x": 200.0, "y": 10114.0, "time": 21492.0},
-                    {"x": 180.0, "y": 10240.0, "time": 21742.0},
-                    {"x": 2.0, "y": 10350.0, "time": 21960.0},
-                    {"x": 200.0, "y": 11107.0, "time": 23449.0},
-                    {"x": 2.0, "y": 11131.0, "time": 23497.0},
-                    {"x": 180.0, "y": 11300.0, "time": 23833.0},
-                    {"x": 2.0, "y": 11553.0, "time": 24335.0},
-                    {"x": 200.0, "y": 11765.0, "time": 24752.0},
-                    {"x": 2.0, "y": 11951.0, "time": 25121.0},
-                    {"x": 2.0, "y": 12374.0, "time": 25957.0},
-                    {"x": 2.0, "y": 12645.0, "time": 26492.0},
-                    {"x": 180.0, "y": 12940.0, "time": 27078.0},
-                    {"x": 160.0, "y": 13091.0, "time": 27379.0},
-                    {"x": 460.0, "y": 13108.0, "time": 27412.0},
-                    {"x": 2.0, "y": 13558.0, "time": 27797.0},
-                    {"x": 180.0, "y": 13722.0, "time": 27998.0},
-                    {"x": 2.0, "y": 13757.0, "time": 28049.0},
-                    {"x": 160.0, "y": 14187.0, "time": 28867.0},
-                    {"x": 140.0, "y": 14272.0, "time": 29034.0},
-                    {"x": 2.0, "y": 14356.0, "time": 29202.0},
-                    {"x": 160.0, "y": 15019.0, "time": 30506.0},
-                    {"x": 2.0, "y": 15163.0, "time": 30791.0},
-                    {"x": 180.0, "y": 15332.0, "time": 31125.0},
-                    {"x": 2.0, "y": 15374.0, "time": 31208.0},
-                    {"x": 200.0, "y": 15518.0, "time": 31493.0},
-                    {"x": 180.0, "y": 15670.0, "time": 31794.0},
-                    {"x": 160.0, "y": 15771.0, "time": 31994.0},
-                    {"x": 2.0, "y": 16135.0, "time": 32715.0},
-                    {"x": 180.0, "y": 16574.0, "time": 33584.0},
-                    {"x": 2.0, "y": 16760.0, "time": 33951.0},
-                    {"x": 160.0, "y": 16888.0, "time": 34203.0},
-                    {"x": 460.0, "y": 17040.0, "time": 34504.0},
-                    {"x": 460.0, "y": 17088.0, "time": 34538.0},
-                    {"x": 0.0, "y": 17853.0, "time": 35373.0},
-                ],
-                [
-                    {"x": 2.0, "y": 958.0, "time": 2039.0},
-                    {"x": 2.0, "y": 1357.0, "time": 2827.0},
-                    {"x": 2.0, "y": 1738.0, "time": 3579.0},
-                    {"x": 240.0, "y": 2330.0, "time": 4751.0},
-                    {"x": 220.0, "y": 2413.0, "time": 4917.0},
-                    {"x": 200.0, "y": 2540.0, "time": 5167.0},
-                    {"x": 2.0, "y": 3166.0, "time": 6405.0},
-                    {"x": 180.0, "y": 3418.0, "time": 6908.0},
-                    {"x": 200.0, "y": 3696.0, "time": 7459.0},
-                    {"x": 2.0, "y": 4134.0, "time": 8328.0},
-                    {"x": 180.0, "y": 4345.0, "time": 8747.0},
-                    {"x": 200.0, "y": 4430.0, "time": 8914.0},
-                    {"x": 220.0, "y": 4490.0, "time": 9032.0},
-                    {"x": 2.0, "y": 4557.0, "time": 9165.0},
-                    {"x": 200.0, "y": 4937.0, "time": 9917.0},
-                    {"x": 180.0, "y": 5021.0, "time": 10085.0},
-                    {"x": 160.0, "y": 5080.0, "time": 10202.0},
-                    {"x": 2.0, "y": 5164.0, "time": 10369.0},
-                    {"x": 180.0, "y": 5392.0, "time": 10821.0},
-                    {"x": 2.0, "y": 5562.0, "time": 11156.0},
-                    {"x": 2.0, "y": 5757.0, "time": 11540.0},
-                    {"x": 2.0, "y": 6790.0, "time": 13580.0},
-                    {"x": 200.0, "y": 7214.0, "time": 14416.0},
-                    {"x": 2.0, "y": 7342.0, "time": 14668.0},
-                    {"x": 180.0, "y": 7597.0, "time": 15169.0},
-                    {"x": 160.0, "y": 7699.0, "time": 15370.0},
-                    {"x": 2.0, "y": 7766.0, "time": 15503.0},
-                    {"x": 180.0, "y": 7951.0, "time": 15872.0},
-                    {"x": 200.0, "y": 8052.0, "time": 16072.0},
-                    {"x": 2.0, "y": 8162.0, "time": 16290.0},
-                    {"x": 220.0, "y": 9125.0, "time": 18197.0},
-                    {"x": 240.0, "y": 9210.0, "time": 18364.0},
-                    {"x": 260.0, "y": 9277.0, "time": 18497.0},
-                    {"x": 2.0, "y": 9362.0, "time": 18665.0},
-                    {"x": 240.0, "y": 9803.0, "time": 19534.0},
-                    {"x": 220.0, "y": 9888.0, "time": 19702.0},
-                    {"x": 200.0, "y": 9998.0, "time": 19918.0},
-                    {"x": 2.0, "y": 10041.0, "time": 20003.0},
-                    {"x": 180.0, "y": 10143.0, "time": 20203.0},
-                    {"x": 160.0, "y": 10245.0, "time": 20405.0},
-                    {"x": 2.0, "y": 10355.0, "time": 20622.0},
-                    {"x": 180.0, "y": 10904.0, "time": 21709.0},
-                    {"x": 200.0, "y": 11006.0, "time": 21909.0},
-                    {"x": 2.0, "y": 11133.0, "time": 22161.0},
-                    {"x": 180.0, "y": 11301.0, "time": 22494.0},
-                    {"x": 160.0, "y": 11404.0, "time": 22695.0},
-                    {"x": 2.0, "y": 11555.0, "time": 22997.0},
-                    {"x": 180.0, "y": 11724.0, "time": 23331.0},
-                    {"x": 200.0, "y": 11808.0, "time": 23498.0},
-                    {"x": 2.0, "y": 11952.0, "time": 23783.0},
-                    {"x": 2.0, "y": 12357.0, "time": 24586.0},
-                    {"x": 2.0, "y": 12646.0, "time": 25155.0},
-                    {"x": 220.0, "y": 12923.0, "time": 25706.0},
-                    {"x": 200.0, "y": 13304.0, "time": 26458.0},
-                    {"x": 2.0, "y": 13533.0, "time": 26910.0},
-                    {"x": 2.0, "y": 13769.0, "time": 27379.0},
-                    {"x": 220.0, "y": 14166.0, "time": 28164.0},
-                    {"x": 240.0, "y": 14268.0, "time": 28365.0},
-                    {"x": 260.0, "y": 14336.0, "time": 28499.0},
-                    {"x": 2.0, "y": 14353.0, "time": 28533.0},
-                    {"x": 2.0, "y": 14843.0, "time": 29502.0},
-                    {"x": 240.0, "y": 14944.0, "time": 29703.0},
-                    {"x": 220.0, "y": 15004.0, "time": 29821.0},
-                    {"x": 200.0, "y": 15072.0, "time": 29955.0},
-                    {"x": 2.0, "y": 15156.0, "time": 30121.0},
-                    {"x": 2.0, "y": 15368.0, "time": 30539.0},
-                    {"x": 220.0, "y": 15707.0, "time": 31208.0},
-                    {"x": 240.0, "y": 15766.0, "time": 31326.0},
-                    {"x": 260.0, "y": 15851.0, "time": 31494.0},
-                    {"x": 2.0, "y": 16146.0, "time": 32078.0},
-                    {"x": 240.0, "y": 16315.0, "time": 32412.0},
-                    {"x": 220.0, "y": 16417.0, "time": 32613.0},
-                    {"x": 2.0, "y": 16755.0, "time": 33283.0},
-                    {"x": 240.0, "y": 16865.0, "time": 33500.0},
-                    {"x": 0.0, "y": 17830.0, "time": 35407.0},
-                ],
-            ],
-            "hard": [
-                [
-                    {"x": 2.0, "y": 951.0, "time": 2040.0},
-                    {"x": 2.0, "y": 1358.0, "time": 2843.0},
-                    {"x": 2.0, "y": 1737.0, "time": 3597.0},
-                    {"x": 240.0, "y": 2235.0, "time": 4582.0},
-                    {"x": 220.0, "y": 2364.0, "time": 4834.0},
-                    {"x": 240.0, "y": 2491.0, "time": 5084.0},
-                    {"x": 260.0, "y": 2576.0, "time": 5252.0},
-                    {"x": 280.0, "y": 2702.0, "time": 5503.0},
-                    {"x": 260.0, "y": 2957.0, "time": 6004.0},
-                    {"x": 240.0, "y": 3042.0, "time": 6172.0},
-                    {"x": 220.0, "y": 3126.0, "time": 6339.0},
-                    {"x": 2.0, "y": 3151.0, "time": 6389.0},
-                    {"x": 240.0, "y": 3295.0, "time": 6673.0},
-                    {"x": 260.0, "y": 3381.0, "time": 6841.0},
-                    {"x": 460.0, "y": 3441.0, "time": 6958.0},
-                    {"x": 460.0, "y": 3512.0, "time": 7008.0},
-                    {"x": 240.0, "y": 4082.0, "time": 7544.0},
-                    {"x": 2.0, "y": 4141.0, "time": 7626.0},
-                    {"x": 260.0, "y": 4373.0, "time": 8045.0},
-                    {"x": 2.0, "y": 4567.0, "time": 8430.0},
-                    {"x": 240.0, "y": 4781.0, "time": 8851.0},
-                    {"x": 220.0, "y": 4864.0, "time": 9015.0},
-                    {"x": 200.0, "y": 4940.0, "time": 9165.0},
-                    {"x": 180.0, "y": 5024.0, "time": 9332.0},
-                    {"x": 160.0, "y": 5093.0, "time": 9467.0},
-                    {"x": 2.0, "y": 5152.0, "time": 9583.0},
-                    {"x": 180.0, "y": 5305.0, "time": 9885.0},
-                    {"x": 200.0, "y": 5365.0, "time": 10002.0},
-                    {"x": 2.0, "y": 5559.0, "time": 10387.0},
-                    {"x": 2.0, "y": 5770.0, "time": 10804.0},
-                    {"x": 2.0, "y": 6802.0, "time": 12845.0},
-                    {"x": 2.0, "y": 7344.0, "time": 13915.0},
-                    {"x": 180.0, "y": 7471.0, "time": 14166.0},
-                    {"x": 160.0, "y": 7598.0, "time": 14417.0},
-                    {"x": 2.0, "y": 7750.0, "time": 14718.0},
-                    {"x": 180.0, "y": 7894.0, "time": 15003.0},
-                    {"x": 200.0, "y": 8004.0, "time": 15220.0},
-                    {"x": 2.0, "y": 8173.0, "time": 15554.0},
-                    {"x": 220.0, "y": 9139.0, "time": 17461.0},
-                    {"x": 240.0, "y": 9223.0, "time": 17629.0},
-                    {"x": 260.0, "y": 9290.0, "time": 17761.0},
-                    {"x": 2.0, "y": 9350.0, "time": 17879.0},
-                    {"x": 240.0, "y": 9791.0, "time": 18749.0},
-                    {"x": 220.0, "y": 9876.0, "time": 18916.0},
-                    {"x": 200.0, "y": 9961.0, "time": 19083.0},
-                    {"x": 2.0, "y": 10046.0, "time": 19251.0},
-                    {"x": 180.0, "y": 10156.0, "time": 19468.0},
-                    {"x": 160.0, "y": 10299.0, "time": 19753.0},
-                    {"x": 2.0, "y": 10367.0, "time": 19887.0},
-                    {"x": 180.0, "y": 10620.0, "time": 20388.0},
-                    {"x": 200.0, "y": 10807.0, "time": 20756.0},
-                    {"x": 2.0, "y": 11145.0, "time": 21424.0},
-                    {"x": 180.0, "y": 11273.0, "time": 21677.0},
-                    {"x": 160.0, "y": 11357.0, "time": 21844.0},
-                    {"x": 2.0, "y": 11568.0, "time": 22261.0},
-                    {"x": 180.0, "y": 11779.0, "time": 22679.0},
-                    {"x": 200.0, "y": 11864.0, "time": 22847.0},
-                    {"x": 2.0, "y": 11965.0, "time": 23048.0},
-                    {"x": 2.0, "y": 12364.0, "time": 23834.0},
-                    {"x": 2.0, "y": 12642.0, "time": 24385.0},
-                    {"x": 180.0, "y": 12871.0, "time": 24837.0},
-                    {"x": 160.0, "y": 12997.0, "time": 25088.0},
-                    {"x": 460.0, "y": 13039.0, "time": 25171.0},
-                    {"x": 460.0, "y": 13112.0, "time": 25222.0},
-                    {"x": 180.0, "y": 13425.0, "time": 25472.0},
-                    {"x": 2.0, "y": 13544.0, "time": 25591.0},
-                    {"x": 2.0, "y": 13764.0, "time": 25873.0},
-                    {"x": 160.0, "y": 14159.0, "time": 26627.0},
-                    {"x": 140.0, "y": 14243.0, "time": 26794.0},
-                    {"x": 2.0, "y": 14352.0, "time": 27011.0},
-                    {"x": 160.0, "y": 14454.0, "time": 27212.0},
-                    {"x": 180.0, "y": 14539.0, "time": 27379.0},
-                    {"x": 200.0, "y": 14606.0, "time": 27513.0},
-                    {"x": 2.0, "y": 14834.0, "time": 27965.0},
-                    {"x": 180.0, "y": 14961.0, "time": 28215.0},
-                    {"x": 2.0, "y": 15172.0, "time": 28634.0},
-                    {"x": 2.0, "y": 15358.0, "time": 29002.0},
-                    {"x": 160.0, "y": 15696.0, "time": 29670.0},
-                    {"x": 140.0, "y": 15807.0, "time": 29888.0},
-                    {"x": 160.0, "y": 15934.0, "time": 30138.0},
-                    {"x": 180.0, "y": 16036.0, "time": 30339.0},
-                    {"x": 200.0, "y": 16103.0, "time": 30473.0},
-                    {"x": 2.0, "y": 16145.0, "time": 30557.0},
-                    {"x": 2.0, "y": 16754.0, "time": 31761.0},
-                    {"x": 180.0, "y": 16855.0, "time": 31962.0},
-                    {"x": 160.0, "y": 16939.0, "time": 32129.0},
-                    {"x": 460.0, "y": 17050.0, "time": 32347.0},
-                    {"x": 460.0, "y": 17096.0, "time": 32379.0},
-                    {"x": 180.0, "y": 17378.0, "time": 32597.0},
-                    {"x": 200.0, "y": 17500.0, "time": 32714.0},
-                    {"x": 220.0, "y": 17621.0, "time": 32848.0},
-                    {"x": 0.0, "y": 17839.0, "time": 33165.0},
-                ]
-            ],
-        },
-        102: {
-            "easy": [
-                [
-                    {"x": 240.0, "y": 75.0, "time": 301.0},
-                    {"x": 220.0, "y": 157.0, "time": 468.0},
-                    {"x": 200.0, "y": 242.0, "time": 637.0},
-                    {"x": 180.0, "y": 326.0, "time": 803.0},
-                    {"x": 2.0, "y": 638.0, "time": 1421.0},
-                    {"x": 2.0, "y": 834.0, "time": 1805.0},
-                    {"x": 200.0, "y": 1164.0, "time": 2459.0},
-                    {"x": 220.0, "y": 1231.0, "time": 2592.0},
-                    {"x": 240.0, "y": 1290.0, "time": 2710.0},
-                    {"x": 2.0, "y": 1357.0, "time": 2843.0},
-                    {"x": 220.0, "y": 1544.0, "time": 3211.0},
-                    {"x": 200.0, "y": 1628.0, "time": 3379.0},
-                    {"x": 180.0, "y": 1737.0, "time": 3595.0},
-                    {"x": 2.0, "y": 1754.0, "time": 3629.0},
-                    {"x": 2.0, "y": 1964.0, "time": 4047.0},
-                    {"x": 2.0, "y": 2743.0, "time": 5587.0},
-                    {"x": 200.0, "y": 2910.0, "time": 5920.0},
-                    {"x": 180.0, "y": 3037.0, "time": 6171.0},
-                    {"x": 160.0, "y": 3121.0, "time": 6338.0},
-                    {"x": 2.0, "y": 3163.0, "time": 6422.0},
-                    {"x": 180.0, "y": 3290.0, "time": 6673.0},
-                    {"x": 200.0, "y": 3358.0, "time": 6807.0},
-                    {"x": 220.0, "y": 3418.0, "time": 6924.0},
-                    {"x": 240.0, "y": 3486.0, "time": 7058.0},
-                    {"x": 460.0, "y": 3503.0, "time": 7091.0},
-                    {"x": 260.0, "y": 3550.0, "time": 7124.0},
-                    {"x": 280.0, "y": 3723.0, "time": 7258.0},
-                    {"x": 2.0, "y": 3764.0, "time": 7293.0},
-                    {"x": 260.0, "y": 4136.0, "time": 7710.0},
-                    {"x": 240.0, "y": 4238.0, "time": 7877.0},
-                    {"x": 220.0, "y": 4562.0, "time": 8513.0},
-                    {"x": 200.0, "y": 5088.0, "time": 9550.0},
-                    {"x": 2.0, "y": 5173.0, "time": 9718.0},
-                    {"x": 1.0, "y": 5317.0, "time": 10002.0},
-                    {"x": 220.0, "y": 5927.0, "time": 12260.0},
-                    {"x": 2.0, "y": 5969.0, "time": 12343.0},
-                    {"x": 240.0, "y": 6112.0, "time": 12627.0},
-                    {"x": 2.0, "y": 6154.0, "time": 12710.0},
-                    {"x": 220.0, "y": 6366.0, "time": 13129.0},
-                    {"x": 200.0, "y": 6476.0, "time": 13347.0},
-                    {"x": 180.0, "y": 6535.0, "time": 13463.0},
-                    {"x": 160.0, "y": 6646.0, "time": 13681.0},
-                    {"x": 2.0, "y": 6772.0, "time": 13931.0},
-                    {"x": 180.0, "y": 6916.0, "time": 14216.0},
-                    {"x": 200.0, "y": 7001.0, "time": 14384.0},
-                    {"x": 2.0, "y": 7170.0, "time": 14718.0},
-                    {"x": 2.0, "y": 7992.0, "time": 16340.0},
-                    {"x": 180.0, "y": 8941.0, "time": 18213.0},
-                    {"x": 2.0, "y": 9154.0, "time": 18633.0},
-                    {"x": 200.0, "y": 9508.0, "time": 19334.0},
-                    {"x": 2.0, "y": 9533.0, "time": 19384.0},
-                    {"x": 180.0, "y": 9913.0, "time": 20137.0},
-                    {"x": 2.0, "y": 9955.0, "time": 20220.0},
-                    {"x": 200.0, "y": 10578.0, "time": 21457.0},
-                    {"x": 1.0, "y": 11070.0, "time": 22429.0},
-                    {"x": 220.0, "y": 11303.0, "time": 23917.0},
-                    {"x": 2.0, "y": 11363.0, "time": 24051.0},
-                    {"x": 2.0, "y": 11634.0, "time": 24586.0},
-                    {"x": 200.0, "y": 11718.0, "time": 24753.0},
-                    {"x": 180.0, "y": 11827.0, "time": 24970.0},
-                    {"x": 2.0, "y": 11953.0, "time": 25221.0},
-                    {"x": 160.0, "y": 12165.0, "time": 25640.0},
-                    {"x": 140.0, "y": 12309.0, "time": 25923.0},
-                    {"x": 160.0, "y": 12580.0, "time": 26459.0},
-                    {"x": 180.0, "y": 12665.0, "time": 26626.0},
-                    {"x": 2.0, "y": 12732.0, "time": 26760.0},
-                    {"x": 2.0, "y": 13153.0, "time": 27596.0},
-                    {"x": 200.0, "y": 13280.0, "time": 27848.0},
-                    {"x": 2.0, "y": 13534.0, "time": 28349.0},
-                    {"x": 220.0, "y": 13763.0, "time": 28800.0},
-                    {"x": 240.0, "y": 13849.0, "time": 28968.0},
-                    {"x": 260.0, "y": 13908.0, "time": 29085.0},
-                    {"x": 1.0, "y": 13934.0, "time": 29136.0},
-                    {"x": 2.0, "y": 13981.0, "time": 29251.0},
-                    {"x": 240.0, "y": 14112.0, "time": 30339.0},
-                    {"x": 220.0, "y": 14133.0, "time": 30507.0},
-                    {"x": 240.0, "y": 14312.0, "time": 30925.0},
-                    {"x": 2.0, "y": 14354.0, "time": 31007.0},
-                    {"x": 220.0, "y": 14710.0, "time": 31711.0},
-                    {"x": 2.0, "y": 15158.0, "time": 32596.0},
-                    {"x": 2.0, "y": 15743.0, "time": 33751.0},
-                    {"x": 200.0, "y": 15980.0, "time": 34220.0},
-                    {"x": 1.0, "y": 16082.0, "time": 34420.0},
-                    {"x": 180.0, "y": 16400.0, "time": 36094.0},
-                    {"x": 2.0, "y": 16570.0, "time": 36427.0},
-                    {"x": 160.0, "y": 16756.0, "time": 36795.0},
-                    {"x": 2.0, "y": 16952.0, "time": 37180.0},
-                    {"x": 180.0, "y": 17095.0, "time": 37464.0},
-                    {"x": 200.0, "y": 17179.0, "time": 37631.0},
-                    {"x": 220.0, "y": 17264.0, "time": 37798.0},
-                    {"x": 240.0, "y": 17306.0, "time": 37882.0},
-                    {"x": 2.0, "y": 17373.0, "time": 38015.0},
-                    {"x": 220.0, "y": 17603.0, "time": 38468.0},
-                    {"x": 0.0, "y": 17831.0, "time": 38919.0},
-                ]
-            ],
-            "medium": [
-                [
-                    {"x": 2.0, "y": 638.0, "time": 1406.0},
-                    {"x": 2.0, "y": 833.0, "time": 1790.0},
-                    {"x": 2.0, "y": 1355.0, "time": 2826.0},
-                    {"x": 240.0, "y": 1525.0, "time": 3161.0},
-                    {"x": 220.0, "y": 1651.0, "time": 3412.0},
-                    {"x": 200.0, "y": 1736.0, "time": 3579.0},
-                    {"x": 2.0, "y": 1762.0, "time": 3630.0},
-                    {"x": 180.0, "y": 1921.0, "time": 3947.0},
-                    {"x": 2.0, "y": 1963.0, "time": 4031.0},
-                    {"x": 2.0, "y": 2750.0, "time": 5587.0},
-                    {"x": 160.0, "y": 2935.0, "time": 5954.0},
-                    {"x": 2.0, "y": 3163.0, "time": 6405.0},
-                    {"x": 180.0, "y": 3291.0, "time": 6656.0},
-                    {"x": 200.0, "y": 3402.0, "time": 6874.0},
-                    {"x": 220.0, "y": 3462.0, "time": 6991.0},
-                    {"x": 240.0, "y": 3588.0, "time": 7242.0},
-                    {"x": 2.0, "y": 3741.0, "time": 7543.0},
-                    {"x": 220.0, "y": 3910.0, "time": 7877.0},
-                    {"x": 200.0, "y": 4011.0, "time": 8078.0},
-                    {"x": 180.0, "y": 4239.0, "time": 8529.0},
-                    {"x": 160.0, "y": 4323.0, "time": 8696.0},
-                    {"x": 180.0, "y": 4577.0, "time": 9198.0},
-                    {"x": 200.0, "y": 4687.0, "time": 9416.0},
-                    {"x": 180.0, "y": 5000.0, "time": 10035.0},
-                    {"x": 160.0, "y": 5153.0, "time": 10336.0},
-                    {"x": 140.0, "y": 5212.0, "time": 10453.0},
-                    {"x": 2.0, "y": 5364.0, "time": 10754.0},
-                    {"x": 160.0, "y": 5509.0, "time": 11039.0},
-                    {"x": 180.0, "y": 5593.0, "time": 11206.0},
-                    {"x": 200.0, "y": 5948.0, "time": 11908.0},
-                    {"x": 220.0, "y": 6059.0, "time": 12126.0},
-                    {"x": 2.0, "y": 6161.0, "time": 12327.0},
-                    {"x": 200.0, "y": 6483.0, "time": 12963.0},
-                    {"x": 180.0, "y": 6567.0, "time": 13129.0},
-                    {"x": 160.0, "y": 6643.0, "time": 13279.0},
-                    {"x": 2.0, "y": 6752.0, "time": 13497.0},
-                    {"x": 180.0, "y": 7049.0, "time": 14083.0},
-                    {"x": 200.0, "y": 7133.0, "time": 14249.0},
-                    {"x": 2.0, "y": 7150.0, "time": 14283.0},
-                    {"x": 2.0, "y": 7995.0, "time": 15956.0},
-                    {"x": 180.0, "y": 8418.0, "time": 16792.0},
-                    {"x": 160.0, "y": 8519.0, "time": 16992.0},
-                    {"x": 180.0, "y": 8798.0, "time": 17545.0},
-                    {"x": 2.0, "y": 9154.0, "time": 18247.0},
-                    {"x": 2.0, "y": 9533.0, "time": 19000.0},
-                    {"x": 160.0, "y": 9845.0, "time": 19619.0},
-                    {"x": 2.0, "y": 9954.0, "time": 19836.0},
-                    {"x": 460.0, "y": 10040.0, "time": 20007.0},
-                    {"x": 460.0, "y": 10083.0, "time": 20037.0},
-                    {"x": 180.0, "y": 10692.0, "time": 20622.0},
-                    {"x": 160.0, "y": 10990.0, "time": 21158.0},
-                    {"x": 2.0, "y": 11352.0, "time": 21876.0},
-                    {"x": 2.0, "y": 11647.0, "time": 22462.0},
-                    {"x": 2.0, "y": 11935.0, "time": 23031.0},
-                    {"x": 2.0, "y": 12739.0, "time": 24620.0},
-                    {"x": 2.0, "y": 13161.0, "time": 25455.0},
-                    {"x": 180.0, "y": 13372.0, "time": 25873.0},
-                    {"x": 2.0, "y": 13543.0, "time": 26208.0},
-                    {"x": 2.0, "y": 13964.0, "time": 27044.0},
-                    {"x": 200.0, "y": 14175.0, "time": 27462.0},
-                    {"x": 220.0, "y": 14234.0, "time": 27580.0},
-                    {"x": 240.0, "y": 14319.0, "time": 27747.0},
-                    {"x": 2.0, "y": 14361.0, "time": 27830.0},
-                    {"x": 220.0, "y": 14548.0, "time": 28199.0},
-                    {"x": 200.0, "y": 14657.0, "time": 28416.0},
-                    {"x": 2.0, "y": 15167.0, "time": 29420.0},
-                    {"x": 2.0, "y": 15732.0, "time": 30540.0},
-                    {"x": 180.0, "y": 15918.0, "time": 30909.0},
-                    {"x": 160.0, "y": 16003.0, "time": 31076.0},
-                    {"x": 180.0, "y": 16154.0, "time": 31376.0},
-                    {"x": 200.0, "y": 16239.0, "time": 31544.0},
-                    {"x": 180.0, "y": 16383.0, "time": 31828.0},
-                    {"x": 160.0, "y": 16468.0, "time": 31996.0},
-                    {"x": 2.0, "y": 16552.0, "time": 32162.0},
-                    {"x": 2.0, "y": 16951.0, "time": 32948.0},
-                    {"x": 180.0, "y": 17103.0, "time": 33249.0},
-                    {"x": 200.0, "y": 17163.0, "time": 33368.0},
-                    {"x": 220.0, "y": 17248.0, "time": 33534.0},
-                    {"x": 240.0, "y": 17290.0, "time": 33617.0},
-                    {"x": 2.0, "y": 17357.0, "time": 33751.0},
-                    {"x": 220.0, "y": 17585.0, "time": 34203.0},
-                    {"x": 200.0, "y": 17669.0, "time": 34369.0},
-                    {"x": 0.0, "y": 17838.0, "time": 34704.0},
-                ]
-            ],
-            "hard": [
-                [
-                    {"x": 240.0, "y": 257.0, "time": 653.0},
-                    {"x": 220.0, "y": 383.0, "time": 903.0},
-                    {"x": 240.0, "y": 553.0, "time": 1237.0},
-                    {"x": 2.0, "y": 638.0, "time": 1404.0},
-                    {"x": 2.0, "y": 833.0, "time": 1789.0},
-                    {"x": 260.0, "y": 1061.0, "time": 2241.0},
-                    {"x": 2.0, "y": 1359.0, "time": 2826.0},
-                    {"x": 240.0, "y": 1741.0, "time": 3579.0},
-                    {"x": 2.0, "y": 1758.0, "time": 3612.0},
-                    {"x": 220.0, "y": 1886.0, "time": 3863.0},
-                    {"x": 2.0, "y": 1954.0, "time": 3997.0},
-                    {"x": 200.0, "y": 2352.0, "time": 4784.0},
-                    {"x": 2.0, "y": 2730.0, "time": 5536.0},
-                    {"x": 180.0, "y": 2916.0, "time": 5903.0},
-                    {"x": 160.0, "y": 3001.0, "time": 6070.0},
-                    {"x": 2.0, "y": 3154.0, "time": 6372.0},
-                    {"x": 180.0, "y": 3256.0, "time": 6573.0},
-                    {"x": 200.0, "y": 3298.0, "time": 6656.0},
-                    {"x": 220.0, "y": 3365.0, "time": 6790.0},
-                    {"x": 240.0, "y": 3408.0, "time": 6874.0},
-                    {"x": 460.0, "y": 3450.0, "time": 6957.0},
-                    {"x": 460.0, "y": 3498.0, "time": 6991.0},
-                    {"x": 2.0, "y": 3779.0, "time": 7208.0},
-                    {"x": 220.0, "y": 4623.0, "time": 8529.0},
-                    {"x": 200.0, "y": 4733.0, "time": 8746.0},
-                    {"x": 220.0, "y": 4920.0, "time": 9115.0},
-                    {"x": 240.0, "y": 5004.0, "time": 9282.0},
-                    {"x": 260.0, "y": 5114.0, "time": 9500.0},
-                    {"x": 2.0, "y": 5156.0, "time": 9583.0},
-                    {"x": 2.0, "y": 5366.0, "time": 10001.0},
-                    {"x": 240.0, "y": 5509.0, "time": 10286.0},
-                    {"x": 220.0, "y": 5594.0, "time": 10453.0},
-                    {"x": 200.0, "y": 5890.0, "time": 11039.0},
-                    {"x": 2.0, "y": 5975.0, "time": 11206.0},
-                    {"x": 220.0, "y": 6102.0, "time": 11456.0},
-                    {"x": 2.0, "y": 6161.0, "time": 11574.0},
-                    {"x": 200.0, "y": 6415.0, "time": 12075.0},
-                    {"x": 180.0, "y": 6500.0, "time": 12242.0},
-                    {"x": 2.0, "y": 6567.0, "time": 12376.0},
-                    {"x": 2.0, "y": 6752.0, "time": 12744.0},
-                    {"x": 2.0, "y": 7150.0, "time": 13530.0},
-                    {"x": 2.0, "y": 7363.0, "time": 13948.0},
-                    {"x": 2.0, "y": 8002.0, "time": 15203.0},
-                    {"x": 2.0, "y": 9165.0, "time": 17494.0},
-                    {"x": 2.0, "y": 9546.0, "time": 18247.0},
-                    {"x": 160.0, "y": 9926.0, "time": 18999.0},
-                    {"x": 2.0, "y": 9968.0, "time": 19083.0},
-                    {"x": 460.0, "y": 10053.0, "time": 19250.0},
-                    {"x": 460.0, "y": 10101.0, "time": 19284.0},
-                    {"x": 140.0, "y": 11221.0, "time": 20823.0},
-                    {"x": 2.0, "y": 11373.0, "time": 21123.0},
-                    {"x": 160.0, "y": 11558.0, "time": 21491.0},
-                    {"x": 2.0, "y": 11642.0, "time": 21658.0},
-                    {"x": 180.0, "y": 11770.0, "time": 21909.0},
-                    {"x": 2.0, "y": 11939.0, "time": 22244.0},
-                    {"x": 2.0, "y": 12740.0, "time": 23833.0},
-                    {"x": 160.0, "y": 12969.0, "time": 24284.0},
-                    {"x": 2.0, "y": 13156.0, "time": 24652.0},
-                    {"x": 180.0, "y": 13325.0, "time": 24987.0},
-                    {"x": 200.0, "y": 13452.0, "time": 25238.0},
-                    {"x": 2.0, "y": 13537.0, "time": 25405.0},
-                    {"x": 2.0, "y": 13961.0, "time": 26241.0},
-                    {"x": 220.0, "y": 14172.0, "time": 26659.0},
-                    {"x": 240.0, "y": 14240.0, "time": 26793.0},
-                    {"x": 260.0, "y": 14300.0, "time": 26911.0},
-                    {"x": 2.0, "y": 14359.0, "time": 27027.0},
-                    {"x": 240.0, "y": 14485.0, "time": 27278.0},
-                    {"x": 220.0, "y": 14570.0, "time": 27445.0},
-                    {"x": 200.0, "y": 14909.0, "time": 28114.0},
-                    {"x": 2.0, "y": 15162.0, "time": 28616.0},
-                    {"x": 2.0, "y": 15730.0, "time": 29737.0},
-                    {"x": 180.0, "y": 15899.0, "time": 30071.0},
-                    {"x": 160.0, "y": 15968.0, "time": 30206.0},
-                    {"x": 180.0, "y": 16179.0, "time": 30623.0},
-                    {"x": 200.0, "y": 16264.0, "time": 30790.0},
-                    {"x": 180.0, "y": 16390.0, "time": 31041.0},
-                    {"x": 160.0, "y": 16491.0, "time": 31242.0},
-                    {"x": 2.0, "y": 16558.0, "time": 31376.0},
-                    {"x": 140.0, "y": 16788.0, "time": 31828.0},
-                    {"x": 2.0, "y": 16958.0, "time": 32163.0},
-                    {"x": 160.0, "y": 17101.0, "time": 32446.0},
-                    {"x": 180.0, "y": 17185.0, "time": 32613.0},
-                    {"x": 200.0, "y": 17228.0, "time": 32697.0},
-                    {"x": 220.0, "y": 17271.0, "time": 32781.0},
-                    {"x": 2.0, "y": 17356.0, "time": 32948.0},
-                    {"x": 0.0, "y": 17850.0, "time": 33919.0},
-                ]
-            ],
-        },
-        103: {
-            "easy": [
-                [
-                    {"x": 2.0, "y": 3742.0, "time": 7543.0},
-                    {"x": 2.0, "y": 3953.0, "time": 7961.0},
-                    {"x": 2.0, "y": 4561.0, "time": 9165.0},
-                    {"x": 2.0, "y": 6357.0, "time": 12711.0},
-                    {"x": 2.0, "y": 7152.0, "time": 14283.0},
-                    {"x": 2.0, "y": 7557.0, "time": 15086.0},
-                    {"x": 1.0, "y": 8715.0, "time": 17377.0},
-                    {"x": 240.0, "y": 8949.0, "time": 18866.0},
-                    {"x": 220.0, "y": 9052.0, "time": 19084.0},
-                    {"x": 2.0, "y": 9364.0, "time": 19702.0},
-                    {"x": 200.0, "y": 9601.0, "time": 20170.0},
-                    {"x": 2.0, "y": 9770.0, "time": 20505.0},
-                    {"x": 2.0, "y": 10143.0, "time": 21241.0},
-                    {"x": 2.0, "y": 10337.0, "time": 21626.0},
-                    {"x": 180.0, "y": 10692.0, "time": 22328.0},
-                    {"x": 2.0, "y": 11159.0, "time": 23247.0},
-                    {"x": 200.0, "y": 11330.0, "time": 23582.0},
-                    {"x": 2.0, "y": 12343.0, "time": 25590.0},
-                    {"x": 2.0, "y": 12843.0, "time": 26576.0},
-                    {"x": 220.0, "y": 13435.0, "time": 27746.0},
-                    {"x": 240.0, "y": 13503.0, "time": 27880.0},
-                    {"x": 2.0, "y": 13562.0, "time": 27998.0},
-                    {"x": 2.0, "y": 14450.0, "time": 29753.0},
-                    {"x": 220.0, "y": 14948.0, "time": 30741.0},
-                    {"x": 200.0, "y": 15100.0, "time": 31041.0},
-                    {"x": 2.0, "y": 15160.0, "time": 31159.0},
-                    {"x": 2.0, "y": 15567.0, "time": 31962.0},
-                    {"x": 2.0, "y": 15838.0, "time": 32497.0},
-                    {"x": 220.0, "y": 16006.0, "time": 32830.0},
-                    {"x": 2.0, "y": 16150.0, "time": 33115.0},
-                    {"x": 2.0, "y": 17164.0, "time": 35121.0},
-                    {"x": 1.0, "y": 17316.0, "time": 35423.0},
-                    {"x": 0.0, "y": 17835.0, "time": 37498.0},
-                ]
-            ],
-            "medium": [
-                [
-                    {"x": 240.0, "y": 1823.0, "time": 3762.0},
-                    {"x": 220.0, "y": 1925.0, "time": 3964.0},
-                    {"x": 200.0, "y": 2686.0, "time": 5468.0},
-                    {"x": 180.0, "y": 2771.0, "time": 5636.0},
-                    {"x": 160.0, "y": 2856.0, "time": 5803.0},
-                    {"x": 180.0, "y": 2999.0, "time": 6088.0},
-                    {"x": 200.0, "y": 3109.0, "time": 6306.0},
-                    {"x": 220.0, "y": 3210.0, "time": 6506.0},
-                    {"x": 2.0, "y": 3737.0, "time": 7542.0},
-                    {"x": 2.0, "y": 3932.0, "time": 7927.0},
-                    {"x": 240.0, "y": 4161.0, "time": 8380.0},
-                    {"x": 260.0, "y": 4312.0, "time": 8680.0},
-                    {"x": 2.0, "y": 4565.0, "time": 9182.0},
-                    {"x": 2.0, "y": 6374.0, "time": 12761.0},
-                    {"x": 2.0, "y": 7152.0, "time": 14299.0},
-                    {"x": 2.0, "y": 7574.0, "time": 15135.0},
-                    {"x": 240.0, "y": 8581.0, "time": 17126.0},
-                    {"x": 220.0, "y": 8648.0, "time": 17259.0},
-                    {"x": 200.0, "y": 8734.0, "time": 17428.0},
-                    {"x": 2.0, "y": 8751.0, "time": 17461.0},
-                    {"x": 180.0, "y": 9047.0, "time": 18046.0},
-                    {"x": 200.0, "y": 9259.0, "time": 18465.0},
-                    {"x": 2.0, "y": 9367.0, "time": 18681.0},
-                    {"x": 2.0, "y": 9765.0, "time": 19467.0},
-                    {"x": 2.0, "y": 10148.0, "time": 20221.0},
-                    {"x": 2.0, "y": 10334.0, "time": 20588.0},
-                    {"x": 180.0, "y": 10673.0, "time": 21257.0},
-                    {"x": 160.0, "y": 10732.0, "time": 21375.0},
-                    {"x": 2.0, "y": 11153.0, "time": 22210.0},
-                    {"x": 180.0, "y": 11322.0, "time": 22545.0},
-                    {"x": 200.0, "y": 11406.0, "time": 22712.0},
-                    {"x": 220.0, "y": 11701.0, "time": 23297.0},
-                    {"x": 2.0, "y": 12338.0, "time": 24552.0},
-                    {"x": 200.0, "y": 12566.0, "time": 25004.0},
-                    {"x": 180.0, "y": 12676.0, "time": 25222.0},
-                    {"x": 2.0, "y": 12846.0, "time": 25556.0},
-                    {"x": 200.0, "y": 13345.0, "time": 26542.0},
-                    {"x": 220.0, "y": 13412.0, "time": 26676.0},
-                    {"x": 240.0, "y": 13496.0, "time": 26843.0},
-                    {"x": 2.0, "y": 13555.0, "time": 26960.0},
-                    {"x": 220.0, "y": 13681.0, "time": 27211.0},
-                    {"x": 200.0, "y": 13790.0, "time": 27429.0},
-                    {"x": 180.0, "y": 13875.0, "time": 27597.0},
-                    {"x": 2.0, "y": 14441.0, "time": 28716.0},
-                    {"x": 200.0, "y": 14779.0, "time": 29385.0},
-                    {"x": 2.0, "y": 15159.0, "time": 30140.0},
-                    {"x": 2.0, "y": 15555.0, "time": 30924.0},
-                    {"x": 2.0, "y": 15851.0, "time": 31510.0},
-                    {"x": 180.0, "y": 15935.0, "time": 31677.0},
-                    {"x": 160.0, "y": 16019.0, "time": 31844.0},
-                    {"x": 2.0, "y": 16164.0, "time": 32129.0},
-                    {"x": 180.0, "y": 16316.0, "time": 32429.0},
-                    {"x": 200.0, "y": 16401.0, "time": 32597.0},
-                    {"x": 180.0, "y": 17139.0, "time": 34052.0},
-                    {"x": 2.0, "y": 17156.0, "time": 34085.0},
-                    {"x": 160.0, "y": 17240.0, "time": 34253.0},
-                    {"x": 140.0, "y": 17308.0, "time": 34387.0},
-                    {"x": 2.0, "y": 17350.0, "time": 34469.0},
-                    {"x": 160.0, "y": 17495.0, "time": 34754.0},
-                    {"x": 180.0, "y": 17579.0, "time": 34922.0},
-                    {"x": 0.0, "y": 17832.0, "time": 35423.0},
-                ],
-                [
-                    {"x": 240.0, "y": 1756.0, "time": 3629.0},
-                    {"x": 220.0, "y": 1840.0, "time": 3796.0},
-                    {"x": 240.0, "y": 2702.0, "time": 5502.0},
-                    {"x": 260.0, "y": 2786.0, "time": 5669.0},
-                    {"x": 240.0, "y": 3151.0, "time": 6389.0},
-                    {"x": 220.0, "y": 3252.0, "time": 6589.0},
-                    {"x": 2.0, "y": 3733.0, "time": 7542.0},
-                    {"x": 2.0, "y": 3944.0, "time": 7960.0},
-                    {"x": 240.0, "y": 4113.0, "time": 8295.0},
-                    {"x": 2.0, "y": 4560.0, "time": 9181.0},
-                    {"x": 220.0, "y": 4829.0, "time": 9716.0},
-                    {"x": 200.0, "y": 4915.0, "time": 9885.0},
-                    {"x": 180.0, "y": 5016.0, "time": 10085.0},
-                    {"x": 160.0, "y": 5143.0, "time": 10335.0},
-                    {"x": 2.0, "y": 6158.0, "time": 12342.0},
-                    {"x": 2.0, "y": 6369.0, "time": 12761.0},
-                    {"x": 2.0, "y": 7359.0, "time": 14717.0},
-                    {"x": 2.0, "y": 7757.0, "time": 15504.0},
-                    {"x": 180.0, "y": 8620.0, "time": 17209.0},
-                    {"x": 2.0, "y": 8772.0, "time": 17510.0},
-                    {"x": 2.0, "y": 9366.0, "time": 18682.0},
-                    {"x": 2.0, "y": 9764.0, "time": 19467.0},
-                    {"x": 2.0, "y": 10145.0, "time": 20219.0},
-                    {"x": 2.0, "y": 10332.0, "time": 20588.0},
-                    {"x": 160.0, "y": 10756.0, "time": 21425.0},
-                    {"x": 2.0, "y": 11153.0, "time": 22210.0},
-                    {"x": 180.0, "y": 11279.0, "time": 22461.0},
-                    {"x": 200.0, "y": 11389.0, "time": 22679.0},
-                    {"x": 220.0, "y": 11448.0, "time": 22796.0},
-                    {"x": 240.0, "y": 11643.0, "time": 23181.0},
-                    {"x": 260.0, "y": 11702.0, "time": 23297.0},
-                    {"x": 460.0, "y": 11854.0, "time": 23598.0},
-                    {"x": 460.0, "y": 11902.0, "time": 23632.0},
-                    {"x": 2.0, "y": 12335.0, "time": 24001.0},
-                    {"x": 2.0, "y": 12833.0, "time": 24802.0},
-                    {"x": 240.0, "y": 13019.0, "time": 25171.0},
-                    {"x": 220.0, "y": 13145.0, "time": 25421.0},
-                    {"x": 200.0, "y": 13340.0, "time": 25806.0},
-                    {"x": 180.0, "y": 13424.0, "time": 25973.0},
-                    {"x": 1.0, "y": 13525.0, "time": 26174.0},
-                    {"x": 2.0, "y": 14452.0, "time": 29051.0},
-                    {"x": 2.0, "y": 15171.0, "time": 30473.0},
-                    {"x": 2.0, "y": 15568.0, "time": 31258.0},
-                    {"x": 2.0, "y": 15841.0, "time": 31794.0},
-                    {"x": 160.0, "y": 15950.0, "time": 32011.0},
-                    {"x": 140.0, "y": 16034.0, "time": 32178.0},
-                    {"x": 2.0, "y": 16161.0, "time": 32430.0},
-                    {"x": 160.0, "y": 16288.0, "time": 32680.0},
-                    {"x": 180.0, "y": 16391.0, "time": 32881.0},
-                    {"x": 2.0, "y": 17154.0, "time": 34386.0},
-                    {"x": 160.0, "y": 17213.0, "time": 34504.0},
-                    {"x": 140.0, "y": 17298.0, "time": 34671.0},
-                    {"x": 2.0, "y": 17365.0, "time": 34804.0},
-                    {"x": 160.0, "y": 17552.0, "time": 35173.0},
-                    {"x": 180.0, "y": 17637.0, "time": 35340.0},
-                    {"x": 0.0, "y": 17849.0, "time": 35757.0},
-                ],
-            ],
-            "hard": [
-                [
-                    {"x": 240.0, "y": 435.0, "time": 1004.0},
-                    {"x": 220.0, "y": 536.0, "time": 1204.0},
-                    {"x": 200.0, "y": 638.0, "time": 1405.0},
-                    {"x": 2.0, "y": 1172.0, "time": 2459.0},
-                    {"x": 180.0, "y": 2668.0, "time": 5419.0},
-                    {"x": 160.0, "y": 2752.0, "time": 5586.0},
-                    {"x": 180.0, "y": 2998.0, "time": 6071.0},
-                    {"x": 200.0, "y": 3065.0, "time": 6205.0},
-                    {"x": 2.0, "y": 3742.0, "time": 7543.0},
-                    {"x": 2.0, "y": 3954.0, "time": 7961.0},
-                    {"x": 180.0, "y": 4283.0, "time": 8613.0},
-                    {"x": 160.0, "y": 4393.0, "time": 8831.0},
-                    {"x": 2.0, "y": 4564.0, "time": 9166.0},
-                    {"x": 180.0, "y": 4752.0, "time": 9534.0},
-                    {"x": 200.0, "y": 4921.0, "time": 9869.0},
-                    {"x": 180.0, "y": 5074.0, "time": 10169.0},
-                    {"x": 160.0, "y": 5159.0, "time": 10336.0},
-                    {"x": 180.0, "y": 5412.0, "time": 10838.0},
-                    {"x": 200.0, "y": 5488.0, "time": 10989.0},
-                    {"x": 180.0, "y": 5994.0, "time": 11991.0},
-                    {"x": 160.0, "y": 6105.0, "time": 12209.0},
-                    {"x": 2.0, "y": 6164.0, "time": 12326.0},
-                    {"x": 140.0, "y": 6291.0, "time": 12576.0},
-                    {"x": 2.0, "y": 6360.0, "time": 12712.0},
-                    {"x": 160.0, "y": 6547.0, "time": 13079.0},
-                    {"x": 180.0, "y": 6631.0, "time": 13245.0},
-                    {"x": 200.0, "y": 6733.0, "time": 13447.0},
-                    {"x": 2.0, "y": 6970.0, "time": 13916.0},
-                    {"x": 180.0, "y": 8549.0, "time": 17043.0},
-                    {"x": 2.0, "y": 8761.0, "time": 17461.0},
-                    {"x": 200.0, "y": 8904.0, "time": 17745.0},
-                    {"x": 2.0, "y": 9370.0, "time": 18664.0},
-                    {"x": 2.0, "y": 9750.0, "time": 19418.0},
-                    {"x": 2.0, "y": 10130.0, "time": 20170.0},
-                    {"x": 2.0, "y": 10333.0, "time": 20572.0},
-                    {"x": 180.0, "y": 10696.0, "time": 21291.0},
-                    {"x": 160.0, "y": 10780.0, "time": 21458.0},
-                    {"x": 140.0, "y": 10923.0, "time": 21742.0},
-                    {"x": 2.0, "y": 11160.0, "time": 22211.0},
-                    {"x": 160.0, "y": 11371.0, "time": 22629.0},
-                    {"x": 180.0, "y": 11447.0, "time": 22779.0},
-                    {"x": 200.0, "y": 11532.0, "time": 22947.0},
-                    {"x": 220.0, "y": 11642.0, "time": 23164.0},
-                    {"x": 240.0, "y": 11701.0, "time": 23281.0},
-                    {"x": 260.0, "y": 11786.0, "time": 23448.0},
-                    {"x": 460.0, "y": 11854.0, "time": 23582.0},
-                    {"x": 460.0, "y": 11902.0, "time": 23616.0},
-                    {"x": 2.0, "y": 12351.0, "time": 24000.0},
-                    {"x": 2.0, "y": 12838.0, "time": 24786.0},
-                    {"x": 240.0, "y": 13178.0, "time": 25455.0},
-                    {"x": 260.0, "y": 13347.0, "time": 25790.0},
-                    {"x": 2.0, "y": 13559.0, "time": 26208.0},
-                    {"x": 240.0, "y": 13746.0, "time": 26576.0},
-                    {"x": 220.0, "y": 13814.0, "time": 26710.0},
-                    {"x": 200.0, "y": 13916.0, "time": 26910.0},
-                    {"x": 220.0, "y": 14111.0, "time": 27295.0},
-                    {"x": 2.0, "y": 14443.0, "time": 27947.0},
-                    {"x": 200.0, "y": 14936.0, "time": 28918.0},
-                    {"x": 2.0, "y": 15163.0, "time": 29370.0},
-                    {"x": 2.0, "y": 15561.0, "time": 30156.0},
-                    {"x": 2.0, "y": 15840.0, "time": 30707.0},
-                    {"x": 180.0, "y": 15984.0, "time": 30991.0},
-                    {"x": 160.0, "y": 16027.0, "time": 31075.0},
-                    {"x": 2.0, "y": 16154.0, "time": 31326.0},
-                    {"x": 180.0, "y": 16306.0, "time": 31627.0},
-                    {"x": 200.0, "y": 16517.0, "time": 32044.0},
-                    {"x": 2.0, "y": 17169.0, "time": 33333.0},
-                    {"x": 180.0, "y": 17228.0, "time": 33450.0},
-                    {"x": 160.0, "y": 17312.0, "time": 33617.0},
-                    {"x": 2.0, "y": 17354.0, "time": 33701.0},
-                    {"x": 180.0, "y": 17590.0, "time": 34169.0},
-                    {"x": 0.0, "y": 17843.0, "time": 34671.0},
-                ]
-            ],
-        },
-    }
+    traces = SledTraceStore(os.path.join(os.path.dirname(__file__), "sled_traces.bin"))
 
     def __init__(self, penguin: "PenguinBot") -> None:
         self.penguin: "PenguinBot" = penguin
@@ -1372,13 +118,15 @@ class SledRacing:
         )
         await asyncio.sleep(2)
 
-        last_time = 0
-        for move in random.choice(self.waddles[waddle_id][difficulty]):
-            await asyncio.sleep(move["time"] / 1000 - last_time)
-            last_time = move["time"] / 1000
-            await self.penguin.waddle.send_xt(
-                "zm", seat_id, move["x"], move["y"], move["time"]
-            )
+        trace = self.penguin.random.randrange(self.traces.count(waddle_id, difficulty))
+
+        async def send_move(x: float, y: float, time: float):
+            self.penguin.bot_plugin.metrics.count_action("zm")
+            self.penguin.trace("zm", seat_id, int(x), int(y))
+            await self.penguin.waddle.send_xt("zm", seat_id, x, y, time)
+
+        # Moves go out on deadlines from the race start, so event loop lag can't pile up over a race
+        await self.penguin.bot_plugin.race_ticker.play(self.traces.moves(waddle_id, difficulty, trace), send_move)
 
         await asyncio.sleep(1)
         coins = self.penguin.waddle.get_payout()
@@ -0,0 +1,39 @@
+import asyncio
+import time
+from collections import deque
+from typing import Callable
+
+
+class LagMonitor:
+    def __init__(self, interval_ms: int, thresholds_ms: list[float], recovery_ratio: float = 0.5,
+                 smoothing: float = 0.2, on_change: Callable[[int, int, float], None] | None = None) -> None:
+        self.interval = interval_ms / 1000
+        self.thresholds = sorted(thresholds_ms)
+        self.recovery_ratio = recovery_ratio
+        self.smoothing = smoothing
+        self.on_change = on_change
+        self.level = 0
+        self.lag_ms = 0.0
+        self.max_lag_ms = 0.0
+        self.transitions = deque(maxlen=50)
+
+    def sample(self, lag_ms: float):
+        self.lag_ms += self.smoothing * (lag_ms - self.lag_ms)
+        self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+        level = self.level
+        while level < len(self.thresholds) and self.lag_ms >= self.thresholds[level]:
+            level += 1
+        while level > 0 and self.lag_ms < self.thresholds[level - 1] * self.recovery_ratio:
+            level -= 1
+        if level != self.level:
+            previous, self.level = self.level, level
+            self.transitions.append((time.time(), previous, level, self.lag_ms))
+            if self.on_change:
+                self.on_change(previous, level, self.lag_ms)
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            self.sample(max(loop.time() - started - self.interval, 0) * 1000)
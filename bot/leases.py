@@ -0,0 +1,65 @@
+import itertools
+
+RENEW_SCRIPT = """
+local renewed = {}
+for i, key in ipairs(KEYS) do
+    if redis.call('get', key) == ARGV[1] then
+        redis.call('expire', key, ARGV[2])
+        renewed[i] = 1
+    else
+        renewed[i] = 0
+    end
+end
+return renewed
+"""
+
+RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class BotLeaseRegistry:
+    key_prefix = 'houdini.bot.lease'
+
+    def __init__(self, redis, owner: str, ttl: int = 30) -> None:
+        self.redis = redis
+        self.owner = str(owner)
+        self.ttl = ttl
+        self.held: set[int] = set()
+
+    def key(self, penguin_id: int) -> str:
+        return f'{self.key_prefix}.{penguin_id}'
+
+    async def claim_many(self, penguin_ids, limit: int) -> list[int]:
+        penguin_ids, claimed = iter(penguin_ids), []
+        # Each round claims as many as are still missing in one pipelined batch
+        while len(claimed) < limit:
+            batch = list(itertools.islice(penguin_ids, limit - len(claimed)))
+            if not batch:
+                break
+            pending = [x for x in batch if x not in self.held]
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for penguin_id in pending:
+                    pipe.set(self.key(penguin_id), self.owner, ex=self.ttl, nx=True)
+                results = dict(zip(pending, await pipe.execute()))
+            for penguin_id in batch:
+                if results.get(penguin_id, True):
+                    self.held.add(penguin_id)
+                    claimed.append(penguin_id)
+        return claimed
+
+    async def release(self, penguin_id: int):
+        self.held.discard(penguin_id)
+        await self.redis.eval(RELEASE_SCRIPT, 1, self.key(penguin_id), self.owner)
+
+    async def renew(self) -> list[int]:
+        held = list(self.held)
+        if not held:
+            return []
+        renewed = await self.redis.eval(RENEW_SCRIPT, len(held), *map(self.key, held), self.owner, self.ttl)
+        lost = [x for x, ok in zip(held, renewed) if not int(ok)]
+        self.held.difference_update(lost)
+        return lost
@@ -0,0 +1,208 @@
+import asyncio
+import bisect
+import time
+from collections import defaultdict, deque
+from typing import Callable
+
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Bot packets are counted per action family, so the label values stay a fixed set
+ACTION_FAMILIES = {
+    'sp': 'sp', 'sf': 'sf', 'ss': 'ss', 'se': 'se', 'sb': 'sb', 'zm': 'zm',
+    **{x: 'up' for x in ('upc', 'uph', 'upf', 'upn', 'upb', 'upa', 'upe', 'upl', 'upp')},
+}
+
+
+def _format_labels(names: tuple[str, ...], values: tuple, extra: str = '') -> str:
+    pairs = [f'{k}="{v}"' for k, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+class Counter:
+    kind = 'counter'
+
+    def __init__(self, name: str, description: str, labels: tuple[str, ...] = (),
+                 collect: Callable[[], dict[tuple, float]] | None = None) -> None:
+        self.name = name
+        self.description = description
+        self.labels = labels
+        self.values = defaultdict(float)
+        self.collect = collect
+
+    def inc(self, *label_values, amount: float = 1):
+        self.values[label_values] += amount
+
+    def samples(self):
+        if self.collect is not None:
+            self.values = defaultdict(float, self.collect())
+        for label_values, value in self.values.items():
+            yield self.name + _format_labels(self.labels, label_values), value
+
+
+class Gauge(Counter):
+    kind = 'gauge'
+
+    def set(self, *label_values, value: float):
+        self.values[label_values] = value
+
+
+class HistogramValues:
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[float, int]]:
+        result, running = [], 0
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            running += count
+            result.append((bound, running))
+        return result
+
+
+class Histogram:
+    kind = 'histogram'
+
+    def __init__(self, name: str, description: str, labels: tuple[str, ...] = (),
+                 buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.name = name
+        self.description = description
+        self.labels = labels
+        self.buckets = buckets
+        self.values: dict[tuple, HistogramValues] = {}
+
+    def observe(self, value: float, *label_values):
+        values = self.values.get(label_values)
+        if values is None:
+            values = self.values[label_values] = HistogramValues(self.buckets)
+        values.observe(value)
+
+    def time(self, *label_values) -> 'HistogramTimer':
+        return HistogramTimer(self, label_values)
+
+    def samples(self):
+        for label_values, values in self.values.items():
+            for bound, count in values.cumulative():
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                yield self.name + '_bucket' + _format_labels(self.labels, label_values, f'le="{le}"'), count
+            yield self.name + '_sum' + _format_labels(self.labels, label_values), values.total
+            yield self.name + '_count' + _format_labels(self.labels, label_values), values.count
+
+
+class HistogramTimer:
+    def __init__(self, histogram: Histogram, label_values: tuple, on_enter: Callable[[], None] | None = None) -> None:
+        self.histogram = histogram
+        self.label_values = label_values
+        self.on_enter = on_enter
+        self.started = 0.0
+
+    def __enter__(self):
+        if self.on_enter is not None:
+            self.on_enter()
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.histogram.observe(time.perf_counter() - self.started, *self.label_values)
+
+    async def __aenter__(self):
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.__exit__(exc_type, exc_val, exc_tb)
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self.metrics = []
+
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def counter(self, *args, **kwargs) -> Counter:
+        return self.register(Counter(*args, **kwargs))
+
+    def gauge(self, *args, **kwargs) -> Gauge:
+        return self.register(Gauge(*args, **kwargs))
+
+    def histogram(self, *args, **kwargs) -> Histogram:
+        return self.register(Histogram(*args, **kwargs))
+
+    def render(self) -> str:
+        lines = []
+        for metric in self.metrics:
+            lines.append(f'# HELP {metric.name} {metric.description}')
+            lines.append(f'# TYPE {metric.name} {metric.kind}')
+            lines.extend(f'{name} {value:g}' for name, value in metric.samples())
+        return '\n'.join(lines) + '\n'
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while (await reader.readline()).strip():
+                pass
+            body = self.render().encode()
+            writer.write(b'HTTP/1.1 200 OK\r\n'
+                         b'Content-Type: text/plain; version=0.0.4\r\n'
+                         b'Content-Length: ' + str(len(body)).encode() + b'\r\n'
+                         b'Connection: close\r\n\r\n' + body)
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def serve(self, host: str, port: int) -> asyncio.AbstractServer:
+        return await asyncio.start_server(self._handle_connection, host, port)
+
+
+class RateWindow:
+    def __init__(self, interval: float, window: float) -> None:
+        self.interval = interval
+        self.rates = deque(maxlen=max(int(window / interval), 2))
+        self.last_total = None
+
+    def sample(self, total: float):
+        if self.last_total is not None:
+            self.rates.append((total - self.last_total) / self.interval)
+        self.last_total = total
+
+    def mean(self) -> float:
+        return sum(self.rates) / len(self.rates) if self.rates else 0.0
+
+    def variance(self) -> float:
+        if not self.rates:
+            return 0.0
+        mean = self.mean()
+        return sum((x - mean) ** 2 for x in self.rates) / len(self.rates)
+
+
+class BotMetrics(MetricsRegistry):
+    def __init__(self) -> None:
+        super().__init__()
+        self.bots_online = self.gauge('houdini_bot_online', 'Bots online per room', ('room',))
+        self.actions = self.counter('houdini_bot_actions_total', 'Packets sent by bots per action family', ('action',))
+        self.fanout = self.histogram('houdini_bot_handler_fanout', 'Bots dispatched to per handled packet',
+                                     ('handler',), buckets=(1, 10, 50, 100, 200, 500, 1000, 2000))
+        self.rotation_duration = self.histogram('houdini_bot_rotation_seconds', 'Duration of bot rotations',
+                                                ('rotation',))
+        self.db_queries = self.counter('houdini_bot_db_queries_total', 'Bot database operations', ('operation',))
+        self.db_latency = self.histogram('houdini_bot_db_query_seconds', 'Bot database operation latency',
+                                         ('operation',))
+        self.task_restarts = self.counter('houdini_bot_task_restarts_total', 'Supervised task restarts', ('task',))
+        self.action_rate = RateWindow(0.1, 60)
+        self.gauge('houdini_bot_action_rate', 'Mean bot packets per second over the last minute',
+                   collect=lambda: {(): self.action_rate.mean()})
+        self.gauge('houdini_bot_action_rate_variance', 'Variance of bot packets per second over the last minute, '
+                   'sampled every 100ms', collect=lambda: {(): self.action_rate.variance()})
+
+    def count_action(self, command: str):
+        self.actions.inc(ACTION_FAMILIES.get(command, 'other'))
+
+    def db_query(self, operation: str) -> HistogramTimer:
+        return HistogramTimer(self.db_latency, (operation,), lambda: self.db_queries.inc(operation))
@@ -1,17 +1,20 @@
 import asyncio
 import itertools
 import math
-import random
-from inspect import signature
 from typing import List, Tuple, TYPE_CHECKING
 
 import houdini.data.penguin
 from houdini.data.plugin import PenguinAttributeCollection
 from houdini.data.room import PenguinIglooRoom, PenguinIglooRoomCollection, Room, RoomWaddle
 from houdini.penguin import Penguin
+from houdini.plugins.bot.accounting import accounted
+from houdini.plugins.bot.chat import PRIORITY_HIGH, PRIORITY_LOW, PRIORITY_NORMAL
+from houdini.plugins.bot.config import BotConfig
 from houdini.plugins.bot.fake_writer import FakeWriter
 from houdini.plugins.bot.constants import ITEM_TYPE, ROOM_AREAS, ROOM_SPOTS, SAFE_MESSAGES, RoomSpot, RoomSpotsController
 from houdini.plugins.bot.games import SledRacing
+from houdini.plugins.bot.snapshot import OUTFIT, BotState
+from houdini.plugins.bot.tracer import ACTION_CODES
 if TYPE_CHECKING:
     from houdini.plugins.bot.bot_plugin import BotPlugin
 
@@ -20,81 +23,141 @@ class PenguinBot(Penguin):
     
     snowball_margin = 25
     movement_speed = 75
-    default_greeting_messages = [SAFE_MESSAGES.HI_THERE, SAFE_MESSAGES.HOW_U_DOING]
-    default_interaction_distance = 100
-    default_spot_distance = 10
-    default_max_spot_prob = 0.75
-    default_igloo_room_weight = 0.5
-    default_partying_igloo_room_weight = 2
     valid_frames = range(18, 27)
     activity_cycle_range = range(10, 30)
     activity_sleep_range = range(5, 16)
     spot_sleep_range = range(30, 120)
+    approach_distance = 30
+    reaction_actions = {
+        'follow': lambda bot, p, _: bot.follow_penguin(p),
+        'unfollow': lambda bot, p, _: bot.stop_following_penguin(),
+        'randomize_clothes': lambda bot, p, _: bot.randomize_clothes(cosmetic=False),
+        'random_move': lambda bot, p, _: bot.random_move(cosmetic=False),
+        'approach': lambda bot, p, _: bot.approach(p),
+        'say': lambda bot, p, value: bot.say(value),
+        'emote': lambda bot, p, value: bot.emote(value),
+        'frame': lambda bot, p, value: bot.strike_frame(value),
+    }
     
     def __init__(self, penguin_id: str, bot_plugin: 'BotPlugin'):
         self.penguin_id = penguin_id
         self.bot_plugin = bot_plugin
-        self.plugin_config = bot_plugin.plugin_config
         self.server = bot_plugin.server
+        self.random = bot_plugin.bot_random(penguin_id)
         self.penguin_data = None
         self.following_penguin = None
         self.throwing_igloo_party = False
+        self.reserved_waddle = None
         
         self.frame = 18
         self._activity_task = None
         
         super().__init__(self.server, None, FakeWriter())
         
+    @property
+    def config(self) -> BotConfig:
+        return self.bot_plugin.config
+
     def load_data(self, data: houdini.data.penguin.Penguin) -> 'PenguinBot':
         self.update(**data.to_dict())
         return self
         
     async def init(self):
+        await self.load()
+        await self.move_to_random_room()
+        self.randomize_position()
+        if self.config.random_clothing_on_startup:
+            await self.randomize_clothes()
+        elif self.config.no_clothing:
+            self.reset_clothes()
+
+    async def load(self):
         self.server.penguins_by_id[self.id] = self
         self.server.penguins_by_username[self.username] = self
 
         if self.character is not None:
             self.server.penguins_by_character_id[self.character] = self
         
-        self.igloo_rooms = await PenguinIglooRoomCollection.get_collection(self.id)
-        self.attributes = await PenguinAttributeCollection.get_collection(self.id)
-        
-        await self.move_to_random_room()
-        self.randomize_position()
-        if self.plugin_config.get('random_clothing_on_startup', True):
-            await self.randomize_clothes()
-        elif self.plugin_config.get('no_clothing', False):
-            self.reset_clothes()
+        async with self.bot_plugin.db_gate.acquire(), self.bot_plugin.metrics.db_query('init'):
+            self.igloo_rooms = await PenguinIglooRoomCollection.get_collection(self.id)
+            self.attributes = await PenguinAttributeCollection.get_collection(self.id)
+
+    async def restore(self, state: BotState):
+        for name, value in zip(OUTFIT, state.outfit):
+            setattr(self, name, value)
+        if state.igloo_owner_id:
+            room = self.server.open_igloos_by_penguin_id.get(state.igloo_owner_id)
+        else:
+            room = self.server.rooms.get(state.room_id)
+        if room is None:
+            await self.move_to_random_room()
+            self.randomize_position()
+            return
+        self.x, self.y, self.frame = state.x, state.y, state.frame
+        await self.join_room(room)
+        self.trace('join_room')
             
+    async def send_room_xt(self, *data, cosmetic: bool = False):
+        self.bot_plugin.metrics.count_action(data[0])
+        tracer = self.bot_plugin.tracer
+        if tracer is not None:
+            action = ACTION_CODES.get(data[0])
+            if action is not None:
+                tracer.record_packet(self.id, self.room.id, action, data)
+        if cosmetic and self.bot_plugin.backpressure is not None:
+            await self.bot_plugin.backpressure.send(self, data)
+        else:
+            await self.room.send_xt(*data)
+
+    async def send_chat(self, command: str, value: int, priority: int = PRIORITY_NORMAL):
+        chat = self.bot_plugin.chat
+        if chat is None or chat.allow(self.room, command, value, priority):
+            await self.send_room_xt(command, self.id, value)
+
+    def trace(self, action: str, *args: int):
+        if self.bot_plugin.tracer is not None:
+            self.bot_plugin.tracer.record(self.id, self.room.id if self.room else 0, ACTION_CODES[action], *args)
+
     def begin_activity(self):
-        self._activity_task = asyncio.create_task(self.activity_loop())
+        self._activity_task = self.bot_plugin.tasks.spawn(self.activity_loop, bot_id=self.id, restart=True)
         
+    def activity_delay(self, sleep_range: range) -> float:
+        if self.config.phase_spread:
+            return self.random.uniform(sleep_range.start, sleep_range.stop - 1)
+        return self.random.choice(sleep_range)
+
     async def activity_loop(self):
+        if self.config.phase_spread:
+            await asyncio.sleep(self.random.uniform(0, self.activity_sleep_range.stop))
         while True:
-            for _ in range(random.choice(self.activity_cycle_range)):
+            for _ in range(self.random.choice(self.activity_cycle_range)):
                 if self.throwing_igloo_party:
-                    await self.room.send_xt('ss', self.id, SAFE_MESSAGES.PARTY_AT_MY_IGLOO)
-                if self.plugin_config.get('enable_room_spots', True):
+                    await self.send_chat('ss', SAFE_MESSAGES.PARTY_AT_MY_IGLOO, PRIORITY_LOW)
+                if self.bot_plugin.is_behavior_enabled('enable_room_spots'):
                     await self.move_to_spot()
-                if self.plugin_config.get('enable_random_frame', True):
-                    await asyncio.sleep(random.choice(self.activity_sleep_range))
+                if self.bot_plugin.is_behavior_enabled('enable_random_frame'):
+                    await asyncio.sleep(self.activity_delay(self.activity_sleep_range))
                     await self.random_frame()
-                if self.plugin_config.get('enable_random_movement', True):
-                    await asyncio.sleep(random.choice(self.activity_sleep_range))
+                if self.bot_plugin.is_behavior_enabled('enable_random_movement'):
+                    await asyncio.sleep(self.activity_delay(self.activity_sleep_range))
                     await self.random_move()
-            if self.plugin_config.get('enable_random_room_movement', True) and self.following_penguin is None:
-                await asyncio.sleep(random.choice(self.activity_sleep_range))
+                if not (self.bot_plugin.is_behavior_enabled('enable_random_frame') or
+                        self.bot_plugin.is_behavior_enabled('enable_random_movement')):
+                    await asyncio.sleep(self.activity_delay(self.activity_sleep_range))
+            if self.bot_plugin.is_behavior_enabled('enable_random_room_movement') and self.following_penguin is None:
+                await asyncio.sleep(self.activity_delay(self.activity_sleep_range))
                 await self.move_to_random_room()
             
+    @accounted('move_to_spot')
     async def move_to_spot(self):
         spots_controller = ROOM_SPOTS[self.room.id]
-        max_spot_prob = self.plugin_config.get("spot_max_probability", self.default_max_spot_prob)
-        if random.random() > min(spots_controller.len_spots() / 3, max_spot_prob):
+        config = self.config
+        if self.random.random() > min(spots_controller.len_spots() / 3, config.spot_max_probability):
             return
         with PenguinBotRoomSpots(spots_controller, self) as spot:
             position_already_taken = False
+            spot_distance = config.spot_distance
             for penguin in self.room.penguins_by_id.values():
-                spot_distance = self.plugin_config.get('spot_distance', self.default_spot_distance)
                 penguin_distance = math.dist(spot.position, (penguin.x, penguin.y))
                 if not isinstance(penguin, self.__class__) and penguin_distance <= spot_distance:
                     position_already_taken = True
@@ -104,7 +167,7 @@ class PenguinBot(Penguin):
                 distance = math.dist((self.x, self.y), spot.position)
                 self.x, self.y = spot.position
                 self.frame = spot.frame
-                await self.room.send_xt('sp', self.id, self.x, self.y)
+                await self.send_room_xt('sp', self.id, self.x, self.y, cosmetic=True)
                 if spot.clothes:
                     self.head = spot.clothes.get(ITEM_TYPE.HEAD, 0)
                     self.face = spot.clothes.get(ITEM_TYPE.FACE, 0)
@@ -114,77 +177,96 @@ class PenguinBot(Penguin):
                     self.feet = spot.clothes.get(ITEM_TYPE.FEET, 0)
                     await self.sync_clothes()
                 await asyncio.sleep(distance / self.movement_speed + 2)
-                await self.room.send_xt('sf', self.id, self.frame)
+                await self.send_room_xt('sf', self.id, self.frame, cosmetic=True)
                 
-            await asyncio.sleep(random.choice(self.spot_sleep_range))
+            await asyncio.sleep(self.activity_delay(self.spot_sleep_range))
             
         await self.random_move()
         await self.sync_clothes()
     
+    @accounted('random_frame')
     async def random_frame(self):
-        self.frame = random.choice(self.valid_frames)
-        await self.room.send_xt('sf', self.id, self.frame)
+        self.frame = self.random.choice(self.valid_frames)
+        await self.send_room_xt('sf', self.id, self.frame, cosmetic=True)
             
-    async def random_move(self):
+    @accounted('random_move')
+    async def random_move(self, cosmetic: bool = True):
         self.randomize_position()
-        await self.room.send_xt('sp', self.id, self.x, self.y)
+        await self.send_room_xt('sp', self.id, self.x, self.y, cosmetic=cosmetic)
             
+    @accounted('handle_join_room')
     async def handle_join_room(self, p, room: Room):
         if self.following_penguin and p.id == self.following_penguin.id:
-            await self.join_room(room)
-        elif room.id == self.room.id and len(self.room.penguins_by_id) < 4 and self.plugin_config.get('enable_greeting', True):
+            if self.bot_plugin.is_drained(room):
+                await self.stop_following_penguin()
+            else:
+                await self.join_room(room)
+        elif room.id == self.room.id and len(self.room.penguins_by_id) < 4 and self.config.enable_greeting:
             await self.greet()
     
+    @accounted('greet')
     async def greet(self):
-        for message in self.plugin_config.get('greeting_messages', self.default_greeting_messages):
+        for message in self.config.greeting_messages:
             await asyncio.sleep(3)
-            await self.room.send_xt('ss', self.id, message)
+            await self.send_chat('ss', message)
             
+    @accounted('handle_snowball')
     async def handle_snowball(self, p, x: int, y: int):
         if (x in range(self.x - self.snowball_margin, self.x + self.snowball_margin) and
             y in range(self.y - self.snowball_margin, self.y + self.snowball_margin)):
             await asyncio.sleep(1)
-            snowball_reactions = [
-                (self.lament_snowball, self.plugin_config.get('enable_snowball_lament', True)),
-                (self.throw_snowball_back, self.plugin_config.get('enable_snowball_throwback', True))
-            ]
-            enabled_reactions = [f for f, e in snowball_reactions if e]
-            if enabled_reactions:
-                await random.choice(enabled_reactions)(p)
+            reactions = self.config.snowball_reactions
+            if reactions:
+                await getattr(self, self.random.choice(reactions))(p)
             
     async def lament_snowball(self, _):
-        await self.room.send_xt('se', self.id, 4)
+        await self.send_chat('se', 4, PRIORITY_HIGH)
         
     async def throw_snowball_back(self, p):
-        await self.room.send_xt('sb', self.id, p.x, p.y)
+        await self.send_room_xt('sb', self.id, p.x, p.y)
             
+    @accounted('handle_safe_message')
     async def handle_safe_message(self, p, message_id: int):
-        if not (p.room and p.room.id == self.room.id and self.is_player_close(p)):
+        reactions = self.config.safe_message_reactions.get(message_id)
+        if not (reactions and p.room and p.room.id == self.room.id and self.is_player_close(p)):
             return
-        message_handlers = {
-            SAFE_MESSAGES.FOLLOW_ME: (self.follow_penguin, self.plugin_config.get('enable_follow_mode', True)),
-            SAFE_MESSAGES.GO_AWAY: (self.stop_following_penguin, self.plugin_config.get('enable_follow_mode', True)),
-            SAFE_MESSAGES.U_ARE_SILLY: (self.randomize_clothes, self.plugin_config.get('enable_random_clothing', True)),
-            SAFE_MESSAGES.WHERE: (self.random_move, self.plugin_config.get('enable_random_movement_on_demand', True))
-        }
-        enabled_handlers = {k: f for k, (f, e) in message_handlers.items() if e}
-        handler = enabled_handlers.get(message_id)
-        if handler:
-            if len(signature(handler).parameters) > 0:
-                return await handler(p)
-            await handler()
-            
+        for reaction in reactions:
+            if reaction.chance < 1 and self.random.random() >= reaction.chance:
+                continue
+            if reaction.delay:
+                await asyncio.sleep(reaction.delay)
+            await self.reaction_actions[reaction.action](self, p, reaction.value)
+
+    async def say(self, message_id: int):
+        await self.send_chat('ss', message_id)
+
+    async def emote(self, emote_id: int):
+        await self.send_chat('se', emote_id)
+
+    async def strike_frame(self, frame: int):
+        self.frame = frame
+        await self.send_room_xt('sf', self.id, frame)
+
+    async def approach(self, p):
+        self.x = p.x + self.random.randint(-self.approach_distance, self.approach_distance)
+        self.y = p.y + self.random.randint(-self.approach_distance // 2, self.approach_distance // 2)
+        await self.send_room_xt('sp', self.id, self.x, self.y)
+
     async def follow_penguin(self, p):
         if self.following_penguin is not None:
             return
         self.following_penguin = p
-        await self.room.send_xt('ss', self.id, SAFE_MESSAGES.OK)
+        self.bot_plugin.availability.set_busy(self, 'follow')
+        self.trace('follow', p.id)
+        await self.send_chat('ss', SAFE_MESSAGES.OK, PRIORITY_HIGH)
     
     async def stop_following_penguin(self):
         if self.following_penguin is None:
             return
         self.following_penguin = None
-        await self.room.send_xt('ss', self.id, SAFE_MESSAGES.SEE_U_LATER)
+        self.bot_plugin.availability.set_busy(self, 'follow', False)
+        self.trace('unfollow')
+        await self.send_chat('ss', SAFE_MESSAGES.SEE_U_LATER, PRIORITY_HIGH)
         await asyncio.sleep(2)
         await self.move_to_random_room()
         
@@ -195,11 +277,13 @@ class PenguinBot(Penguin):
     def open_igloo(self):
         if self.id in self.server.penguins_by_id:
             self.server.open_igloos_by_penguin_id[self.id] = self.igloo_room
+            self.trace('igloo_open')
         
     def close_igloo(self):
         self.throwing_igloo_party = False
         if self.id in self.server.open_igloos_by_penguin_id:
             del self.server.open_igloos_by_penguin_id[self.id]
+            self.trace('igloo_close')
     
     async def disconnect(self):
         del self.server.peers_by_ip[self.peer_name]
@@ -212,45 +296,53 @@ class PenguinBot(Penguin):
             
         self.close_igloo()
 
-        await self.room.remove_penguin(self)
-        self._activity_task.cancel()
+        self.bot_plugin.tasks.cancel_bot(self.id)
         self._activity_task = None
+        # A game task cancelled before it started never gives its seat back
+        self.release_waddle_reservation()
+        if self.waddle:
+            await self.waddle.remove_penguin(self)
+        await self.room.remove_penguin(self)
+        if self.bot_plugin.leases is not None:
+            await self.bot_plugin.leases.release(self.id)
         self.server.logger.info(f'{self.username} disconnected')
     
     def is_player_close(self, p) -> bool:
-        return math.dist((self.x, self.y), (p.x, p.y)) < self.plugin_config.get(
-            'interaction_distance', self.default_interaction_distance)
+        return math.dist((self.x, self.y), (p.x, p.y)) < self.config.interaction_distance
     
     async def randomize_igloo(self) -> PenguinIglooRoom:
-        return await self.igloo_room.update(
-            type=random.choice(list(self.server.igloos.keys())),
-            location=random.choice(list(self.server.locations.keys()))
-        ).apply()
+        async with self.bot_plugin.db_gate.acquire(), self.bot_plugin.metrics.db_query('randomize_igloo'):
+            return await self.igloo_room.update(
+                type=self.random.choice(list(self.server.igloos.keys())),
+                location=self.random.choice(list(self.server.locations.keys()))
+            ).apply()
     
-    async def randomize_clothes(self):
-        self.color = random.choice(self.bot_plugin.items_by_type[ITEM_TYPE.COLOR]).id
-        self.head = random.choice(self.bot_plugin.items_by_type[ITEM_TYPE.HEAD]).id
-        self.face = random.choice(self.bot_plugin.items_by_type[ITEM_TYPE.FACE]).id
-        self.neck = random.choice(self.bot_plugin.items_by_type[ITEM_TYPE.NECK]).id
-        self.body = random.choice(self.bot_plugin.items_by_type[ITEM_TYPE.BODY]).id
-        self.hand = random.choice(self.bot_plugin.items_by_type[ITEM_TYPE.HAND]).id
-        self.feet = random.choice(self.bot_plugin.items_by_type[ITEM_TYPE.FEET]).id
-        self.flag = random.choice(self.bot_plugin.items_by_type[ITEM_TYPE.FLAG]).id
-        self.photo = random.choice(self.bot_plugin.items_by_type[ITEM_TYPE.PHOTO]).id
-        await self.sync_clothes()
+    @accounted('randomize_clothes')
+    async def randomize_clothes(self, cosmetic: bool = True):
+        self.color = self.random.choice(self.bot_plugin.items_by_type[ITEM_TYPE.COLOR]).id
+        self.head = self.random.choice(self.bot_plugin.items_by_type[ITEM_TYPE.HEAD]).id
+        self.face = self.random.choice(self.bot_plugin.items_by_type[ITEM_TYPE.FACE]).id
+        self.neck = self.random.choice(self.bot_plugin.items_by_type[ITEM_TYPE.NECK]).id
+        self.body = self.random.choice(self.bot_plugin.items_by_type[ITEM_TYPE.BODY]).id
+        self.hand = self.random.choice(self.bot_plugin.items_by_type[ITEM_TYPE.HAND]).id
+        self.feet = self.random.choice(self.bot_plugin.items_by_type[ITEM_TYPE.FEET]).id
+        self.flag = self.random.choice(self.bot_plugin.items_by_type[ITEM_TYPE.FLAG]).id
+        self.photo = self.random.choice(self.bot_plugin.items_by_type[ITEM_TYPE.PHOTO]).id
+        await self.sync_clothes(cosmetic)
             
-    async def sync_clothes(self):
+    @accounted('sync_clothes')
+    async def sync_clothes(self, cosmetic: bool = True):
         if not self.room:
             return
-        await self.room.send_xt('upc', self.id, self.color)
-        await self.room.send_xt('uph', self.id, self.head)
-        await self.room.send_xt('upf', self.id, self.face)
-        await self.room.send_xt('upn', self.id, self.neck)
-        await self.room.send_xt('upb', self.id, self.body)
-        await self.room.send_xt('upa', self.id, self.hand)
-        await self.room.send_xt('upe', self.id, self.feet)
-        await self.room.send_xt('upl', self.id, self.flag)
-        await self.room.send_xt('upp', self.id, self.photo)
+        await self.send_room_xt('upc', self.id, self.color, cosmetic=cosmetic)
+        await self.send_room_xt('uph', self.id, self.head, cosmetic=cosmetic)
+        await self.send_room_xt('upf', self.id, self.face, cosmetic=cosmetic)
+        await self.send_room_xt('upn', self.id, self.neck, cosmetic=cosmetic)
+        await self.send_room_xt('upb', self.id, self.body, cosmetic=cosmetic)
+        await self.send_room_xt('upa', self.id, self.hand, cosmetic=cosmetic)
+        await self.send_room_xt('upe', self.id, self.feet, cosmetic=cosmetic)
+        await self.send_room_xt('upl', self.id, self.flag, cosmetic=cosmetic)
+        await self.send_room_xt('upp', self.id, self.photo, cosmetic=cosmetic)
             
     def reset_clothes(self):
         self.head = None
@@ -268,53 +360,78 @@ class PenguinBot(Penguin):
     def random_position_in_room(self, points: List[Tuple[int, int]]):
         triangles = [(points[0], a, b) for a, b in itertools.pairwise(points[1:])]
         triangles_areas = [0.5 * abs(x1 * (y2 - y3) + x2 * (y3 - y1) + x3 * (y1 - y2)) for (x1, y1), (x2, y2), (x3, y3) in triangles]
-        (x1, y1), (x2, y2), (x3, y3) = random.choices(triangles, weights=triangles_areas)[0]
+        (x1, y1), (x2, y2), (x3, y3) = self.random.choices(triangles, weights=triangles_areas)[0]
         
-        r1 = random.random()
-        r2 = random.random()
+        r1 = self.random.random()
+        r2 = self.random.random()
         s1 = math.sqrt(r1)
         
         self.x = int(x1 * (1.0 - s1) + x2 * (1.0 - r2) * s1 + x3 * r2 * s1)
         self.y = int(y1 * (1.0 - s1) + y2 * (1.0 - r2) * s1 + y3 * r2 * s1)
         
+    @accounted('move_to_random_room')
     async def move_to_random_room(self):
-        bot_rooms = self.plugin_config.get('bot_rooms', self.bot_plugin.default_room_ids)
-        available_rooms = [self.bot_plugin.server.rooms[x] for x in bot_rooms if self.room is None or x != self.room.id]
-        set_room_weights = self.plugin_config.get('room_weights', {})
-        room_weights = [set_room_weights.get(str(x.id), 1) for x in available_rooms]
+        config = self.config
+        room_ids, weights = config.room_choices.get(self.room.id if self.room else None, config.room_choices[None])
+        available_rooms = [self.server.rooms[x] for x in room_ids]
+        room_weights = list(weights)
+        drained = self.bot_plugin.drained_rooms
+        if drained and any(x not in drained for x in room_ids):
+            room_weights = [w for x, w in zip(room_ids, room_weights) if x not in drained]
+            available_rooms = [x for x in available_rooms if x.id not in drained]
         
         igloos = self.server.open_igloos_by_penguin_id.values()
-        igloo_standard_weight = self.plugin_config.get('igloo_room_weight', self.default_igloo_room_weight)
-        partying_igloo_weight = self.plugin_config.get('partying_igloo_room_weight', self.default_igloo_room_weight)
+        igloo_standard_weight = config.igloo_room_weight
+        partying_igloo_weight = config.partying_igloo_room_weight
         igloo_weights = [partying_igloo_weight if not isinstance(
             self.server.penguins_by_id[i.penguin_id], self.__class__) or 
                          self.server.penguins_by_id[i.penguin_id].throwing_igloo_party
                          else igloo_standard_weight for i in igloos]
         available_rooms += igloos
         room_weights += igloo_weights
-        await self.join_room(random.choices(available_rooms, weights=room_weights)[0])
+        await self.join_room(self.random.choices(available_rooms, weights=room_weights)[0])
+        self.trace('join_room')
         
     async def join_game(self, target_penguin: Penguin, waddle: RoomWaddle):
-        if waddle.id in self.plugin_config.get('bot_waddles', self.bot_plugin.default_waddle_ids):
-            asyncio.create_task(self.play_game(target_penguin, waddle))
-        
-    async def play_game(self, target_penguin: Penguin, waddle: RoomWaddle):
-        self.server.logger.info(f'{self.username} scheduled to join waddle {waddle.id}')
-        await asyncio.sleep(self.plugin_config.get('waddle_join_delay', self.bot_plugin.default_waddle_join_delay))
+        self.bot_plugin.tasks.spawn(self.play_game, target_penguin, waddle, bot_id=self.id)
         
-        if target_penguin.waddle != waddle:
-            self.server.logger.info(f"Penguin {target_penguin.username} no longer on waddle room, aborting...")
+    def release_waddle_reservation(self):
+        if self.reserved_waddle is None:
             return
-        
-        previous_room = self.room
-        await waddle.add_penguin(self)
-        
-        if waddle.game == 'sled':
-            game = SledRacing(self)
-            await game.play(waddle.id, random.choice(list(game.waddles[waddle.id].keys())))
-            
-        if previous_room:
-            await self.join_room(previous_room)
+        reservations = self.bot_plugin.waddle_reservations
+        remaining = [x for x in reservations.get(self.reserved_waddle, ()) if x[0] is not self]
+        if remaining:
+            reservations[self.reserved_waddle] = remaining
+        else:
+            reservations.pop(self.reserved_waddle, None)
+        self.reserved_waddle = None
+
+    async def play_game(self, target_penguin: Penguin, waddle: RoomWaddle):
+        # The bot was reserved by the plugin, both the seat and the bot are given back however this ends
+        try:
+            self.server.logger.info(f'{self.username} scheduled to join waddle {waddle.id}')
+            await asyncio.sleep(self.config.waddle_join_delay)
+
+            if target_penguin.waddle != waddle or None not in waddle.penguins:
+                self.server.logger.info(f"Penguin {target_penguin.username} no longer on waddle room, aborting...")
+                return
+
+            previous_room = self.room
+            self.release_waddle_reservation()
+            await waddle.add_penguin(self)
+            self.trace('waddle_join', waddle.id)
+
+            if waddle.game == 'sled':
+                game = SledRacing(self)
+                await game.play(waddle.id, self.random.choice(game.traces.difficulties(waddle.id)))
+
+            if previous_room and self.bot_plugin.is_drained(previous_room):
+                await self.move_to_random_room()
+            elif previous_room:
+                await self.join_room(previous_room)
+        finally:
+            self.release_waddle_reservation()
+            self.bot_plugin.availability.set_busy(self, 'game', False)
 
 
 class PenguinBotRoomSpots:
@@ -328,6 +445,7 @@ class PenguinBotRoomSpots:
         
     def __enter__(self):
         self.spot = next(x.pop(0) for x in self.controller.spots if x)
+        self.bot.bot_plugin.availability.set_busy(self.bot, 'spot')
         self.clothes = {
             ITEM_TYPE.HEAD: self.bot.head,
             ITEM_TYPE.FACE: self.bot.face,
@@ -346,3 +464,4 @@ class PenguinBotRoomSpots:
         self.bot.hand = self.clothes[ITEM_TYPE.HAND]
         self.bot.feet = self.clothes[ITEM_TYPE.FEET]
         self.controller.spots[self.spot.priority - 1].append(self.spot)
+        self.bot.bot_plugin.availability.set_busy(self.bot, 'spot', False)
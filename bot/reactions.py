@@ -0,0 +1,52 @@
+from dataclasses import dataclass
+
+from houdini.plugins.bot.constants import SAFE_MESSAGES
+
+# Actions taking a value: the safe message to say, the emote to send or the frame to strike
+VALUE_ACTIONS = {'say', 'emote', 'frame'}
+ACTIONS = {'follow', 'unfollow', 'randomize_clothes', 'random_move', 'approach'} | VALUE_ACTIONS
+
+# message id -> (action, flag that enables it)
+BUILTIN_REACTIONS = {
+    SAFE_MESSAGES.FOLLOW_ME: ('follow', 'enable_follow_mode'),
+    SAFE_MESSAGES.GO_AWAY: ('unfollow', 'enable_follow_mode'),
+    SAFE_MESSAGES.U_ARE_SILLY: ('randomize_clothes', 'enable_random_clothing'),
+    SAFE_MESSAGES.WHERE: ('random_move', 'enable_random_movement_on_demand'),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Reaction:
+    action: str
+    value: int | None = None
+    chance: float = 1.0
+    delay: float = 0
+
+
+def compile_reactions(enabled_flags: frozenset[str], custom: list[dict]) -> dict[int, tuple[Reaction, ...]]:
+    table: dict[int, list[Reaction]] = {}
+    for message_id, (action, flag) in BUILTIN_REACTIONS.items():
+        if flag in enabled_flags:
+            table.setdefault(message_id, []).append(Reaction(action))
+    for entry in custom:
+        table.setdefault(entry['message'], []).append(Reaction(
+            entry['action'], entry.get('value'), entry.get('chance', 1.0), entry.get('delay', 0)))
+    return {k: tuple(v) for k, v in table.items()}
+
+
+def validate_reaction(index: int, entry) -> str | None:
+    if not isinstance(entry, dict):
+        return f'entry {index} must be an object'
+    if not isinstance(entry.get('message'), int) or isinstance(entry.get('message'), bool):
+        return f'entry {index} needs an integer message id'
+    if entry.get('action') not in ACTIONS:
+        return f'entry {index} action must be one of {", ".join(sorted(ACTIONS))}'
+    if entry['action'] in VALUE_ACTIONS and (not isinstance(entry.get('value'), int) or
+                                             isinstance(entry.get('value'), bool)):
+        return f'entry {index} action {entry["action"]} needs an integer value'
+    chance, delay = entry.get('chance', 1.0), entry.get('delay', 0)
+    if isinstance(chance, bool) or not isinstance(chance, (int, float)) or not 0 <= chance <= 1:
+        return f'entry {index} chance must be between 0 and 1'
+    if isinstance(delay, bool) or not isinstance(delay, (int, float)) or delay < 0:
+        return f'entry {index} delay must be a non-negative number of seconds'
+    return None
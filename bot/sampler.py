@@ -0,0 +1,85 @@
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+PLUGIN_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+IDLE_FUNCTIONS = {'select', 'poll', 'control'}
+
+
+def classify(filename: str) -> str | None:
+    if not filename.startswith(PLUGIN_DIRECTORY):
+        return None
+    name = os.path.basename(filename)
+    if name == 'penguin_bot.py':
+        return 'PenguinBot'
+    if name == 'bot_plugin.py':
+        return 'BotPlugin'
+    return 'bot'
+
+
+class SamplingProfiler:
+    def __init__(self, interval_ms: float = 5, output_dir: str | None = None, thread_id: int | None = None) -> None:
+        self.interval = interval_ms / 1000
+        self.output_dir = output_dir or PLUGIN_DIRECTORY
+        self.thread_id = thread_id or threading.main_thread().ident
+        self.stacks = Counter()
+        self.tags = Counter()
+        self.started = None
+        self._thread = None
+        self._stop = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(self):
+        if self.running:
+            return
+        self.stacks.clear()
+        self.tags.clear()
+        self._stop.clear()
+        self.started = time.time()
+        self._thread = threading.Thread(target=self._sample_loop, name='bot-sampling-profiler', daemon=True)
+        self._thread.start()
+
+    def stop(self, filename: str | None = None) -> str | None:
+        if not self.running:
+            return None
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        filename = filename or os.path.join(self.output_dir, f'bot_profile_{int(self.started)}.folded')
+        self.write(filename)
+        return filename
+
+    def _sample_loop(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.sample(frame)
+
+    def sample(self, frame):
+        stack, tag = [], 'houdini'
+        while frame is not None:
+            code = frame.f_code
+            stack.append(f'{os.path.basename(code.co_filename)}:{getattr(code, "co_qualname", code.co_name)}')
+            frame_tag = classify(code.co_filename)
+            if frame_tag is not None and tag in ('houdini', 'bot'):
+                tag = frame_tag
+            frame = frame.f_back
+        if tag == 'houdini' and stack and stack[0].rsplit(':', 1)[-1].rsplit('.', 1)[-1] in IDLE_FUNCTIONS:
+            tag = 'idle'
+        stack.append(tag)
+        self.stacks[';'.join(reversed(stack))] += 1
+        self.tags[tag] += 1
+
+    def summary(self) -> str:
+        total = sum(self.tags.values()) or 1
+        return ', '.join(f'{tag} {count / total:.1%}' for tag, count in self.tags.most_common())
+
+    def write(self, filename: str):
+        with open(filename, 'w') as f:
+            for stack, count in self.stacks.items():
+                f.write(f'{stack} {count}\n')
@@ -0,0 +1,96 @@
+import json
+import mmap
+import os
+import struct
+from argparse import ArgumentParser
+
+MAGIC = b'BSLD'
+VERSION = 1
+# magic, version, move size, trace count
+HEADER = struct.Struct('<4sHHI')
+# waddle id, difficulty, first move, move count
+ENTRY = struct.Struct('<H2x8sII')
+# x, y, milliseconds since the race started
+MOVE = struct.Struct('<iii')
+
+
+class SledTraceStore:
+    def __init__(self, filename: str) -> None:
+        self.filename = filename
+        self._map = None
+        self._moves_offset = 0
+        # waddle id -> difficulty -> (first move, move count) of every recorded trace
+        self._index: dict[int, dict[str, list[tuple[int, int]]]] | None = None
+
+    @property
+    def index(self) -> dict[int, dict[str, list[tuple[int, int]]]]:
+        if self._index is None:
+            self._open()
+        return self._index
+
+    def _open(self):
+        with open(self.filename, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, move_size, count = HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION or move_size != MOVE.size:
+            raise ValueError(f'{self.filename} is not a sled trace store')
+        index = {}
+        for waddle_id, difficulty, first, moves in ENTRY.iter_unpack(
+                self._map[HEADER.size:HEADER.size + count * ENTRY.size]):
+            index.setdefault(waddle_id, {}).setdefault(difficulty.rstrip(b'\0').decode(), []).append((first, moves))
+        self._moves_offset = HEADER.size + count * ENTRY.size
+        self._index = index
+
+    def difficulties(self, waddle_id: int) -> list[str]:
+        return list(self.index[waddle_id])
+
+    def count(self, waddle_id: int, difficulty: str) -> int:
+        return len(self.index[waddle_id][difficulty])
+
+    def moves(self, waddle_id: int, difficulty: str, trace: int) -> list[tuple[float, float, float]]:
+        first, count = self.index[waddle_id][difficulty][trace]
+        start = self._moves_offset + first * MOVE.size
+        # Floats keep the zm packets byte for byte what the recorded races sent
+        return [(float(x), float(y), float(t))
+                for x, y, t in MOVE.iter_unpack(self._map[start:start + count * MOVE.size])]
+
+
+def write_store(filename: str, waddles: dict):
+    entries, moves = [], []
+    for waddle_id, difficulties in waddles.items():
+        for difficulty, traces in difficulties.items():
+            for trace in traces:
+                entries.append(ENTRY.pack(int(waddle_id), difficulty.encode(), len(moves), len(trace)))
+                moves += [MOVE.pack(int(m['x']), int(m['y']), int(m['time'])) for m in trace]
+    with open(filename, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, MOVE.size, len(entries)))
+        f.write(b''.join(entries))
+        f.write(b''.join(moves))
+
+
+def load_literal(filename: str) -> dict:
+    with open(filename) as f:
+        source = f.read()
+    if filename.endswith('.json'):
+        return json.loads(source)
+    # The SledRacing.waddles literal of an older games.py, only needed when converting
+    import ast
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Assign) and any(getattr(x, 'id', None) == 'waddles' for x in node.targets):
+            return ast.literal_eval(node.value)
+    raise ValueError(f'{filename} has no waddles literal')
+
+
+def main():
+    parser = ArgumentParser(description='Convert recorded sled races into a sled trace store')
+    parser.add_argument('source', help='games.py holding a SledRacing.waddles literal, or the same data as JSON')
+    parser.add_argument('output', nargs='?', default=os.path.join(os.path.dirname(__file__), 'sled_traces.bin'))
+    args = parser.parse_args()
+    waddles = load_literal(args.source)
+    write_store(args.output, waddles)
+    traces = sum(len(x) for difficulties in waddles.values() for x in difficulties.values())
+    print(f'{traces} traces written to {args.output} ({os.path.getsize(args.output)} bytes)')
+
+
+if __name__ == '__main__':
+    main()
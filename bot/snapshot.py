@@ -0,0 +1,88 @@
+import os
+import struct
+import time
+from dataclasses import dataclass
+
+MAGIC = b'BSNP'
+VERSION = 1
+# magic, version, record size, saved at, bot count, seconds to the next bot rotation, seconds to the igloo rotation
+HEADER = struct.Struct('<4sHHdIff')
+# penguin id, room id, igloo owner id, x, y, frame, flags, outfit (-1 for empty slots)
+RECORD = struct.Struct('<IIIhhBB9i')
+OUTFIT = ('color', 'head', 'face', 'neck', 'body', 'hand', 'feet', 'flag', 'photo')
+FLAG_IGLOO_OPEN = 1
+FLAG_IGLOO_PARTY = 2
+
+
+@dataclass(frozen=True, slots=True)
+class BotState:
+    penguin_id: int
+    room_id: int
+    igloo_owner_id: int
+    x: int
+    y: int
+    frame: int
+    igloo_open: bool
+    igloo_party: bool
+    outfit: tuple[int | None, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class WorldSnapshot:
+    saved_at: float
+    bots: tuple[BotState, ...]
+    # Seconds left on the rotation timers when the snapshot was taken, 0 when unknown
+    bot_rotation_in: float = 0
+    igloo_rotation_in: float = 0
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.saved_at
+
+
+def capture(bots, open_igloo_ids, bot_rotation_in: float, igloo_rotation_in: float) -> WorldSnapshot:
+    states = []
+    for bot in bots:
+        room = bot.room
+        # Bots racing a sled are put back in a regular room on restore
+        if room is None or bot.waddle is not None or getattr(room, 'game', False):
+            room_id, owner_id = 0, 0
+        elif hasattr(room, 'penguin_id'):
+            room_id, owner_id = room.id, room.penguin_id
+        else:
+            room_id, owner_id = room.id, 0
+        states.append(BotState(bot.id, room_id, owner_id, int(bot.x), int(bot.y), bot.frame,
+                               bot.id in open_igloo_ids, bot.throwing_igloo_party,
+                               tuple(getattr(bot, x) for x in OUTFIT)))
+    return WorldSnapshot(time.time(), tuple(states), max(bot_rotation_in, 0), max(igloo_rotation_in, 0))
+
+
+def write_snapshot(filename: str, snapshot: WorldSnapshot):
+    data = bytearray(HEADER.pack(MAGIC, VERSION, RECORD.size, snapshot.saved_at, len(snapshot.bots),
+                                 snapshot.bot_rotation_in, snapshot.igloo_rotation_in))
+    for state in snapshot.bots:
+        flags = (FLAG_IGLOO_OPEN if state.igloo_open else 0) | (FLAG_IGLOO_PARTY if state.igloo_party else 0)
+        data += RECORD.pack(state.penguin_id, state.room_id, state.igloo_owner_id, state.x, state.y, state.frame,
+                            flags, *(-1 if x is None else x for x in state.outfit))
+    # A crash mid-write must never leave a torn snapshot behind
+    temp_filename = f'{filename}.tmp'
+    with open(temp_filename, 'wb') as f:
+        f.write(data)
+    os.replace(temp_filename, filename)
+
+
+def read_snapshot(filename: str) -> WorldSnapshot:
+    with open(filename, 'rb') as f:
+        data = f.read()
+    if len(data) < HEADER.size:
+        raise ValueError(f'{filename} is not a bot world snapshot')
+    magic, version, record_size, saved_at, count, bot_rotation_in, igloo_rotation_in = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+        raise ValueError(f'{filename} is not a bot world snapshot')
+    if len(data) != HEADER.size + count * RECORD.size:
+        raise ValueError(f'{filename} is truncated')
+    bots = tuple(
+        BotState(penguin_id, room_id, owner_id, x, y, frame, bool(flags & FLAG_IGLOO_OPEN),
+                 bool(flags & FLAG_IGLOO_PARTY), tuple(None if item < 0 else item for item in outfit))
+        for penguin_id, room_id, owner_id, x, y, frame, flags, *outfit in RECORD.iter_unpack(data[HEADER.size:]))
+    return WorldSnapshot(saved_at, bots, bot_rotation_in, igloo_rotation_in)
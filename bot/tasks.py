@@ -0,0 +1,77 @@
+import asyncio
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable
+
+
+@dataclass
+class TaskInfo:
+    kind: str
+    bot_id: int | None
+    created: float = field(default_factory=time.monotonic)
+    restarts: int = 0
+
+
+class TaskRegistry:
+    def __init__(self, logger, on_restart: Callable[[str], None] | None = None,
+                 initial_backoff: float = 5, max_backoff: float = 300, stable_after: float = 60) -> None:
+        self.logger = logger
+        self.on_restart = on_restart
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.stable_after = stable_after
+        self.tasks: dict[asyncio.Task, TaskInfo] = {}
+
+    def spawn(self, func, *args, kind: str | None = None, bot_id: int | None = None,
+              restart: bool = False, **kwargs) -> asyncio.Task:
+        info = TaskInfo(kind or func.__name__, bot_id)
+        coro = self._supervise(func, args, kwargs, info) if restart else func(*args, **kwargs)
+        task = asyncio.create_task(coro)
+        self.tasks[task] = info
+        task.add_done_callback(self._task_done)
+        return task
+
+    async def _supervise(self, func, args, kwargs, info: TaskInfo):
+        backoff = self.initial_backoff
+        while True:
+            started = time.monotonic()
+            try:
+                return await func(*args, **kwargs)
+            except Exception as error:
+                if time.monotonic() - started > self.stable_after:
+                    backoff = self.initial_backoff
+                info.restarts += 1
+                if self.on_restart is not None:
+                    self.on_restart(info.kind)
+                self.logger.error(f"Task {info.kind} done by exception, restarting in {backoff}s: {error}")
+                self.logger.exception(error)
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, self.max_backoff)
+
+    def _task_done(self, task: asyncio.Task):
+        info = self.tasks.pop(task, None)
+        if task.cancelled() or info is None:
+            return
+        error = task.exception()
+        if error is not None:
+            self.logger.error(f"Task {info.kind} of bot {info.bot_id} failed: {error}", exc_info=error)
+
+    def cancel_bot(self, bot_id: int):
+        current = asyncio.current_task()
+        for task, info in list(self.tasks.items()):
+            if info.bot_id == bot_id and task is not current:
+                task.cancel()
+
+    def cancel_all(self):
+        for task in list(self.tasks):
+            task.cancel()
+
+    def counts(self) -> Counter:
+        return Counter(info.kind for info in self.tasks.values())
+
+    def oldest_ages(self) -> dict[str, float]:
+        now, ages = time.monotonic(), {}
+        for info in self.tasks.values():
+            ages[info.kind] = max(ages.get(info.kind, 0), now - info.created)
+        return ages
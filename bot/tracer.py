@@ -0,0 +1,149 @@
+import mmap
+import os
+import struct
+import time
+from argparse import ArgumentParser
+from collections import Counter, defaultdict
+from itertools import groupby
+
+MAGIC = b'BTRC'
+VERSION = 2
+HEADER = struct.Struct('<4sHHIQ')
+HEADER_SIZE = 64
+# timestamp, bot id, room id, action, low 16 bits of the write index, args
+RECORD = struct.Struct('<dIIHHiii')
+RECORD_SIZE = RECORD.size
+INDEX = struct.Struct('<Q')
+INDEX_OFFSET = 12
+
+ACTIONS = [
+    'sp', 'sf', 'ss', 'se', 'sb', 'upc', 'uph', 'upf', 'upn', 'upb', 'upa', 'upe', 'upl', 'upp', 'zm',
+    'join_room', 'rotate_in', 'rotate_out', 'igloo_open', 'igloo_close', 'igloo_party', 'waddle_join',
+    'follow', 'unfollow', 'human_join_room', 'human_snowball', 'human_safe_message', 'human_join_waddle',
+]
+ACTION_CODES = {name: code for code, name in enumerate(ACTIONS, start=1)}
+HUMAN_ACTIONS = {ACTION_CODES[x] for x in ACTIONS if x.startswith('human_')}
+ROTATION_ACTIONS = {ACTION_CODES['rotate_in'], ACTION_CODES['rotate_out']}
+_now = time.time
+
+
+class ActionTracer:
+    def __init__(self, filename: str, capacity: int = 1_000_000, keep: int = 3) -> None:
+        self.filename = filename
+        self.capacity = capacity
+        self._rotate(keep)
+        size = HEADER_SIZE + capacity * RECORD.size
+        with open(filename, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, RECORD.size, capacity, 0).ljust(HEADER_SIZE, b'\0'))
+            f.truncate(size)
+        self._file = open(filename, 'r+b')
+        self._map = mmap.mmap(self._file.fileno(), size)
+        self._pack = RECORD.pack_into
+        self.index = 0
+
+    def _rotate(self, keep: int):
+        if not os.path.exists(self.filename):
+            return
+        for i in range(keep - 1, 0, -1):
+            if os.path.exists(f'{self.filename}.{i}'):
+                os.replace(f'{self.filename}.{i}', f'{self.filename}.{i + 1}')
+        if keep > 0:
+            os.replace(self.filename, f'{self.filename}.1')
+
+    def record(self, bot_id: int, room_id: int, action: int, a: int = 0, b: int = 0, c: int = 0):
+        index = self.index
+        self._pack(self._map, HEADER_SIZE + index % self.capacity * RECORD_SIZE, _now(), bot_id, room_id, action,
+                   index & 0xffff, a, b, c)
+        self.index = index + 1
+        if not index & 0x3ff:
+            INDEX.pack_into(self._map, INDEX_OFFSET, index + 1)
+
+    def record_packet(self, bot_id: int, room_id: int, action: int, data: tuple):
+        # data is an outgoing packet: command, bot id, then up to three integer arguments
+        try:
+            self.record(bot_id, room_id, action, *data[2:5])
+        except struct.error:
+            self.record(bot_id, room_id, action, *(x if type(x) is int else 0 for x in data[2:5]))
+
+    def close(self):
+        INDEX.pack_into(self._map, INDEX_OFFSET, self.index)
+        self._map.flush()
+        self._map.close()
+        self._file.close()
+
+
+def read_records(filename: str) -> list[tuple]:
+    with open(filename, 'rb') as f:
+        data = f.read()
+    magic, version, record_size, capacity, _ = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+        raise ValueError(f'{filename} is not a bot action trace')
+    # the header index is only flushed periodically, so slots are ordered by their timestamps instead, and
+    # records from the same clock tick by their wrapping sequence numbers
+    records = sorted((x for x in RECORD.iter_unpack(data[HEADER_SIZE:HEADER_SIZE + capacity * RECORD.size]) if x[0]),
+                     key=lambda x: x[0])
+    ordered = []
+    for _, tick in groupby(records, key=lambda x: x[0]):
+        tick = list(tick)
+        if len(tick) > 1:
+            first = tick[0][4]
+            tick.sort(key=lambda x: (x[4] - first + 0x8000) & 0xffff)
+        ordered += ((t, bot_id, room_id, action, a, b, c) for t, bot_id, room_id, action, _, a, b, c in tick)
+    return ordered
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    values = sorted(values)
+    return values[min(int(len(values) * fraction), len(values) - 1)] if values else 0.0
+
+
+def analyze(records: list[tuple], reaction_window: float = 10.0) -> dict:
+    if not records:
+        return {'records': 0}
+    # A stable sort keeps records from the same tick in the order read_records put them
+    records = sorted(records, key=lambda x: x[0])
+    duration = max(records[-1][0] - records[0][0], 1e-9)
+    room_actions = defaultdict(Counter)
+    pending_reactions = defaultdict(list)
+    latencies = defaultdict(list)
+    rotations = Counter()
+    for timestamp, bot_id, room_id, action, *_ in records:
+        name = ACTIONS[action - 1] if 0 < action <= len(ACTIONS) else str(action)
+        if action in HUMAN_ACTIONS:
+            pending_reactions[room_id].append((timestamp, name))
+            continue
+        room_actions[room_id][name] += 1
+        if action in ROTATION_ACTIONS:
+            rotations[name] += 1
+        waiting = pending_reactions.pop(room_id, [])
+        for event_time, event_name in waiting:
+            if timestamp - event_time <= reaction_window:
+                latencies[event_name].append(timestamp - event_time)
+    return {
+        'records': len(records),
+        'duration': duration,
+        'room_rates': {room: {k: v / duration for k, v in actions.items()} for room, actions in room_actions.items()},
+        'reaction_latency': {name: {'count': len(v), 'p50': percentile(v, 0.5), 'p99': percentile(v, 0.99)}
+                             for name, v in latencies.items()},
+        'rotation_churn_per_hour': {k: v * 3600 / duration for k, v in rotations.items()},
+    }
+
+
+def main():
+    parser = ArgumentParser(description='Analyze bot action traces')
+    parser.add_argument('files', nargs='+', help='Trace files to analyze')
+    parser.add_argument('--window', type=float, default=10.0, help='Maximum reaction latency in seconds')
+    args = parser.parse_args()
+    records = [r for filename in args.files for r in read_records(filename)]
+    result = analyze(records, args.window)
+    print(f"{result['records']} records over {result.get('duration', 0):.1f}s")
+    for room, rates in sorted(result.get('room_rates', {}).items()):
+        print(f'room {room}: ' + ', '.join(f'{k}={v:.2f}/s' for k, v in sorted(rates.items())))
+    for name, stats in sorted(result.get('reaction_latency', {}).items()):
+        print(f"reaction to {name}: n={stats['count']} p50={stats['p50'] * 1000:.0f}ms p99={stats['p99'] * 1000:.0f}ms")
+    for name, rate in sorted(result.get('rotation_churn_per_hour', {}).items()):
+        print(f'{name}: {rate:.1f}/h')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,3 @@
+from sim.world import RecordingWriter, SimulatedServer, SimulatedWorld, TrafficStats
+
+__all__ = ['RecordingWriter', 'SimulatedServer', 'SimulatedWorld', 'TrafficStats']
@@ -0,0 +1,62 @@
+import asyncio
+import selectors
+
+
+# Polls real file descriptors without blocking and advances the loop's virtual
+# clock by the timeout it would otherwise have slept for
+class VirtualTimeSelector(selectors.BaseSelector):
+    def __init__(self, loop: 'VirtualTimeEventLoop') -> None:
+        self.loop = loop
+        self.selector = selectors.DefaultSelector()
+
+    def register(self, fileobj, events, data=None):
+        return self.selector.register(fileobj, events, data)
+
+    def unregister(self, fileobj):
+        return self.selector.unregister(fileobj)
+
+    def modify(self, fileobj, events, data=None):
+        return self.selector.modify(fileobj, events, data)
+
+    def get_map(self):
+        return self.selector.get_map()
+
+    def close(self):
+        self.selector.close()
+
+    def select(self, timeout=None):
+        if timeout is None:
+            # Nothing is scheduled, only outside I/O or threads can wake the loop
+            return self.selector.select()
+        events = self.selector.select(0)
+        if not events and timeout > 0:
+            self.loop.advance(timeout)
+        return events
+
+
+class VirtualTimeEventLoop(asyncio.SelectorEventLoop):
+    def __init__(self, start: float = 0.0) -> None:
+        self.virtual_time = start
+        super().__init__(VirtualTimeSelector(self))
+
+    def time(self) -> float:
+        return self.virtual_time
+
+    def advance(self, seconds: float):
+        self.virtual_time += seconds
+
+
+def run_virtual(main, start: float = 0.0):
+    loop = VirtualTimeEventLoop(start)
+    try:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(main)
+    finally:
+        try:
+            for task in asyncio.all_tasks(loop):
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*asyncio.all_tasks(loop), return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
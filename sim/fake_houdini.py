@@ -0,0 +1,443 @@
+import asyncio
+import hashlib
+import itertools
+import logging
+import os
+import sys
+import types
+from contextlib import asynccontextmanager
+
+BOT_PACKAGE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'bot')
+
+
+class Column:
+    def __init__(self, default=None, unique: bool = False) -> None:
+        self.default = default
+        self.unique = unique
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        return instance.__dict__.get(self.name, self.default)
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.name] = value
+
+    def __eq__(self, value):
+        return lambda row: getattr(row, self.name) == value
+
+    def in_(self, values):
+        values = set(values)
+        return lambda row: getattr(row, self.name) in values
+
+    __hash__ = object.__hash__
+
+
+class GinoExecutor:
+    def __init__(self, query: 'Query') -> None:
+        self.query = query
+
+    async def all(self) -> list:
+        await asyncio.sleep(0)
+        return self.query.execute()
+
+    async def first(self):
+        rows = await self.all()
+        return rows[0] if rows else None
+
+
+class Query:
+    def __init__(self, model, columns: tuple[str, ...] = ()) -> None:
+        self.model = model
+        self.columns = columns
+        self.filters = []
+
+    def where(self, predicate) -> 'Query':
+        self.filters.append(predicate)
+        return self
+
+    @property
+    def gino(self) -> GinoExecutor:
+        return GinoExecutor(self)
+
+    def execute(self) -> list:
+        rows = [x for x in self.model.db.rows(self.model) if all(f(x) for f in self.filters)]
+        if self.columns:
+            return [tuple(getattr(x, c) for c in self.columns) for x in rows]
+        return rows
+
+
+class _QueryProperty:
+    def __get__(self, instance, owner) -> Query:
+        return Query(owner)
+
+
+class UpdateRequest:
+    def __init__(self, instance) -> None:
+        self.instance = instance
+
+    async def apply(self):
+        await asyncio.sleep(0)
+        self.instance.db.queries += 1
+        return self.instance
+
+
+class Model:
+    db: 'FakeDatabase' = None
+    query = _QueryProperty()
+
+    def __init__(self, **values) -> None:
+        for key, value in values.items():
+            setattr(self, key, value)
+
+    @classmethod
+    def columns(cls) -> list[str]:
+        return [k for klass in reversed(cls.__mro__) for k, v in vars(klass).items() if isinstance(v, Column)]
+
+    @classmethod
+    async def create(cls, **values):
+        await asyncio.sleep(0)
+        return cls.db.insert(cls(**values))
+
+    @classmethod
+    def select(cls, *columns: str) -> Query:
+        return Query(cls, columns)
+
+    def update(self, **values) -> UpdateRequest:
+        for key, value in values.items():
+            setattr(self, key, value)
+        return UpdateRequest(self)
+
+    def to_dict(self) -> dict:
+        return {x: getattr(self, x) for x in self.columns()}
+
+
+class FakeDatabase:
+    def __init__(self) -> None:
+        self.tables: dict[type, list] = {}
+        self.ids = itertools.count(1)
+        self.queries = 0
+        self.transactions = 0
+
+    def rows(self, model) -> list:
+        self.queries += 1
+        return [x for table, rows in self.tables.items() if issubclass(table, model) for x in rows]
+
+    def insert(self, row):
+        model = type(row)
+        table = self.tables.setdefault(model, [])
+        for column in model.columns():
+            descriptor = getattr(model, column)
+            if descriptor.unique and any(getattr(x, column) == getattr(row, column) for x in table):
+                raise ValueError(f'duplicate value for {model.__name__}.{column}')
+        if 'id' in model.columns() and row.id is None:
+            row.id = next(self.ids)
+        self.queries += 1
+        table.append(row)
+        return row
+
+    @asynccontextmanager
+    async def transaction(self):
+        self.transactions += 1
+        await asyncio.sleep(0)
+        yield
+
+
+class PenguinData(Model):
+    id = Column()
+    username = Column(unique=True)
+    nickname = Column()
+    password = Column()
+    email = Column()
+    color = Column(1)
+    head = Column(0)
+    face = Column(0)
+    neck = Column(0)
+    body = Column(0)
+    hand = Column(0)
+    feet = Column(0)
+    flag = Column(0)
+    photo = Column(0)
+    coins = Column(500)
+    igloo = Column()
+    moderator = Column(False)
+    character = Column()
+    active = Column(True)
+    approval_en = Column(False)
+    approval_pt = Column(False)
+    approval_fr = Column(False)
+    approval_es = Column(False)
+    approval_de = Column(False)
+    approval_ru = Column(False)
+
+
+class PenguinItem(Model):
+    penguin_id = Column()
+    item_id = Column()
+
+
+class PenguinAttribute(Model):
+    penguin_id = Column()
+    name = Column()
+    value = Column()
+
+
+class PenguinAttributeCollection(dict):
+    @classmethod
+    async def get_collection(cls, penguin_id: int) -> 'PenguinAttributeCollection':
+        rows = await PenguinAttribute.query.where(PenguinAttribute.penguin_id == penguin_id).gino.all()
+        return cls({x.name: x.value for x in rows})
+
+
+class RoomMixin:
+    listeners = []
+
+    def _init_room(self):
+        self.penguins_by_id = {}
+        self.waddles = {}
+
+    async def add_penguin(self, p):
+        if p.room is not None:
+            await p.room.remove_penguin(p)
+        self.penguins_by_id[p.id] = p
+        p.room = self
+        await p.send_xt('jr', self.id, *(x.string for x in self.penguins_by_id.values()))
+        await self.send_xt('ap', p.string, f=lambda x: x is not p)
+
+    async def remove_penguin(self, p):
+        if self.penguins_by_id.pop(p.id, None) is not None:
+            await self.send_xt('rp', p.id)
+        p.room = None
+
+    async def send_xt(self, *data, f=None):
+        for listener in RoomMixin.listeners:
+            listener(self, data)
+        for penguin in filter(f, list(self.penguins_by_id.values())):
+            await penguin.send_xt(*data)
+
+
+class Room(RoomMixin):
+    def __init__(self, room_id: int, name: str = '', game: bool = False) -> None:
+        self.id = room_id
+        self.name = name
+        self.game = game
+        self._init_room()
+
+
+class PenguinIglooRoom(Model, RoomMixin):
+    id = Column()
+    penguin_id = Column()
+    type = Column(1)
+    flooring = Column(0)
+    location = Column(1)
+
+    def __init__(self, **values) -> None:
+        super().__init__(**values)
+        self._init_room()
+
+
+class PenguinIglooRoomCollection(dict):
+    @classmethod
+    async def get_collection(cls, penguin_id: int) -> 'PenguinIglooRoomCollection':
+        rows = await PenguinIglooRoom.query.where(PenguinIglooRoom.penguin_id == penguin_id).gino.all()
+        return cls({x.id: x for x in rows})
+
+
+class IWaddle:
+    room_id = None
+
+    def __init__(self, waddle: 'RoomWaddle') -> None:
+        self.waddle = waddle
+        self.penguins = list(waddle.penguins)
+        self.seats = waddle.seats
+        self.finished = 0
+
+    async def send_xt(self, *data, f=None):
+        for penguin in filter(f, [x for x in self.penguins if x is not None]):
+            await penguin.send_xt(*data)
+
+    async def remove_penguin(self, p):
+        if p in self.penguins:
+            self.penguins[self.penguins.index(p)] = None
+        p.waddle = None
+
+    def get_payout(self) -> int:
+        self.finished += 1
+        return max(20 - 5 * (self.finished - 1), 5)
+
+
+class RoomWaddle:
+    def __init__(self, waddle_id: int, room: Room, seats: int, game: str, game_room: Room) -> None:
+        self.id = waddle_id
+        self.room = room
+        self.seats = seats
+        self.game = game
+        self.game_room = game_room
+        self.penguins = [None] * seats
+        self.games_started = 0
+
+    async def add_penguin(self, p):
+        seat_id = self.penguins.index(None)
+        self.penguins[seat_id] = p
+        p.waddle = self
+        await self.room.send_xt('uw', self.id, seat_id, p.safe_name)
+        if None not in self.penguins:
+            await self.start_game()
+
+    async def remove_penguin(self, p):
+        if p in self.penguins:
+            seat_id = self.penguins.index(p)
+            self.penguins[seat_id] = None
+            await self.room.send_xt('uw', self.id, seat_id)
+        p.waddle = None
+
+    async def start_game(self):
+        game = IWaddle(self)
+        self.games_started += 1
+        for penguin in game.penguins:
+            penguin.waddle = game
+            await penguin.send_xt('sw', self.game_room.id, self.game_room.id, self.seats)
+            await penguin.join_room(self.game_room)
+        self.penguins = [None] * self.seats
+
+    async def send_xt(self, *data):
+        for penguin in [x for x in self.penguins if x is not None]:
+            await penguin.send_xt(*data)
+
+
+class Penguin(PenguinData):
+    def __init__(self, server, reader, writer) -> None:
+        self.server = server
+        self.reader = reader
+        self.writer = writer
+        self.peer_name = writer.get_extra_info('peername')
+        self.server.peers_by_ip[self.peer_name] = self
+        self.room = None
+        self.waddle = None
+        self.x, self.y = 0, 0
+        self.frame = 1
+        self.igloo_rooms = None
+        self.attributes = None
+
+    @property
+    def safe_name(self) -> str:
+        return self.nickname or self.username
+
+    @property
+    def string(self) -> str:
+        return '|'.join(str(x) for x in (
+            self.id, self.safe_name, 1, self.color, self.head, self.face, self.neck, self.body, self.hand,
+            self.feet, self.flag, self.photo, self.x, self.y, self.frame, 1, 146))
+
+    async def send_xt(self, handler_id, *data):
+        await self.send_line(f'%xt%{handler_id}%-1%' + '%'.join(str(x) for x in data) + '%')
+
+    async def send_line(self, data: str):
+        if not self.writer.is_closing():
+            self.writer.write(data.encode('utf-8') + b'\x00')
+
+    async def join_room(self, room):
+        await room.add_penguin(self)
+
+    async def add_coins(self, coins: int):
+        await self.update(coins=self.coins + coins).apply()
+        await self.send_xt('zo', self.coins, '', 0, 0, 0)
+
+
+class Crypto:
+    @staticmethod
+    def hash(string) -> str:
+        return hashlib.md5(str(string).encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def get_login_hash(password: str, rndk: str) -> str:
+        key = Crypto.hash(password.upper() + rndk + 'a1ebe00441f5aecb185d0ec178ca2305Y(02.>\'H}t":E1_root')
+        return Crypto.hash(key[16:32] + key[0:16])
+
+
+class XTPacket:
+    def __init__(self, *packet_id, ext: str = 's') -> None:
+        self.extension = ext
+        self.packet_id = '#'.join(packet_id)
+
+
+def handler(packet, **_):
+    def decorator(function):
+        function.__packet__ = packet
+        return function
+    return decorator
+
+
+def command(name=None, **_):
+    def decorator(function):
+        function.__command__ = name or function.__name__
+        return function
+    return decorator
+
+
+class IPlugin:
+    author = None
+    description = None
+    version = None
+
+    def __init__(self, server) -> None:
+        self.server = server
+
+    async def ready(self):
+        pass
+
+
+class Houdini:
+    pass
+
+
+def install() -> dict[str, types.ModuleType]:
+    modules = {
+        'houdini': {'IWaddle': IWaddle},
+        'houdini.handlers': {'handler': handler, 'XTPacket': XTPacket},
+        'houdini.commands': {'command': command},
+        'houdini.crypto': {'Crypto': Crypto},
+        'houdini.houdini': {'Houdini': Houdini},
+        'houdini.penguin': {'Penguin': Penguin},
+        'houdini.plugins': {'IPlugin': IPlugin},
+        'houdini.data': {},
+        'houdini.data.item': {'PenguinItem': PenguinItem},
+        'houdini.data.penguin': {'Penguin': PenguinData},
+        'houdini.data.plugin': {'PenguinAttribute': PenguinAttribute,
+                                'PenguinAttributeCollection': PenguinAttributeCollection},
+        'houdini.data.room': {'PenguinIglooRoom': PenguinIglooRoom,
+                              'PenguinIglooRoomCollection': PenguinIglooRoomCollection,
+                              'Room': Room, 'RoomWaddle': RoomWaddle},
+    }
+    installed = {}
+    for name, attributes in modules.items():
+        module = sys.modules.get(name)
+        if getattr(module, '__simulated__', False):
+            installed[name] = module
+            continue
+        module = types.ModuleType(name)
+        module.__simulated__ = True
+        module.__path__ = []
+        module.__dict__.update(attributes)
+        sys.modules[name] = installed[name] = module
+    installed['houdini'].handlers = installed['houdini.handlers']
+    installed['houdini'].commands = installed['houdini.commands']
+    installed['houdini'].data = installed['houdini.data']
+    installed['houdini.data'].penguin = installed['houdini.data.penguin']
+    if 'houdini.plugins.bot' not in sys.modules:
+        bot_package = types.ModuleType('houdini.plugins.bot')
+        bot_package.__path__ = [BOT_PACKAGE_PATH]
+        sys.modules['houdini.plugins.bot'] = bot_package
+    return installed
+
+
+def get_logger() -> logging.Logger:
+    logger = logging.getLogger('houdini.sim')
+    if not logger.handlers:
+        logger.addHandler(logging.NullHandler())
+        logger.propagate = False
+    return logger
@@ -0,0 +1,155 @@
+import asyncio
+import time
+
+from houdini.plugins.bot.leases import RELEASE_SCRIPT, RENEW_SCRIPT
+
+
+class FakeRedis:
+    def __init__(self, clock=time.monotonic) -> None:
+        self.clock = clock
+        self.values: dict[str, object] = {}
+        self.expiry: dict[str, float] = {}
+        self.commands = 0
+        self.subscribers: dict[str, list['FakePubSub']] = {}
+
+    def _expire_key(self, key: str):
+        if key in self.expiry and self.expiry[key] <= self.clock():
+            del self.expiry[key]
+            self.values.pop(key, None)
+
+    def _get(self, key: str):
+        self._expire_key(key)
+        return self.values.get(key)
+
+    async def _command(self):
+        self.commands += 1
+        await asyncio.sleep(0)
+
+    async def get(self, key: str):
+        await self._command()
+        value = self._get(key)
+        return value if value is None else str(value).encode()
+
+    async def set(self, key: str, value, ex: int | None = None, nx: bool = False):
+        await self._command()
+        return self._set(key, value, ex, nx)
+
+    def _set(self, key: str, value, ex: int | None = None, nx: bool = False):
+        if nx and self._get(key) is not None:
+            return None
+        self.values[key] = str(value)
+        self.expiry.pop(key, None)
+        if ex is not None:
+            self.expiry[key] = self.clock() + ex
+        return True
+
+    async def delete(self, *keys: str) -> int:
+        await self._command()
+        return sum(self.values.pop(x, None) is not None for x in keys)
+
+    async def exists(self, *keys: str) -> int:
+        await self._command()
+        return sum(self._get(x) is not None for x in keys)
+
+    async def expire(self, key: str, seconds: int) -> bool:
+        await self._command()
+        if self._get(key) is None:
+            return False
+        self.expiry[key] = self.clock() + seconds
+        return True
+
+    async def hset(self, name: str, key, value) -> int:
+        await self._command()
+        table = self.values.setdefault(name, {})
+        new = str(key) not in table
+        table[str(key)] = str(value)
+        return int(new)
+
+    async def hget(self, name: str, key):
+        await self._command()
+        value = (self._get(name) or {}).get(str(key))
+        return value if value is None else value.encode()
+
+    async def hgetall(self, name: str) -> dict[bytes, bytes]:
+        await self._command()
+        return {k.encode(): v.encode() for k, v in (self._get(name) or {}).items()}
+
+    def pipeline(self, transaction: bool = True) -> 'FakePipeline':
+        return FakePipeline(self)
+
+    def pubsub(self) -> 'FakePubSub':
+        return FakePubSub(self)
+
+    async def publish(self, channel: str, message) -> int:
+        await self._command()
+        subscribers = self.subscribers.get(channel, [])
+        for pubsub in subscribers:
+            pubsub.queue.put_nowait({'type': 'message', 'pattern': None, 'channel': channel.encode(),
+                                     'data': str(message).encode() if not isinstance(message, bytes) else message})
+        return len(subscribers)
+
+    async def eval(self, script: str, numkeys: int, *keys_and_args):
+        await self._command()
+        keys, args = keys_and_args[:numkeys], [str(x) for x in keys_and_args[numkeys:]]
+        if script == RELEASE_SCRIPT:
+            if self._get(keys[0]) == args[0]:
+                self.values.pop(keys[0], None)
+                return 1
+            return 0
+        if script == RENEW_SCRIPT:
+            renewed = []
+            for key in keys:
+                if self._get(key) == args[0]:
+                    self.expiry[key] = self.clock() + int(args[1])
+                    renewed.append(1)
+                else:
+                    renewed.append(0)
+            return renewed
+        raise NotImplementedError('FakeRedis only evaluates the bot plugin scripts')
+
+
+class FakePipeline:
+    def __init__(self, redis: FakeRedis) -> None:
+        self.redis = redis
+        self.queued = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.queued = []
+
+    def set(self, *args, **kwargs) -> 'FakePipeline':
+        self.queued.append((self.redis._set, args, kwargs))
+        return self
+
+    async def execute(self) -> list:
+        # One round trip for the whole batch
+        await self.redis._command()
+        self.redis.commands += len(self.queued) - 1
+        results = [command(*args, **kwargs) for command, args, kwargs in self.queued]
+        self.queued = []
+        return results
+
+
+class FakePubSub:
+    def __init__(self, redis: FakeRedis) -> None:
+        self.redis = redis
+        self.channels: list[str] = []
+        self.queue: asyncio.Queue = asyncio.Queue()
+
+    async def subscribe(self, *channels: str):
+        for channel in channels:
+            self.redis.subscribers.setdefault(channel, []).append(self)
+            self.channels.append(channel)
+            self.queue.put_nowait({'type': 'subscribe', 'pattern': None, 'channel': channel.encode(),
+                                   'data': len(self.channels)})
+
+    async def listen(self):
+        while self.channels:
+            yield await self.queue.get()
+
+    async def reset(self):
+        for channel in self.channels:
+            self.redis.subscribers[channel].remove(self)
+        self.channels = []
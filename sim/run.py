@@ -0,0 +1,56 @@
+import asyncio
+import hashlib
+import json
+import random
+import time
+from argparse import ArgumentParser
+
+from sim.clock import run_virtual
+from sim.world import DEFAULT_ROOM_IDS, SimulatedWorld
+from houdini.plugins.bot.bot_plugin import BotPlugin
+
+
+async def simulate(seed: int, bots: int, humans: int, seconds: float, config: dict) -> SimulatedWorld:
+    BotPlugin.max_bot_population = max(BotPlugin.max_bot_population, bots)
+    world = SimulatedWorld({'bot_population': bots, **config}, bot_accounts=int(bots * 1.2) + 10,
+                           seed=seed, record_trace=True)
+    await world.start()
+    rooms = random.Random(f'{seed}:humans')
+    for _ in range(humans):
+        await world.add_human(rooms.choice(DEFAULT_ROOM_IDS))
+    await asyncio.sleep(seconds)
+    await world.stop()
+    return world
+
+
+def main():
+    parser = ArgumentParser(description='Run a seeded simulation and write its packet trace')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--bots', type=int, default=50)
+    parser.add_argument('--humans', type=int, default=0)
+    parser.add_argument('--hours', type=float, default=1, help='Simulated hours')
+    parser.add_argument('--real-time', action='store_true', help='Run on the wall clock instead of virtual time')
+    parser.add_argument('--config', help='JSON file with plugin config overrides')
+    parser.add_argument('--output', help='Write the packet trace to this file')
+    args = parser.parse_args()
+
+    config = {}
+    if args.config:
+        with open(args.config) as f:
+            config = json.load(f)
+
+    started = time.perf_counter()
+    simulation = simulate(args.seed, args.bots, args.humans, args.hours * 3600, config)
+    world = asyncio.run(simulation) if args.real_time else run_virtual(simulation)
+    elapsed = time.perf_counter() - started
+
+    trace = '\n'.join(world.trace).encode()
+    print(f'{len(world.trace)} packets over {args.hours:g} simulated hours in {elapsed:.1f}s, '
+          f'sha256 {hashlib.sha256(trace).hexdigest()}')
+    if args.output:
+        with open(args.output, 'wb') as f:
+            f.write(trace)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,223 @@
+import asyncio
+import itertools
+import json
+import os
+import tempfile
+from collections import Counter, defaultdict
+from types import SimpleNamespace
+
+from sim import fake_houdini
+
+fake_houdini.install()
+
+from houdini.plugins.bot.bot_plugin import BotPlugin  # noqa: E402
+from houdini.plugins.bot.constants import ITEM_TYPE  # noqa: E402
+from sim.fake_redis import FakeRedis  # noqa: E402
+
+DEFAULT_ROOM_IDS = [
+    100, 110, 111, 120, 121, 130, 300, 310, 320, 330, 340, 200, 220,
+    230, 801, 802, 800, 400, 410, 411, 809, 805, 810, 806, 808, 807
+]
+SLED_WADDLES = {100: 4, 101: 3, 102: 2, 103: 2}
+SLED_ROOM_ID = 230
+SLED_GAME_ROOM_ID = 999
+ITEMS_PER_TYPE = 25
+
+DEFAULT_PLUGIN_CONFIG = {
+    'bot_population': 50,
+    'bot_leases': True,
+    'random_clothing_on_startup': True,
+    'lag_monitor': None,
+    'metrics_port': None,
+}
+
+
+class TrafficStats:
+    def __init__(self) -> None:
+        self.bytes = 0
+        self.packets = 0
+        self.commands = Counter()
+
+
+class RecordingWriter:
+    peer_ids = itertools.count(1)
+
+    def __init__(self, traffic: TrafficStats, log: list | None = None) -> None:
+        self.traffic = traffic
+        self.log = log
+        self.peer_name = ('127.0.0.1', next(self.peer_ids))
+        self.closing = False
+        self.listeners = []
+        self.buffer_size = 0
+
+    def get_extra_info(self, _):
+        return self.peer_name
+
+    def is_closing(self):
+        return self.closing
+
+    def write(self, data: bytes):
+        self.traffic.bytes += len(data)
+        self.traffic.packets += 1
+        self.traffic.commands[data.split(b'%', 3)[2].decode()] += 1
+        if self.log is not None:
+            self.log.append(data)
+        for listener in self.listeners:
+            listener(data)
+
+    def get_write_buffer_size(self) -> int:
+        return self.buffer_size
+
+    @property
+    def transport(self):
+        return self
+
+
+class SimulatedServer(fake_houdini.Houdini):
+    def __init__(self, world_id: int = 1, redis: FakeRedis | None = None, room_ids=DEFAULT_ROOM_IDS) -> None:
+        self.config = SimpleNamespace(type='world', id=world_id)
+        self.logger = fake_houdini.get_logger()
+        self.redis = redis or FakeRedis()
+        self.db = fake_houdini.FakeDatabase()
+        fake_houdini.Model.db = self.db
+
+        self.penguins_by_id = {}
+        self.penguins_by_username = {}
+        self.penguins_by_character_id = {}
+        self.peers_by_ip = {}
+        self.igloos_by_penguin_id = {}
+        self.open_igloos_by_penguin_id = {}
+
+        self.rooms = {x: fake_houdini.Room(x) for x in room_ids}
+        game_room = self.rooms.setdefault(SLED_GAME_ROOM_ID, fake_houdini.Room(SLED_GAME_ROOM_ID, game=True))
+        sled_room = self.rooms.setdefault(SLED_ROOM_ID, fake_houdini.Room(SLED_ROOM_ID))
+        sled_room.waddles = {
+            waddle_id: fake_houdini.RoomWaddle(waddle_id, sled_room, seats, 'sled', game_room)
+            for waddle_id, seats in SLED_WADDLES.items()
+        }
+
+        self.items = {}
+        for name, item_type in vars(type(ITEM_TYPE)).items():
+            if name.startswith('_'):
+                continue
+            for i in range(ITEMS_PER_TYPE):
+                item_id = item_type * 1000 + i + 1
+                self.items[item_id] = SimpleNamespace(id=item_id, type=item_type)
+        self.igloos = {x: SimpleNamespace(id=x) for x in range(1, 30)}
+        self.locations = {x: SimpleNamespace(id=x) for x in range(1, 10)}
+
+
+class SimulatedWorld:
+    def __init__(self, plugin_config: dict | None = None, bot_accounts: int = 200, world_id: int = 1,
+                 redis: FakeRedis | None = None, record_packets: bool = False, seed: int | None = None,
+                 record_trace: bool = False) -> None:
+        self.server = SimulatedServer(world_id, redis or FakeRedis(clock=self.time))
+        self.plugin_config = {**DEFAULT_PLUGIN_CONFIG, **(plugin_config or {})}
+        if seed is not None:
+            self.plugin_config['random_seed'] = seed
+        self.bot_accounts = bot_accounts
+        self.traffic: dict[int, TrafficStats] = defaultdict(TrafficStats)
+        self.packet_log = [] if record_packets else None
+        self.trace = [] if record_trace else None
+        self.humans = []
+        self.plugin = None
+        self.config_file = None
+
+    @staticmethod
+    def time() -> float:
+        return asyncio.get_running_loop().time()
+
+    def record_room_packet(self, room, data: tuple):
+        self.trace.append(f'{self.time():.3f} {room.id} %xt%{data[0]}%-1%' + '%'.join(str(x) for x in data[1:]) + '%')
+
+    async def seed_bot_accounts(self, count: int):
+        items_by_type = defaultdict(list)
+        for item in self.server.items.values():
+            items_by_type[item.type].append(item.id)
+        for i in range(count):
+            penguin = await fake_houdini.PenguinData.create(
+                username=f'bot{i}', nickname=f'Bot{i}', color=items_by_type[ITEM_TYPE.COLOR][i % ITEMS_PER_TYPE])
+            await fake_houdini.PenguinAttribute.create(penguin_id=penguin.id, name='bot', value='true')
+            igloo = await fake_houdini.PenguinIglooRoom.create(penguin_id=penguin.id, type=1, flooring=0, location=1)
+            await penguin.update(igloo=igloo.id).apply()
+
+    def write_plugin_config(self) -> str:
+        fd, filename = tempfile.mkstemp(prefix='bot_config_', suffix='.json')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(self.plugin_config, f)
+        return filename
+
+    async def start(self) -> BotPlugin:
+        if self.trace is not None:
+            fake_houdini.RoomMixin.listeners.append(self.record_room_packet)
+        await self.seed_bot_accounts(self.bot_accounts)
+        self.config_file = self.write_plugin_config()
+        plugin_class = type('SimulatedBotPlugin', (BotPlugin,), {'config_file': self.config_file})
+        self.plugin = plugin_class(self.server)
+        await self.plugin.ready()
+        return self.plugin
+
+    async def stop(self):
+        if self.plugin is not None:
+            self.plugin.tasks.cancel_all()
+        if self.config_file is not None:
+            os.unlink(self.config_file)
+            self.config_file = None
+        if self.record_room_packet in fake_houdini.RoomMixin.listeners:
+            fake_houdini.RoomMixin.listeners.remove(self.record_room_packet)
+
+    async def add_human(self, room_id: int = 100, x: int = 380, y: int = 300) -> fake_houdini.Penguin:
+        data = await fake_houdini.PenguinData.create(username=f'human{len(self.humans)}',
+                                                     nickname=f'Human{len(self.humans)}')
+        human = fake_houdini.Penguin(self.server, None, RecordingWriter(self.traffic[data.id], self.packet_log))
+        human.update(**data.to_dict())
+        human.x, human.y = x, y
+        self.server.penguins_by_id[human.id] = human
+        self.server.penguins_by_username[human.username] = human
+        self.humans.append(human)
+        await self.human_join_room(human, room_id)
+        return human
+
+    async def remove_human(self, human: fake_houdini.Penguin):
+        if human.waddle is not None:
+            await human.waddle.remove_penguin(human)
+        if human.room is not None:
+            await human.room.remove_penguin(human)
+        del self.server.penguins_by_id[human.id]
+        del self.server.penguins_by_username[human.username]
+        del self.server.peers_by_ip[human.peer_name]
+        self.humans.remove(human)
+
+    async def human_join_room(self, human, room_id: int):
+        room = self.server.rooms[room_id]
+        await human.join_room(room)
+        await self.plugin.handle_join_room(human, room)
+
+    async def human_move(self, human, x: int, y: int):
+        human.x, human.y = x, y
+        await human.room.send_xt('sp', human.id, x, y)
+
+    async def human_snowball(self, human, x: int, y: int):
+        await human.room.send_xt('sb', human.id, x, y)
+        await self.plugin.handle_snowball(human, x, y)
+
+    async def human_safe_message(self, human, message_id: int):
+        await human.room.send_xt('ss', human.id, message_id)
+        await self.plugin.handle_safe_message(human, message_id)
+
+    async def human_join_waddle(self, human, waddle_id: int):
+        if human.room.id != SLED_ROOM_ID:
+            await self.human_join_room(human, SLED_ROOM_ID)
+        waddle = human.room.waddles[waddle_id]
+        if None in waddle.penguins:
+            await waddle.add_penguin(human)
+        await self.plugin.handle_join_waddle(human, waddle_id)
+
+    def human_traffic(self) -> TrafficStats:
+        total = TrafficStats()
+        for human in self.humans:
+            stats = self.traffic[human.id]
+            total.bytes += stats.bytes
+            total.packets += stats.packets
+            total.commands.update(stats.commands)
+        return total
@@ -0,0 +1,3 @@
+from sim import fake_houdini
+
+fake_houdini.install()
@@ -0,0 +1,78 @@
+import asyncio
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from houdini.plugins.bot import accounting as accounting_module
+from houdini.plugins.bot.accounting import BehaviorAccounting
+
+
+class ScriptedRandom:
+    def __init__(self, *values: float) -> None:
+        self.values = list(values)
+
+    def random(self) -> float:
+        return self.values.pop(0)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = SimpleNamespace(now=0.0)
+    monkeypatch.setattr(accounting_module, 'time', SimpleNamespace(
+        perf_counter=lambda: clock.now, thread_time=lambda: clock.now, time=lambda: 0.0))
+    return clock
+
+
+def run_nested(accounting: BehaviorAccounting, clock):
+    async def inner():
+        clock.now += 2
+        await asyncio.sleep(0)
+        clock.now += 1
+
+    async def outer():
+        clock.now += 1
+        await accounting.measure('inner', None, inner())
+        clock.now += 0.5
+
+    asyncio.run(accounting.measure('outer', None, outer()))
+    return accounting.totals()
+
+
+def test_nested_time_is_charged_to_the_inner_behavior(clock):
+    totals = run_nested(BehaviorAccounting(), clock)
+    assert totals['outer'][2:] == [1.5, 1.5]
+    assert totals['inner'][2:] == [3, 3]
+
+
+def test_unsampled_nested_time_is_left_out_of_the_outer_behavior(clock):
+    totals = run_nested(BehaviorAccounting(0.5, ScriptedRandom(0.1, 0.9)), clock)
+    assert totals['outer'][2:] == [1.5, 1.5]
+    assert totals['inner'][:2] == [1, 0]
+    assert totals['inner'][2:] == [0, 0]
+
+
+def test_totals_are_extrapolated_from_samples(clock):
+    accounting = BehaviorAccounting(0.5, ScriptedRandom(0.1, 0.9))
+
+    async def behavior():
+        clock.now += 1
+
+    for _ in range(2):
+        asyncio.run(accounting.measure('move', 100, behavior()))
+    assert accounting.totals()['move'] == [2, 1, 2.0, 2.0]
+
+
+def test_seeded_sampling_is_reproducible():
+    def sampled(seed: int) -> int:
+        accounting = BehaviorAccounting(0.3, random.Random(seed))
+
+        async def main():
+            for _ in range(200):
+                await accounting.measure('move', None, asyncio.sleep(0))
+
+        asyncio.run(main())
+        return accounting.stats[('move', None)][1]
+
+    assert sampled(7) == sampled(7)
+    assert sampled(7) != sampled(8)
@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+
+from houdini.plugins.bot.config import BotConfig, ConfigError
+from sim.clock import run_virtual
+from sim.world import SimulatedWorld
+
+
+def adaptive_world(**adaptive) -> SimulatedWorld:
+    return SimulatedWorld({'bot_population': 20, 'bot_rotation': False, 'config_reload_interval': 0,
+                           'adaptive_population': adaptive}, bot_accounts=40, seed=1)
+
+
+@pytest.mark.parametrize('adaptive, humans, target', [
+    ({'mode': 'fill', 'fill_to': 30}, 5, 20),
+    ({'mode': 'fill', 'fill_to': 30}, 15, 15),
+    ({'mode': 'fill', 'fill_to': 30, 'min_bots': 4}, 40, 4),
+    ({'mode': 'ratio', 'bots_per_human': 2}, 3, 14),
+    ({'mode': 'ratio', 'bots_per_human': 2, 'max_bots': 10}, 1, 8),
+    ({'mode': 'ratio', 'bots_per_human': 2}, 50, 0),
+])
+def test_adaptive_target_is_clamped(adaptive, humans, target):
+    async def main():
+        world = adaptive_world(**adaptive)
+        plugin = await world.start()
+        assert plugin.adaptive_target(humans) == target
+        await world.stop()
+
+    run_virtual(main())
+
+
+def test_target_reaches_a_limit_within_hysteresis():
+    async def main():
+        world = adaptive_world(mode='fill', fill_to=22, min_bots=2, hysteresis=5)
+        plugin = await world.start()
+        for _ in range(18):
+            await world.add_human()
+        await asyncio.sleep(plugin.adaptive_population_interval)
+        assert plugin.population_targets['adaptive'] == 4
+        for _ in range(2):
+            await world.add_human()
+        await asyncio.sleep(plugin.adaptive_population_interval)
+        assert plugin.population_targets['adaptive'] == 2
+        await world.stop()
+
+    run_virtual(main())
+
+
+def test_small_changes_wait_for_hysteresis():
+    async def main():
+        world = adaptive_world(mode='fill', fill_to=22, hysteresis=5)
+        plugin = await world.start()
+        for _ in range(5):
+            await world.add_human()
+        await asyncio.sleep(plugin.adaptive_population_interval)
+        assert plugin.population_targets['adaptive'] == 20
+        await world.stop()
+
+    run_virtual(main())
+
+
+@pytest.mark.parametrize('adaptive', [{'mode': 'fil'}, [1]])
+def test_invalid_adaptive_population_is_rejected(adaptive):
+    with pytest.raises(ConfigError):
+        BotConfig.from_dict({'adaptive_population': adaptive})
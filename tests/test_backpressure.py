@@ -0,0 +1,96 @@
+import asyncio
+from types import SimpleNamespace
+
+from houdini.plugins.bot.backpressure import CosmeticBackpressure
+
+
+class Transport:
+    buffered = 0
+
+    def is_closing(self):
+        return False
+
+    def get_write_buffer_size(self):
+        return self.buffered
+
+
+class Recipient:
+    def __init__(self, penguin_id, server, room):
+        self.id = penguin_id
+        self.server = server
+        self.room = room
+        self.writer = SimpleNamespace(transport=Transport())
+        self.sent = []
+        server.penguins_by_id[penguin_id] = self
+        room.penguins.append(self)
+
+    async def send_xt(self, *data):
+        self.sent.append(data)
+
+
+class Room:
+    def __init__(self):
+        self.penguins = []
+
+    async def send_xt(self, *data, f):
+        for p in self.penguins:
+            if f(p):
+                await p.send_xt(*data)
+
+
+def world():
+    server, room = SimpleNamespace(penguins_by_id={}), Room()
+    bot = SimpleNamespace(id=1, room=room, writer=SimpleNamespace())
+    server.penguins_by_id[bot.id] = bot
+    room.penguins.append(bot)
+    return server, room, bot, Recipient(2, server, room)
+
+
+def test_congested_recipient_gets_latest_packet_once_drained():
+    async def main():
+        server, room, bot, human = world()
+        backpressure = CosmeticBackpressure(100)
+        human.writer.transport.buffered = 500
+        await backpressure.send(bot, ('sp', 1, 10, 10))
+        await backpressure.send(bot, ('sp', 1, 20, 20))
+        await backpressure.flush_drained(server)
+        assert not human.sent
+        human.writer.transport.buffered = 0
+        await backpressure.flush_drained(server)
+        assert human.sent == [('sp', 1, 20, 20)]
+        assert backpressure.outcomes == {'deferred': 2, 'flushed': 1}
+        assert not backpressure.pending
+
+    asyncio.run(main())
+
+
+def test_send_to_drained_recipient_flushes_other_held_packets():
+    async def main():
+        server, room, bot, human = world()
+        backpressure = CosmeticBackpressure(100)
+        human.writer.transport.buffered = 500
+        await backpressure.send(bot, ('sf', 1, 26))
+        await backpressure.send(bot, ('sp', 1, 10, 10))
+        human.writer.transport.buffered = 0
+        await backpressure.send(bot, ('sp', 1, 20, 20))
+        # The held move is superseded by the one just sent
+        assert human.sent == [('sp', 1, 20, 20), ('sf', 1, 26)]
+
+    asyncio.run(main())
+
+
+def test_held_packets_go_stale():
+    async def main():
+        server, room, bot, human = world()
+        other = Recipient(3, server, room)
+        backpressure = CosmeticBackpressure(100)
+        human.writer.transport.buffered = other.writer.transport.buffered = 500
+        await backpressure.send(bot, ('sp', 1, 10, 10))
+        bot.room = Room()
+        del server.penguins_by_id[other.id]
+        human.writer.transport.buffered = 0
+        await backpressure.flush_drained(server)
+        assert not human.sent
+        assert backpressure.outcomes == {'deferred': 2, 'stale': 2}
+
+    asyncio.run(main())
@@ -0,0 +1,44 @@
+from collections import Counter
+from types import SimpleNamespace
+
+from houdini.plugins.bot.chat import PRIORITY_HIGH, PRIORITY_LOW, ChatScheduler
+
+
+def chat_scheduler(rate=1.0, burst=3.0, dedupe_seconds=5.0):
+    clock = SimpleNamespace(now=0.0)
+    return ChatScheduler(rate, burst, dedupe_seconds, lambda: clock.now, Counter()), clock
+
+
+def test_chat_bucket_drops_past_burst_and_refills():
+    chat, clock = chat_scheduler()
+    room = SimpleNamespace(id=100)
+    assert [chat.allow(room, 'ss', x, PRIORITY_HIGH) for x in range(4)] == [True, True, True, False]
+    clock.now = 1.0
+    assert chat.allow(room, 'ss', 10, PRIORITY_HIGH)
+    assert chat.dropped == Counter(budget=1)
+
+
+def test_chat_low_priority_leaves_reserve():
+    chat, _ = chat_scheduler()
+    room = SimpleNamespace(id=100)
+    assert [chat.allow(room, 'ss', x, PRIORITY_LOW) for x in range(3)] == [True, True, False]
+    assert chat.allow(room, 'ss', 3, PRIORITY_HIGH)
+
+
+def test_chat_drops_duplicates_within_window():
+    chat, clock = chat_scheduler(rate=10, burst=10)
+    room = SimpleNamespace(id=100)
+    assert chat.allow(room, 'ss', 1)
+    assert not chat.allow(room, 'ss', 1)
+    clock.now = 5.0
+    assert chat.allow(room, 'ss', 1)
+    assert chat.dropped == Counter(duplicate=1)
+
+
+def test_chat_buckets_are_per_room():
+    chat, _ = chat_scheduler(burst=1)
+    assert chat.allow(SimpleNamespace(id=100), 'ss', 1, PRIORITY_HIGH)
+    assert chat.allow(SimpleNamespace(id=110), 'ss', 1, PRIORITY_HIGH)
+    # Igloo ids can match room ids, so igloos get buckets of their own
+    assert chat.allow(SimpleNamespace(id=100, penguin_id=100), 'ss', 1, PRIORITY_HIGH)
+    assert not chat.allow(SimpleNamespace(id=100), 'ss', 2, PRIORITY_HIGH)
@@ -0,0 +1,44 @@
+import asyncio
+import time
+
+from houdini.plugins.bot.cluster import ClusterCoordinator, allocate_bot_budget
+from sim.fake_redis import FakeRedis
+
+
+def test_budget_follows_headroom():
+    assert allocate_bot_budget(90, {'1': 50, '2': 0}, {'1': 100, '2': 100}) == {'1': 30, '2': 60}
+
+
+def test_budget_never_exceeds_headroom():
+    assert allocate_bot_budget(500, {'1': 90, '2': 120}, {'1': 100, '2': 100}) == {'1': 10, '2': 0}
+
+
+def test_budget_is_spent_when_there_is_room():
+    capacities = {'1': 3, '2': 5, '3': 11}
+    allocation = allocate_bot_budget(7, {}, capacities)
+    assert sum(allocation.values()) == 7
+    assert all(allocation[w] <= c for w, c in capacities.items())
+
+
+def test_target_moves_by_at_most_max_step():
+    async def main():
+        coordinator = ClusterCoordinator(FakeRedis(), 1, 100, 100, 10)
+        assert await coordinator.compute_target(0) == 10
+        assert await coordinator.compute_target(10) == 20
+
+    asyncio.run(main())
+
+
+def test_stale_worlds_are_left_out_of_the_budget():
+    async def main():
+        redis = FakeRedis()
+        await redis.hset(ClusterCoordinator.capacity_key, '2', 100)
+        await redis.hset(ClusterCoordinator.heartbeat_key, '2', time.time() - 600)
+        coordinator = ClusterCoordinator(redis, 1, 100, 100, 1000)
+        assert await coordinator.compute_target(0) == 100
+
+        await redis.hset(ClusterCoordinator.heartbeat_key, '2', time.time())
+        coordinator.target = None
+        assert await coordinator.compute_target(0) == 50
+
+    asyncio.run(main())
@@ -0,0 +1,58 @@
+import asyncio
+import json
+
+import pytest
+
+from houdini.plugins.bot.config import DEFAULT_ROOM_IDS, BotConfig, ConfigError
+from sim.clock import run_virtual
+from sim.world import SimulatedWorld
+
+
+@pytest.mark.parametrize('raw', [
+    {'bot_rotation': 1},
+    {'bot_population': -1},
+    {'bot_population': True},
+    {'waddle_join_delay': '10'},
+    {'igloo_room_weight': -0.5},
+    {'bot_rooms': [100, '110']},
+    {'room_weights': [100]},
+    {'room_weights': {'town': 2}},
+    {'room_weights': {'100': 'heavy'}},
+])
+def test_invalid_values_are_rejected(raw):
+    with pytest.raises(ConfigError):
+        BotConfig.from_dict(raw)
+
+
+def test_values_are_coerced():
+    config = BotConfig.from_dict({'bot_population': None, 'bot_rooms': [100, 110], 'bot_waddles': [100],
+                                  'room_weights': {'110': 3}, 'waddle_join_delay': 2})
+    assert config.bot_population is None
+    assert config.bot_rooms == (100, 110)
+    assert config.bot_waddles == frozenset((100,))
+    assert config.room_weights == {110: 3}
+
+
+def test_room_choices_leave_out_the_current_room():
+    config = BotConfig.from_dict({'bot_rooms': [100, 110, 120], 'room_weights': {'120': 4}})
+    assert config.room_choices[None] == ((100, 110, 120), (1, 1, 4))
+    assert config.room_choices[110] == ((100, 120), (1, 4))
+    assert BotConfig().bot_rooms == DEFAULT_ROOM_IDS
+
+
+def test_reload_keeps_startup_keys():
+    async def main():
+        world = SimulatedWorld({'bot_population': 5, 'startup_ramp_seconds': 0, 'config_reload_interval': 0},
+                               bot_accounts=20, seed=1)
+        plugin = await world.start()
+        with open(world.config_file, 'w') as f:
+            json.dump({'bot_population': 8, 'startup_ramp_seconds': 600, 'config_reload_interval': 0,
+                       'bot_rotation': False}, f)
+        plugin.reload_config()
+        assert plugin.plugin_config['startup_ramp_seconds'] == 0
+        assert not plugin.config.bot_rotation
+        assert plugin.population_targets['config'] == 8
+        await asyncio.sleep(1)
+        await world.stop()
+
+    run_virtual(main())
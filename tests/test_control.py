@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+
+from houdini.plugins.bot.control import ControlError, parse_command
+from sim.clock import run_virtual
+from sim.world import SimulatedWorld
+
+BEHAVIORS = frozenset(('enable_random_frame', 'bot_rotation'))
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('scale 40', ('scale', [40])),
+    ('scale reset', ('scale', [None])),
+    ('DRAIN 100', ('drain', [100])),
+    ('pause all', ('pause', [BEHAVIORS])),
+    ('resume bot_rotation', ('resume', [frozenset(('bot_rotation',))])),
+    ('rotate', ('rotate', [1])),
+    ('rotate 3', ('rotate', [3])),
+    ('rotate_igloos', ('rotate_igloos', [])),
+])
+def test_parse_command(text, expected):
+    assert parse_command(text, BEHAVIORS) == expected
+
+
+@pytest.mark.parametrize('text', ['', 'scale', 'scale -1', 'drain lobby', 'pause', 'pause dance', 'rotate 0',
+                                  'rotate_igloos now', 'explode'])
+def test_parse_command_rejects(text):
+    with pytest.raises(ControlError):
+        parse_command(text, BEHAVIORS)
+
+
+def test_drained_room_stays_empty():
+    async def main():
+        world = SimulatedWorld({'bot_population': 30, 'bot_rooms': [100, 110, 120], 'config_reload_interval': 0},
+                               bot_accounts=40, seed=3)
+        plugin = await world.start()
+        await asyncio.sleep(10)
+        await plugin.control_drain(100)
+        for _ in range(60):
+            await asyncio.sleep(10)
+            assert not [x for x in plugin.bots if x.room and x.room.id == 100]
+        await plugin.control_undrain(100)
+        await asyncio.sleep(600)
+        assert [x for x in plugin.bots if x.room and x.room.id == 100]
+        await world.stop()
+
+    run_virtual(main())
+
+
+def test_followers_do_not_enter_drained_room():
+    async def main():
+        world = SimulatedWorld({'bot_population': 5, 'bot_rooms': [100, 110], 'bot_rotation': False,
+                                'enable_random_room_movement': False, 'config_reload_interval': 0},
+                               bot_accounts=5, seed=3)
+        plugin = await world.start()
+        await asyncio.sleep(1)
+        bot = plugin.bots[0]
+        human = await world.add_human(bot.room.id, bot.x, bot.y)
+        await bot.follow_penguin(human)
+        await plugin.control_drain(120)
+        await world.human_join_room(human, 120)
+        assert bot.following_penguin is None
+        assert bot.room.id != 120
+        await world.stop()
+
+    run_virtual(main())
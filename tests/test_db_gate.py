@@ -0,0 +1,43 @@
+import asyncio
+
+from houdini.plugins.bot.db_gate import BotDatabaseGate
+from sim.clock import run_virtual
+
+
+async def peak_concurrency(gate: BotDatabaseGate, operations: int) -> int:
+    peak = 0
+
+    async def operation():
+        nonlocal peak
+        async with gate.acquire():
+            peak = max(peak, gate.in_use)
+            await asyncio.sleep(1)
+
+    await asyncio.gather(*(operation() for _ in range(operations)))
+    return peak
+
+
+def test_gate_is_sized_from_the_pool():
+    assert BotDatabaseGate(20, 0.25).size == 5
+    assert BotDatabaseGate(2, 0.25).size == 1
+
+
+def test_startup_allows_the_whole_share():
+    gate = BotDatabaseGate(20, 0.25)
+    assert run_virtual(peak_concurrency(gate, 12)) == 5
+
+
+def test_steady_state_allows_part_of_the_share():
+    gate = BotDatabaseGate(20, 0.25, steady_fraction=0.5)
+    gate.begin_steady_state()
+    assert run_virtual(peak_concurrency(gate, 12)) == 2
+    assert gate.in_use == 0
+
+
+def test_waits_are_recorded_per_phase():
+    gate = BotDatabaseGate(4, 0.5)
+    run_virtual(peak_concurrency(gate, 3))
+    gate.begin_steady_state()
+    run_virtual(peak_concurrency(gate, 1))
+    assert gate.wait_histogram.values[('startup',)].count == 3
+    assert gate.wait_histogram.values[('steady',)].count == 1
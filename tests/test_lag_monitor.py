@@ -0,0 +1,48 @@
+from houdini.plugins.bot.lag_monitor import LagMonitor
+from sim.clock import run_virtual
+from sim.world import SimulatedWorld
+
+
+def test_levels_rise_with_lag_and_recover_below_the_ratio():
+    changes = []
+    monitor = LagMonitor(100, [50, 100], recovery_ratio=0.5, smoothing=1,
+                         on_change=lambda previous, level, _: changes.append((previous, level)))
+    monitor.sample(120)
+    assert monitor.level == 2
+    monitor.sample(60)
+    assert monitor.level == 2
+    monitor.sample(40)
+    assert monitor.level == 1
+    monitor.sample(10)
+    assert monitor.level == 0
+    assert changes == [(0, 2), (2, 1), (1, 0)]
+
+
+def test_lag_is_smoothed():
+    monitor = LagMonitor(100, [50], smoothing=0.5)
+    monitor.sample(80)
+    assert monitor.lag_ms == 40
+    assert monitor.level == 0
+    monitor.sample(80)
+    assert monitor.level == 1
+    assert monitor.max_lag_ms == 80
+
+
+def test_plugin_disables_behaviors_per_level():
+    async def main():
+        world = SimulatedWorld({'bot_population': 5, 'config_reload_interval': 0,
+                                'lag_monitor': {'thresholds_ms': [50, 100]}}, bot_accounts=10, seed=1)
+        plugin = await world.start()
+        plugin.lag_monitor.smoothing = 1
+        plugin.lag_monitor.sample(70)
+        assert not plugin.is_behavior_enabled('enable_random_frame')
+        assert plugin.is_behavior_enabled('enable_random_movement')
+        plugin.lag_monitor.sample(0)
+        assert plugin.is_behavior_enabled('enable_random_frame')
+        metrics = plugin.metrics.render()
+        assert 'houdini_bot_degradation_level 0' in metrics
+        assert 'houdini_bot_degradation_transitions_total{direction="up"} 1' in metrics
+        assert 'houdini_bot_degradation_transitions_total{direction="down"} 1' in metrics
+        await world.stop()
+
+    run_virtual(main())
@@ -0,0 +1,93 @@
+import asyncio
+
+from houdini.plugins.bot.leases import BotLeaseRegistry
+from sim.clock import run_virtual
+from sim.fake_redis import FakeRedis
+from sim.world import SimulatedWorld
+
+
+def clock() -> float:
+    return asyncio.get_running_loop().time()
+
+
+def test_claim_many_stops_at_the_limit_and_skips_taken_ids():
+    async def main():
+        redis = FakeRedis(clock=clock)
+        other = BotLeaseRegistry(redis, 'world-2')
+        assert await other.claim_many([2, 4], 2) == [2, 4]
+        leases = BotLeaseRegistry(redis, 'world-1')
+        assert await leases.claim_many(range(1, 10), 4) == [1, 3, 5, 6]
+        assert leases.held == {1, 3, 5, 6}
+        assert await redis.get(leases.key(3)) == b'world-1'
+
+    run_virtual(main())
+
+
+def test_claim_many_counts_leases_already_held():
+    async def main():
+        leases = BotLeaseRegistry(FakeRedis(clock=clock), 'world-1')
+        await leases.claim_many([1], 1)
+        assert await leases.claim_many([1, 2, 3], 2) == [1, 2]
+
+    run_virtual(main())
+
+
+def test_renew_reports_lost_leases():
+    async def main():
+        redis = FakeRedis(clock=clock)
+        leases = BotLeaseRegistry(redis, 'world-1', ttl=10)
+        await leases.claim_many([1, 2, 3], 3)
+        await redis.set(leases.key(2), 'world-2')
+        await asyncio.sleep(8)
+        assert await leases.renew() == [2]
+        await asyncio.sleep(8)
+        # Renewed leases outlive their first ttl
+        assert await redis.get(leases.key(1)) == b'world-1'
+        assert leases.held == {1, 3}
+
+    run_virtual(main())
+
+
+def test_release_only_deletes_own_lease():
+    async def main():
+        redis = FakeRedis(clock=clock)
+        leases = BotLeaseRegistry(redis, 'world-1')
+        await leases.claim_many([1], 1)
+        await redis.set(leases.key(1), 'world-2')
+        await leases.release(1)
+        assert await redis.get(leases.key(1)) == b'world-2'
+        assert not leases.held
+
+    run_virtual(main())
+
+
+def test_bot_that_lost_its_lease_goes_offline():
+    async def main():
+        world = SimulatedWorld({'bot_population': 5, 'bot_lease_ttl': 3, 'bot_rotation': False,
+                                'config_reload_interval': 0}, bot_accounts=20, seed=1)
+        plugin = await world.start()
+        bot = plugin.bots[0]
+        await world.server.redis.set(plugin.leases.key(bot.id), 'world-2')
+        await asyncio.sleep(1.5)
+        assert bot not in plugin.bots
+        assert bot.id not in world.server.penguins_by_id
+        await world.stop()
+
+    run_virtual(main())
+
+
+def test_ramp_skips_bots_that_lost_their_lease():
+    async def main():
+        world = SimulatedWorld({'bot_population': 10, 'startup_ramp_seconds': 60, 'bot_lease_ttl': 3,
+                                'config_reload_interval': 0}, bot_accounts=10, seed=1)
+        plugin = await world.start()
+        await asyncio.sleep(10)
+        waiting = [x for x in plugin.leases.held if x not in world.server.penguins_by_id]
+        assert len(waiting) > 2
+        for penguin_id in waiting[:2]:
+            await world.server.redis.set(plugin.leases.key(penguin_id), 'world-2')
+        await asyncio.sleep(60)
+        assert not set(waiting[:2]) & {x.id for x in plugin.bots}
+        await world.stop()
+
+    run_virtual(main())
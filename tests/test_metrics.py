@@ -0,0 +1,41 @@
+import asyncio
+
+from houdini.plugins.bot.metrics import BotMetrics, MetricsRegistry
+
+
+def test_actions_are_counted_per_family():
+    metrics = BotMetrics()
+    for command in ('sp', 'upc', 'uph', 'upp', 'zm', 'xyz'):
+        metrics.count_action(command)
+    assert dict(metrics.actions.values) == {('sp',): 1, ('up',): 3, ('zm',): 1, ('other',): 1}
+
+
+def test_render_prometheus_text():
+    registry = MetricsRegistry()
+    counter = registry.counter('bots_total', 'Bots', ('room',))
+    counter.inc(100)
+    counter.inc(100, amount=2)
+    registry.gauge('idle', 'Idle bots', collect=lambda: {(): 7})
+    histogram = registry.histogram('wait_seconds', 'Wait', buckets=(0.1, 1.0))
+    histogram.observe(0.5)
+    text = registry.render()
+    assert '# TYPE bots_total counter' in text
+    assert 'bots_total{room="100"} 3' in text
+    assert 'idle 7' in text
+    assert 'wait_seconds_bucket{le="0.1"} 0' in text
+    assert 'wait_seconds_bucket{le="1.0"} 1' in text
+    assert 'wait_seconds_count 1' in text
+
+
+def test_db_query_timer_works_with_async_with():
+    metrics = BotMetrics()
+
+    async def main():
+        async with metrics.db_query('init'):
+            await asyncio.sleep(0)
+        with metrics.db_query('init'):
+            pass
+
+    asyncio.run(main())
+    assert metrics.db_queries.values[('init',)] == 2
+    assert metrics.db_latency.values[('init',)].count == 2
@@ -0,0 +1,72 @@
+import asyncio
+import logging
+
+import pytest
+
+from houdini.plugins.bot.games import RaceTicker
+from houdini.plugins.bot.tasks import TaskRegistry
+from sim.clock import run_virtual
+
+
+def moves(*times):
+    return [(float(i), float(i), float(t)) for i, t in enumerate(times)]
+
+
+def recorder(sent, name, delay=0):
+    async def send(x, y, time):
+        sent.append((name, round(asyncio.get_running_loop().time() - started, 3), time))
+        if delay:
+            await asyncio.sleep(delay)
+    started = asyncio.get_running_loop().time()
+    return send
+
+
+def test_moves_go_out_on_their_deadlines():
+    async def main():
+        ticker, sent = RaceTicker(TaskRegistry(logging.getLogger('test'))), []
+        await ticker.play(moves(0, 100, 250, 1000), recorder(sent, 'a'))
+        assert sent == [('a', 0, 0), ('a', 0.1, 100), ('a', 0.25, 250), ('a', 1, 1000)]
+        assert ticker.outcomes == {'sent': 4}
+
+    run_virtual(main())
+
+
+def test_later_race_with_earlier_deadline_wakes_the_ticker():
+    async def main():
+        ticker, sent = RaceTicker(TaskRegistry(logging.getLogger('test'))), []
+        first = asyncio.create_task(ticker.play(moves(0, 1000), recorder(sent, 'a')))
+        await asyncio.sleep(0.2)
+        await ticker.play(moves(0, 100), recorder(sent, 'b'))
+        await first
+        assert [(name, time) for name, _, time in sent] == [('a', 0), ('b', 0), ('b', 100), ('a', 1000)]
+        assert sent[2][1] == 0.1 and sent[3][1] == 1
+
+    run_virtual(main())
+
+
+def test_late_moves_are_merged():
+    async def main():
+        ticker, sent = RaceTicker(TaskRegistry(logging.getLogger('test'))), []
+        # The first send stalls past the next three deadlines
+        slow = recorder(sent, 'a', delay=0.5)
+        await ticker.play(moves(0, 100, 200, 300, 1000), slow)
+        assert [time for _, _, time in sent] == [0, 300, 1000]
+        assert ticker.outcomes == {'sent': 3, 'merged': 2}
+
+    run_virtual(main())
+
+
+def test_send_errors_end_the_race():
+    async def main():
+        ticker = RaceTicker(TaskRegistry(logging.getLogger('test')))
+
+        async def send(*_):
+            raise ConnectionResetError
+
+        with pytest.raises(ConnectionResetError):
+            await ticker.play(moves(0, 100), send)
+        sent = []
+        await ticker.play(moves(0), recorder(sent, 'b'))
+        assert len(sent) == 1
+
+    run_virtual(main())
@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+
+from houdini.plugins.bot.config import BotConfig, ConfigError
+from houdini.plugins.bot.constants import SAFE_MESSAGES
+from houdini.plugins.bot.reactions import Reaction, compile_reactions, validate_reaction
+from sim.clock import run_virtual
+from sim.world import SimulatedWorld
+
+
+def test_builtin_reactions_follow_their_flags():
+    table = compile_reactions(frozenset({'enable_follow_mode'}), [])
+    assert table == {SAFE_MESSAGES.FOLLOW_ME: (Reaction('follow'),), SAFE_MESSAGES.GO_AWAY: (Reaction('unfollow'),)}
+
+
+def test_custom_reactions_extend_builtin_ones():
+    custom = [{'message': SAFE_MESSAGES.FOLLOW_ME, 'action': 'say', 'value': 5, 'chance': 0.5},
+              {'message': 999, 'action': 'frame', 'value': 26, 'delay': 2}]
+    table = compile_reactions(frozenset({'enable_follow_mode'}), custom)
+    assert table[SAFE_MESSAGES.FOLLOW_ME] == (Reaction('follow'), Reaction('say', 5, 0.5))
+    assert table[999] == (Reaction('frame', 26, 1.0, 2),)
+
+
+@pytest.mark.parametrize('entry', [
+    [],
+    {'action': 'say', 'value': 1},
+    {'message': True, 'action': 'follow'},
+    {'message': 1, 'action': 'dance'},
+    {'message': 1, 'action': 'say'},
+    {'message': 1, 'action': 'emote', 'value': '1'},
+    {'message': 1, 'action': 'follow', 'chance': 1.5},
+    {'message': 1, 'action': 'follow', 'delay': -1},
+])
+def test_invalid_reactions_are_rejected(entry):
+    assert validate_reaction(0, entry) is not None
+    with pytest.raises(ConfigError):
+        BotConfig.from_dict({'safe_message_reactions': [entry]})
+
+
+def test_nearby_bots_react_to_custom_message():
+    async def main():
+        world = SimulatedWorld({'bot_population': 5, 'bot_rotation': False, 'enable_random_frame': False,
+                                'config_reload_interval': 0,
+                                'safe_message_reactions': [{'message': 999, 'action': 'frame', 'value': 26}]},
+                               bot_accounts=5, seed=1)
+        plugin = await world.start()
+        await asyncio.sleep(1)
+        bot = plugin.bots[0]
+        human = await world.add_human(bot.room.id, bot.x, bot.y)
+        await world.human_safe_message(human, 999)
+        await asyncio.sleep(1)
+        assert bot.frame == 26
+        await world.stop()
+
+    run_virtual(main())
@@ -0,0 +1,44 @@
+import os
+import time
+from types import SimpleNamespace
+
+from houdini.plugins.bot.sampler import PLUGIN_DIRECTORY, SamplingProfiler
+
+
+def frame(*calls):
+    # calls run outermost first, like a stack read from the bottom
+    current = None
+    for filename, name in calls:
+        code = SimpleNamespace(co_filename=filename, co_name=name, co_qualname=name)
+        current = SimpleNamespace(f_code=code, f_back=current)
+    return current
+
+
+def test_samples_are_tagged_by_innermost_bot_code():
+    profiler = SamplingProfiler()
+    plugin_file = os.path.join(PLUGIN_DIRECTORY, 'bot_plugin.py')
+    bot_file = os.path.join(PLUGIN_DIRECTORY, 'penguin_bot.py')
+    profiler.sample(frame(('/srv/houdini/bootstrap.py', 'main'), (plugin_file, 'BotPlugin.fan_out'),
+                          (bot_file, 'PenguinBot.greet'), ('/usr/lib/python3/json/encoder.py', 'encode')))
+    profiler.sample(frame(('/srv/houdini/bootstrap.py', 'main'), ('/usr/lib/python3/selectors.py', 'select')))
+    profiler.sample(frame(('/srv/houdini/bootstrap.py', 'main'), ('/srv/houdini/handlers.py', 'handle')))
+    assert profiler.tags == {'PenguinBot': 1, 'idle': 1, 'houdini': 1}
+    assert profiler.stacks['PenguinBot;bootstrap.py:main;bot_plugin.py:BotPlugin.fan_out;'
+                           'penguin_bot.py:PenguinBot.greet;encoder.py:encode'] == 1
+    assert profiler.summary().startswith('PenguinBot 33.3%')
+
+
+def test_profile_is_written_as_folded_stacks(tmp_path):
+    profiler = SamplingProfiler(interval_ms=1, output_dir=str(tmp_path))
+    profiler.start()
+    deadline = time.monotonic() + 0.2
+    while time.monotonic() < deadline:
+        pass
+    filename = profiler.stop()
+    assert not profiler.running
+    assert os.path.dirname(filename) == str(tmp_path)
+    with open(filename) as f:
+        lines = f.read().splitlines()
+    assert lines and all(line.rsplit(' ', 1)[1].isdigit() for line in lines)
+    assert any('test_profile_is_written_as_folded_stacks' in line for line in lines)
+    assert profiler.stop() is None
@@ -0,0 +1,57 @@
+import hashlib
+import json
+
+import pytest
+
+from houdini.plugins.bot.games import SledRacing
+from houdini.plugins.bot.sled_traces import SledTraceStore, load_literal, write_store
+
+RECORDED_RACES_SHA256 = '453e9a39d657ee98c93acf9e491e5dd0889349c7323d5b7c08822b659293ea37'
+WADDLES = {
+    '100': {
+        'easy': [[{'x': 240, 'y': 366, 'time': 0}, {'x': 250, 'y': 380, 'time': 873}],
+                 [{'x': 241, 'y': 360, 'time': 0}]],
+        'hard': [[{'x': -5, 'y': 1200, 'time': 15000}]],
+    },
+    '103': {'medium': [[{'x': 1, 'y': 2, 'time': 3}, {'x': 4, 'y': 5, 'time': 6}, {'x': 7, 'y': 8, 'time': 9}]]},
+}
+
+
+def test_store_decodes_to_the_original_traces(tmp_path):
+    source = tmp_path / 'races.json'
+    source.write_text(json.dumps(WADDLES))
+    filename = str(tmp_path / 'sled_traces.bin')
+    write_store(filename, load_literal(str(source)))
+    store = SledTraceStore(filename)
+    assert store.difficulties(100) == ['easy', 'hard']
+    for waddle_id, difficulties in WADDLES.items():
+        for difficulty, traces in difficulties.items():
+            assert store.count(int(waddle_id), difficulty) == len(traces)
+            for i, trace in enumerate(traces):
+                assert store.moves(int(waddle_id), difficulty, i) == [(m['x'], m['y'], m['time']) for m in trace]
+
+
+def test_load_literal_from_games_module(tmp_path):
+    source = tmp_path / 'games.py'
+    source.write_text(f'class SledRacing:\n    waddles = {WADDLES!r}\n')
+    assert load_literal(str(source)) == WADDLES
+    source.write_text('class SledRacing:\n    pass\n')
+    with pytest.raises(ValueError):
+        load_literal(str(source))
+
+
+def test_store_rejects_other_files(tmp_path):
+    filename = tmp_path / 'sled_traces.bin'
+    filename.write_bytes(b'\0' * 64)
+    with pytest.raises(ValueError):
+        SledTraceStore(str(filename)).difficulties(100)
+
+
+def test_bundled_store_matches_the_recorded_races():
+    store = SledRacing.traces
+    decoded = [(waddle_id, difficulty, store.moves(waddle_id, difficulty, i))
+               for waddle_id, difficulties in store.index.items() for difficulty in difficulties
+               for i in range(store.count(waddle_id, difficulty))]
+    assert len(decoded) == 17
+    # Digest of the races as decoded from the SledRacing.waddles literal the store was built from
+    assert hashlib.sha256(repr(decoded).encode()).hexdigest() == RECORDED_RACES_SHA256
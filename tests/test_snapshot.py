@@ -0,0 +1,49 @@
+import asyncio
+
+import pytest
+
+from houdini.plugins.bot.snapshot import BotState, WorldSnapshot, read_snapshot, write_snapshot
+from sim.clock import run_virtual
+from sim.world import SimulatedWorld
+
+
+
+
+def test_snapshot_round_trip(tmp_path):
+    snapshot = WorldSnapshot(1700000000.5, (
+        BotState(101, 100, 0, 380, -20, 18, False, False, (4, 413, None, 0, 221, None, 352, None, 9000)),
+        BotState(102, 2001, 102, 10, 20, 24, True, True, (None,) * 9),
+    ), 42.5, 600.0)
+    filename = tmp_path / 'bots.snapshot'
+    write_snapshot(str(filename), snapshot)
+    assert read_snapshot(str(filename)) == snapshot
+
+
+def test_snapshot_rejects_truncated_file(tmp_path):
+    filename = tmp_path / 'bots.snapshot'
+    write_snapshot(str(filename), WorldSnapshot(1.0, (BotState(1, 100, 0, 0, 0, 18, False, False, (None,) * 9),)))
+    filename.write_bytes(filename.read_bytes()[:-1])
+    with pytest.raises(ValueError):
+        read_snapshot(str(filename))
+
+
+def test_bots_come_back_where_they_were(tmp_path):
+    plugin_config = {'bot_population': 5, 'bot_rotation': False, 'config_reload_interval': 0,
+                     'bot_snapshot': {'file': str(tmp_path / 'bots.snapshot')}}
+    still = {'enable_random_movement': False, 'enable_room_spots': False, 'enable_random_room_movement': False}
+
+    async def main():
+        world = SimulatedWorld(plugin_config, bot_accounts=5, seed=1)
+        plugin = await world.start()
+        await asyncio.sleep(30)
+        plugin.save_snapshot()
+        saved = {x.id: (x.room.id, x.x, x.y, x.color) for x in plugin.bots}
+        await world.stop()
+
+        # The restored bots stand still, so they are checked where the snapshot put them
+        world = SimulatedWorld({**plugin_config, **still}, bot_accounts=5, seed=2)
+        plugin = await world.start()
+        assert {x.id: (x.room.id, x.x, x.y, x.color) for x in plugin.bots} == saved
+        await world.stop()
+
+    run_virtual(main())
@@ -0,0 +1,21 @@
+import asyncio
+from collections import Counter
+
+from sim.clock import run_virtual
+from sim.world import SimulatedWorld
+
+
+def test_rotation_waits_for_the_ramp():
+    async def main():
+        world = SimulatedWorld({'bot_population': 40, 'startup_ramp_seconds': 600, 'bot_lease_ttl': 30,
+                                'config_reload_interval': 0}, bot_accounts=60, seed=5)
+        plugin = await world.start()
+        await asyncio.sleep(300)
+        await plugin.control_rotate(5)
+        await asyncio.sleep(400)
+        assert plugin.ramp_task.done()
+        assert len(plugin.bots) == 40
+        assert [x for x, n in Counter(x.id for x in plugin.bots).items() if n > 1] == []
+        await world.stop()
+
+    run_virtual(main())
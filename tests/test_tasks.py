@@ -0,0 +1,45 @@
+import asyncio
+import logging
+
+from houdini.plugins.bot.tasks import TaskRegistry
+from sim.clock import run_virtual
+
+
+def test_supervised_task_restarts_with_backoff():
+    async def main():
+        restarts, runs = [], []
+        tasks = TaskRegistry(logging.getLogger('test'), on_restart=restarts.append, initial_backoff=5)
+
+        async def flaky():
+            runs.append(asyncio.get_running_loop().time())
+            if len(runs) < 3:
+                raise RuntimeError('boom')
+            return 'done'
+
+        started = asyncio.get_running_loop().time()
+        assert await tasks.spawn(flaky, restart=True) == 'done'
+        assert [round(x - started) for x in runs] == [0, 5, 15]
+        assert restarts == ['flaky', 'flaky']
+        assert not tasks.tasks
+
+    run_virtual(main())
+
+
+def test_cancel_bot_only_cancels_that_bots_tasks():
+    async def main():
+        tasks = TaskRegistry(logging.getLogger('test'))
+        first = tasks.spawn(asyncio.sleep, 60, kind='play_game', bot_id=1)
+        second = tasks.spawn(asyncio.sleep, 60, kind='play_game', bot_id=2)
+        tasks.spawn(asyncio.sleep, 60, kind='bot_rotation')
+        assert tasks.counts() == {'play_game': 2, 'bot_rotation': 1}
+        tasks.cancel_bot(1)
+        await asyncio.wait([first])
+        await asyncio.sleep(0)
+        assert first.cancelled() and not second.done()
+        assert tasks.counts() == {'play_game': 1, 'bot_rotation': 1}
+        tasks.cancel_all()
+        await asyncio.wait(list(tasks.tasks))
+        await asyncio.sleep(0)
+        assert not tasks.tasks
+
+    run_virtual(main())
@@ -0,0 +1,50 @@
+from houdini.plugins.bot import tracer as tracer_module
+from houdini.plugins.bot.tracer import ACTION_CODES, ActionTracer, analyze, read_records
+
+
+def test_trace_records_round_trip(tmp_path):
+    filename = str(tmp_path / 'bot_actions.trace')
+    tracer = ActionTracer(filename, capacity=4, keep=0)
+    for i in range(6):
+        tracer.record(100 + i, 200, ACTION_CODES['sp'], i, -i, 7)
+    tracer.close()
+    records = read_records(filename)
+    # Records wrap around the capacity, the oldest ones are overwritten
+    assert [x[1:] for x in records] == [(100 + i, 200, ACTION_CODES['sp'], i, -i, 7) for i in range(2, 6)]
+
+
+def test_same_tick_records_keep_write_order_after_wrap(tmp_path, monkeypatch):
+    monkeypatch.setattr(tracer_module, '_now', lambda: 1000.0)
+    filename = str(tmp_path / 'bot_actions.trace')
+    tracer = ActionTracer(filename, capacity=4, keep=0)
+    for i in range(7):
+        tracer.record(200 - i, 200, ACTION_CODES['sp'])
+    tracer.close()
+    assert [x[1] for x in read_records(filename)] == [197, 196, 195, 194]
+
+
+def test_record_packet_zeroes_non_integer_arguments(tmp_path):
+    filename = str(tmp_path / 'bot_actions.trace')
+    tracer = ActionTracer(filename, capacity=4, keep=0)
+    tracer.record_packet(100, 200, ACTION_CODES['sp'], ('sp', 100, 330, 240))
+    tracer.record_packet(100, 200, ACTION_CODES['sb'], ('sb', 100, 'x', 2.5))
+    tracer.close()
+    assert [x[1:] for x in read_records(filename)] == [
+        (100, 200, ACTION_CODES['sp'], 330, 240, 0),
+        (100, 200, ACTION_CODES['sb'], 0, 0, 0),
+    ]
+
+
+def test_analyze_reaction_latency_and_rates():
+    records = [
+        (0.0, 0, 100, ACTION_CODES['human_join_room'], 0, 0, 0),
+        (0.5, 1, 100, ACTION_CODES['sp'], 0, 0, 0),
+        (1.0, 1, 100, ACTION_CODES['rotate_in'], 0, 0, 0),
+        (2.0, 2, 200, ACTION_CODES['sp'], 0, 0, 0),
+    ]
+    result = analyze(records)
+    assert result['records'] == 4
+    assert result['room_rates'][100]['sp'] == 0.5
+    assert result['reaction_latency']['human_join_room']['count'] == 1
+    assert result['reaction_latency']['human_join_room']['p50'] == 0.5
+    assert result['rotation_churn_per_hour'] == {'rotate_in': 1800.0}
@@ -0,0 +1,80 @@
+import asyncio
+import random
+from types import SimpleNamespace
+
+from houdini.plugins.bot.availability import BotAvailability
+from sim.clock import run_virtual
+from sim.world import SLED_ROOM_ID, SimulatedWorld
+
+
+def test_availability_swap_remove_keeps_positions():
+    availability = BotAvailability()
+    bots = [SimpleNamespace(id=x) for x in range(5)]
+    for bot in bots:
+        availability.add(bot)
+    availability.set_busy(bots[1], 'follow')
+    availability.remove(bots[3])
+    assert sorted(x.id for x in availability.idle) == [0, 2, 4]
+    assert all(availability.idle[i].id == bot_id for bot_id, i in availability.positions.items())
+
+    availability.set_busy(bots[1], 'follow', False)
+    assert bots[1] in availability
+    availability.set_busy(bots[1], 'spot')
+    availability.set_busy(bots[1], 'game')
+    availability.set_busy(bots[1], 'spot', False)
+    assert bots[1] not in availability
+
+
+def test_availability_reserve():
+    availability = BotAvailability()
+    bots = [SimpleNamespace(id=x) for x in range(4)]
+    for bot in bots:
+        availability.add(bot)
+    assert availability.reserve(5, random.Random(1), 'game') is None
+    reserved = availability.reserve(3, random.Random(1), 'game')
+    assert len({x.id for x in reserved}) == 3
+    assert len(availability) == 1
+
+
+
+def waddle_world():
+    return SimulatedWorld({'bot_population': 10, 'bot_rotation': False, 'enable_room_spots': False,
+                           'enable_follow_mode': False, 'waddle_join_delay': 10, 'config_reload_interval': 0},
+                          bot_accounts=10, seed=4)
+
+
+def test_second_human_shares_the_reserved_seats():
+    async def main():
+        world = waddle_world()
+        plugin = await world.start()
+        first, second = await world.add_human(), await world.add_human()
+        await world.human_join_waddle(first, 100)
+        await asyncio.sleep(3)
+        await world.human_join_waddle(second, 100)
+        assert len(plugin.availability) == 7
+        await asyncio.sleep(300)
+        assert world.server.rooms[SLED_ROOM_ID].waddles[100].games_started == 1
+        assert not plugin.waddle_reservations
+        assert len(plugin.availability) == 10
+        await world.stop()
+
+    run_virtual(main())
+
+
+def test_seats_reserved_for_a_penguin_that_left_are_reserved_again():
+    async def main():
+        world = waddle_world()
+        plugin = await world.start()
+        first, second = await world.add_human(), await world.add_human()
+        waddle = world.server.rooms[SLED_ROOM_ID].waddles[100]
+        await world.human_join_waddle(first, 100)
+        await waddle.remove_penguin(first)
+        await world.human_join_waddle(second, 100)
+        assert len(plugin.availability) == 4
+        await asyncio.sleep(300)
+        assert waddle.games_started == 1
+        assert not plugin.waddle_reservations
+        assert len(plugin.availability) == 10
+        await world.stop()
+
+    run_virtual(main())